@@ -1,24 +1,30 @@
 from __future__ import annotations
+import copy
+import filecmp
+import json
+import os
+import shutil
 from typing import Sequence
 from pathlib import Path
 import pandas as pd
 
-from ..data.loaders import find_pairs, label_map_from_dict
+from ..data.meta import WorkbookMeta
 from ..utils.paths import local_path, ensure_dir
-from ..charts.theme import apply_minimal_theme, DEFAULT_PALETTE
+from ..charts.theme import apply_minimal_theme, chart_filename, DEFAULT_PALETTE
 from ..charts.bar import save_column, save_bar
 from ..charts.radar import save_radar
 from ..charts.table import save_partner_group_table
+from ..charts.chart_cache import ChartCache, chart_key, tmp_tag
+from ..charts.sink import active_sink, output_dir
 
 
 def _build_series_for_metrics(
-    db: pd.DataFrame,
-    ddf: pd.DataFrame,
+    meta: WorkbookMeta,
     row_index: int,
     metrics: Sequence[str],
-    avg_pairs: dict[str, str] | None = None,
     *,
     mode: str = "pair",
+    compare_suffix: str = "_átlag",
     labels_override: Sequence[str] | None = None,
 ) -> tuple[list[str], list[float], list[float] | None]:
     """
@@ -26,8 +32,10 @@ def _build_series_for_metrics(
     - mode="pair": csak akkor vesz fel egy metrikát, ha van hozzá átlag pár is az adatbázisban.
     - mode="single": nem használ összehasonlítást.
     - labels_override: ha meg van adva (YAML-ből), akkor azt használja a label-ekhez; egyébként a ddf-ből képzett map alapján dolgozik.
+    - az értékeket a meta vektorizáltan, az összes partnerre egyszerre gyűjti ki (chart-specenként egyszer);
+      itt már csak a partner sorát szeleteljük ki.
     """
-    L = label_map_from_dict(ddf)
+    L = meta.label_map
 
     # Ha a YAML adott labels-t, akkor azt preferáljuk, különben ddf map
     if labels_override is not None:
@@ -40,26 +48,19 @@ def _build_series_for_metrics(
     else:
         lo = [L.get(m, m) for m in metrics]
 
-    labels: list[str] = []
-    s_main: list[float] = []
-    s_comp: list[float] = []
-
-    if mode == "pair":
-        avg_pairs = avg_pairs or {}
-        for base, lab in zip(metrics, lo):
-            # csak akkor vesszük fel, ha a pár oszlop is létezik
-            if base in db.columns and base in avg_pairs and avg_pairs[base] in db.columns:
-                labels.append(lab)
-                s_main.append(db.loc[row_index, base])
-                s_comp.append(db.loc[row_index, avg_pairs[base]])
-        return labels, s_main, s_comp
-    else:
-        # single mód: nincs összehasonlítás
-        for base, lab in zip(metrics, lo):
-            if base in db.columns:
-                labels.append(lab)
-                s_main.append(db.loc[row_index, base])
-        return labels, s_main, None
+    sm = meta.series(metrics, mode=mode, suffix=compare_suffix)
+    s_main, s_comp = sm.row(meta.row_position(row_index))
+    return sm.select_labels(lo), s_main, (s_comp if mode == "pair" else None)
+
+# a chart-típusok alapértelmezett fájlneve (ha a spec nem ad meg 'filename'-et)
+DEFAULT_FILENAMES = {"radar": "radar.png", "column": "column.png", "bar": "bar.png", "table": "table.png"}
+
+def is_partner_scoped(name: str | None) -> bool:
+    """
+    A fájlnév partnerenként más-e. Nem a helyettesítő szövegét keressük, hanem ugyanazzal a formázással (_fmt_filename)
+    két különböző azonosítóra kiértékeljük – így a {partner!s} / {partner_id:>8} alakok is partnerfüggők.
+    """
+    return bool(name) and _fmt_filename(name, "a") != _fmt_filename(name, "b")
 
 def _fmt_filename(name: str, partner_id: str | None) -> str:
     if not name:
@@ -71,7 +72,119 @@ def _fmt_filename(name: str, partner_id: str | None) -> str:
     except KeyError:
         return name
 
-def render_assignment(
+def _cohort_name(
+    meta: WorkbookMeta, row_index: int, spec: dict, mode: str, partner_id: str | None, enabled: bool,
+) -> str | None:
+    """
+    Kohorsz-chart felismerése: ha a chart bemenete (partner + összehasonlító sorozat) több partnernél is pontosan
+    ugyanaz (pl. csak csoportátlagot mutató chart, vagy azonos árbevételi sáv átlagai), a közös fájl alapnevét adja,
+    különben None-t (partnerenkénti render). A sorozat-mátrix chart-specenként egyszer, vektorizáltan csoportosít.
+    """
+    name = spec.get("filename") or ""
+    if not enabled or partner_id is None or not is_partner_scoped(name):
+        return None  # partner-független fájlnév: eddig is egyetlen közös fájl volt
+    sm = meta.series(spec["metrics"], mode=mode, suffix=spec.get("compare_suffix", "_átlag"))
+    if not len(sm) and mode == "pair":
+        sm = meta.series(spec["metrics"], mode="single")  # ugyanaz a fallback, mint a renderelésnél
+    if not len(sm) or sm.cohort_size(meta.row_position(row_index)) < 2:
+        return None
+    return chart_filename(_fmt_filename(name, "cohort"), spec.get("format"))
+
+def _render(chart_cache: ChartCache | None, fn, target: Path, params: dict) -> Path:
+    if chart_cache is None:
+        return Path(fn(**params))
+    return chart_cache.render(fn, target, **params)
+
+def _link(shared: Path, target: Path) -> None:
+    """A partner fájlneve hardlink a közös kohorsz-fájlra (ha a fájlrendszer nem engedi: másolat)."""
+    try:
+        if os.path.samefile(shared, target):
+            return
+    except OSError:
+        pass
+    tmp = target.with_name(f".{target.name}.{tmp_tag()}.lnk")
+    tmp.unlink(missing_ok=True)
+    try:
+        os.link(shared, tmp)
+    except OSError:
+        shutil.copyfile(shared, tmp)
+    os.replace(tmp, target)
+
+def prune_shared(subdirs: Sequence[str] = ("charts", "tables"), older_than: float | None = None) -> int:
+    """
+    Az elárvult kohorsz-fájlok törlése (assets/<subdir>/shared/): amelyikre már egyetlen partner-fájl sem hivatkozik
+    (egy korábbi futás adataiból / beállításaiból maradt). Hivatkozás = azonos inode; ha a fájlrendszer nem enged
+    hardlinket (_link másolt), az azonos tartalmú partner-fájl is annak számít.
+    older_than: csak az ennél (epoch mp) régebbi közös fájlokat töröljük – egy párhuzamosan futó batch (másik shard)
+    frissen renderelt, még be nem linkelt fájlja így megmarad. Visszaadja a törölt fájlok számát.
+    """
+    removed = 0
+    for subdir in subdirs:
+        out_dir = local_path("output", "assets", subdir)
+        shared_dir = out_dir / "shared"
+        if not shared_dir.is_dir():
+            continue
+        inodes: set[tuple[int, int]] = set()
+        by_size: dict[int, list[Path]] = {}
+        for root, dirs, files in os.walk(out_dir):
+            if Path(root) == out_dir and "shared" in dirs:
+                dirs.remove("shared")
+            for f in files:
+                p = Path(root) / f
+                try:
+                    st = p.stat()
+                except OSError:
+                    continue
+                inodes.add((st.st_dev, st.st_ino))
+                by_size.setdefault(st.st_size, []).append(p)
+        for p in shared_dir.rglob("*"):
+            if p.name.startswith(".") or not p.is_file():
+                continue
+            st = p.stat()
+            if (st.st_dev, st.st_ino) in inodes or (older_than is not None and st.st_mtime >= older_than):
+                continue
+            if any(filecmp.cmp(p, q, shallow=False) for q in by_size.get(st.st_size, ())):
+                continue
+            p.unlink(missing_ok=True)
+            removed += 1
+    return removed
+
+def _save(chart_cache: ChartCache | None, fn, subdir: str, shared_as: str | None = None, **params) -> Path:
+    """
+    save_* hívás; chart cache-sel csak akkor renderel, ha a chart bemenetei változtak.
+    shared_as: kohorsz-chart (_cohort_name) – egyszer rendereljük a <subdir>/shared/ mappába, a partner fájlneve
+    pedig csak hivatkozás rá, így a riport változatlan útvonalon találja.
+    Aktív memória-sinknél (msr.charts.sink) ugyanez a sinkben történik: a kohorsz-chart egyszer renderelődik,
+    a partner útvonala ugyanarra a bájt-objektumra mutat.
+    """
+    # a save_* függvények a local/output/assets/<subdir>/<filename> helyre írnak
+    out_dir = local_path("output", "assets", subdir)
+    target = out_dir / params["filename"]
+    sink = active_sink()
+    if sink is not None:
+        if shared_as is None:
+            return _render(chart_cache, fn, target, params)
+        stem, suffix = os.path.splitext(shared_as)
+        shared_name = f"shared/{stem}-{chart_key(fn.__name__, params)[:16]}{suffix}"
+        if out_dir / shared_name not in sink:
+            _render(chart_cache, fn, out_dir / shared_name, {**params, "filename": shared_name})
+        return sink.link(out_dir / shared_name, target)
+    if shared_as is None:
+        # a save_figure atomikusan cserél, így egy korábbi kohorsz-hivatkozás (hardlink) közös fájlja érintetlen marad
+        return _render(chart_cache, fn, target, params)
+
+    # a közös fájl neve a chart tartalom-kulcsából jön: ha már létezik, a tartalma garantáltan ugyanez
+    stem, suffix = os.path.splitext(shared_as)
+    shared = ensure_dir(out_dir / "shared") / f"{stem}-{chart_key(fn.__name__, params)[:16]}{suffix}"
+    if not shared.exists():
+        # ideiglenes néven renderelünk, és atomikusan nevezzük át (párhuzamos workerek / szálak is írhatják)
+        tmp_name = f"shared/.{shared.stem}.{tmp_tag()}.tmp{suffix}"
+        produced = _render(chart_cache, fn, out_dir / tmp_name, {**params, "filename": tmp_name})
+        os.replace(produced, shared)
+    _link(shared, target)
+    return target
+
+def _render_aligned(
     *,
     db: pd.DataFrame,
     ddf: pd.DataFrame,
@@ -80,12 +193,17 @@ def render_assignment(
     partner_id: str | None = None,
     out_dir_charts: Path | None = None,
     out_dir_tables: Path | None = None,
-) -> dict[str, list[Path]]:
-    avg_pairs = find_pairs(db, suffix="_átlag")
-    results: dict[str, list[Path]] = {"radar": [], "column": [], "bar": [], "table": []}
+    meta: WorkbookMeta | None = None,
+    chart_cache: ChartCache | None = None,
+    share_cohort_charts: bool = True,
+) -> dict[str, list[Path | None]]:
+    """Mint a render_assignment, de a listák a spec-ekhez igazodnak: a ki nem rajzolható (üres) chart helyén None."""
+    # workbook-szintű metaadat (párok, label map) – batch futásnál kívülről jön és minden partner közösen használja
+    meta = meta if meta is not None else WorkbookMeta(db, ddf)
+    results: dict[str, list[Path | None]] = {"radar": [], "column": [], "bar": [], "table": []}
     out_dir_charts = out_dir_charts or local_path("output", "assets", "charts")
     out_dir_tables = out_dir_tables or local_path("output", "assets", "tables")
-    ensure_dir(out_dir_charts); ensure_dir(out_dir_tables)
+    output_dir(out_dir_charts); output_dir(out_dir_tables)
     apply_minimal_theme()
 
     # RADAR
@@ -97,25 +215,30 @@ def render_assignment(
         if spec.get("main_color"):
             pal["secondary"] = spec["main_color"]
         size_cm = tuple(spec["size_cm"]) if spec.get("size_cm") else None
-        pairs = find_pairs(db, suffix=spec.get("compare_suffix", "_átlag")) if mode == "pair" else None
         labels, s_main, s_comp = _build_series_for_metrics(
-            db, ddf, row_index, spec["metrics"], pairs, mode=mode, labels_override=spec.get("labels")
+            meta, row_index, spec["metrics"], mode=mode,
+            compare_suffix=spec.get("compare_suffix", "_átlag"), labels_override=spec.get("labels")
         )
         # Fallback: ha pair-t kértünk, de nincs egyetlen összepárosítható metrika sem,
         # essünk vissza single módra, hogy legalább a partner értékek kirajzolódjanak.
         if not labels and mode == "pair":
             labels, s_main, s_comp = _build_series_for_metrics(
-                db, ddf, row_index, spec["metrics"], None, mode="single", labels_override=spec.get("labels")
+                meta, row_index, spec["metrics"], mode="single", labels_override=spec.get("labels")
             )
         if not labels:
+            results["radar"].append(None)
             continue
-        p = save_radar(
+        p = _save(chart_cache, save_radar, "charts",
+            _cohort_name(meta, row_index, spec, mode, partner_id, share_cohort_charts),
             labels=labels,
             series_main=s_main,
             series_comp=(s_comp if mode == "pair" else None),
             size_cm=size_cm,
             title=spec.get("title"),
-            filename=_fmt_filename(spec.get("filename", "radar.png"), partner_id),
+            filename=chart_filename(_fmt_filename(spec.get("filename", DEFAULT_FILENAMES["radar"]), partner_id), spec.get("format")),
+            image_format=spec.get("format"),
+            layout=spec.get("layout"),
+            template=bool(spec.get("template")),
             r_range=spec.get("r_range"),
             show_legend=spec.get("show_legend", True),
             legend_below=spec.get("legend_below", True),
@@ -128,31 +251,36 @@ def render_assignment(
     # COLUMN: partner oszlop + csoport overlay vonal
     for spec in assignment.get("column", []):
         mode = "pair" if spec.get("source_type") == "pair" else "single"
-        pairs = find_pairs(db, suffix=spec.get("compare_suffix", "_átlag")) if mode == "pair" else None
         # Per-chart style overrides (palette + size + overlay color)
         pal = {**DEFAULT_PALETTE, **(spec.get("palette") or {})}
         if spec.get("main_color"):
             pal["secondary"] = spec["main_color"]
         size_cm = tuple(spec["size_cm"]) if spec.get("size_cm") else None
         labels, s_main, s_comp = _build_series_for_metrics(
-            db, ddf, row_index, spec["metrics"], pairs, mode=mode, labels_override=spec.get("labels")
+            meta, row_index, spec["metrics"], mode=mode,
+            compare_suffix=spec.get("compare_suffix", "_átlag"), labels_override=spec.get("labels")
         )
         # Fallback: ha pair-t kértünk, de nincs egyetlen összepárosítható metrika sem,
         # essünk vissza single módra, hogy legalább a partner értékek kirajzolódjanak.
         if not labels and mode == "pair":
             labels, s_main, s_comp = _build_series_for_metrics(
-                db, ddf, row_index, spec["metrics"], None, mode="single", labels_override=spec.get("labels")
+                meta, row_index, spec["metrics"], mode="single", labels_override=spec.get("labels")
             )
         if not labels:
+            results["column"].append(None)
             continue
-        p = save_column(
+        p = _save(chart_cache, save_column, "charts",
+            _cohort_name(meta, row_index, spec, mode, partner_id, share_cohort_charts),
             values=s_main,
             labels=labels,  # partner oszlop
             overlay_values=(s_comp if mode == "pair" else None),  # csoport overlay vonal
             title=spec.get("title"),
             annotate=spec.get("annotate", True),
             size_cm=size_cm,
-            filename=_fmt_filename(spec.get("filename", "column.png"), partner_id),
+            filename=chart_filename(_fmt_filename(spec.get("filename", DEFAULT_FILENAMES["column"]), partner_id), spec.get("format")),
+            image_format=spec.get("format"),
+            layout=spec.get("layout"),
+            template=bool(spec.get("template")),
             value_label_color=spec.get("value_label_color"),
             show_x_labels=spec.get("show_x_labels", True),
             x_label_rotation=spec.get("x_label_rotation", 0),
@@ -176,30 +304,35 @@ def render_assignment(
     # BAR: partner oszlop + csoport overlay vonal
     for spec in assignment.get("bar", []):
         mode = "pair" if spec.get("source_type") == "pair" else "single"
-        pairs = find_pairs(db, suffix=spec.get("compare_suffix", "_átlag")) if mode == "pair" else None
         # Per-chart style overrides (palette + size + overlay color)
         pal = {**DEFAULT_PALETTE, **(spec.get("palette") or {})}
         if spec.get("main_color"):
             pal["secondary"] = spec["main_color"]
         size_cm = tuple(spec["size_cm"]) if spec.get("size_cm") else None
         labels, s_main, s_comp = _build_series_for_metrics(
-            db, ddf, row_index, spec["metrics"], pairs, mode=mode, labels_override=spec.get("labels")
+            meta, row_index, spec["metrics"], mode=mode,
+            compare_suffix=spec.get("compare_suffix", "_átlag"), labels_override=spec.get("labels")
         )
         # Fallback: ha pair-t kértünk, de nincs egyetlen összepárosítható metrika sem,
         # essünk vissza single módra, hogy legalább a partner értékek kirajzolódjanak.
         if not labels and mode == "pair":
             labels, s_main, s_comp = _build_series_for_metrics(
-                db, ddf, row_index, spec["metrics"], None, mode="single", labels_override=spec.get("labels")
+                meta, row_index, spec["metrics"], mode="single", labels_override=spec.get("labels")
             )
         if not labels:
+            results["bar"].append(None)
             continue
-        p = save_bar(
+        p = _save(chart_cache, save_bar, "charts",
+            _cohort_name(meta, row_index, spec, mode, partner_id, share_cohort_charts),
             values=s_main,
             labels=labels,  # partner oszlop
             overlay_values=(s_comp if mode == "pair" else None),  # csoport overlay
             title=spec.get("title"),
             annotate=spec.get("annotate", True),
-            filename=_fmt_filename(spec.get("filename", "bar.png"), partner_id),
+            filename=chart_filename(_fmt_filename(spec.get("filename", DEFAULT_FILENAMES["bar"]), partner_id), spec.get("format")),
+            image_format=spec.get("format"),
+            layout=spec.get("layout"),
+            template=bool(spec.get("template")),
 
             # méret és színek
             size_cm=size_cm,
@@ -233,25 +366,28 @@ def render_assignment(
     for spec in assignment.get("table", []):
         # tábláknál alapértelmezetten pair-t várunk; de ha single-t kér, csak a partner értékek jelennek meg és a csoport üresen marad
         mode = "pair" if spec.get("source_type") == "pair" else "single"
-        pairs = find_pairs(db, suffix=spec.get("compare_suffix", "_átlag")) if mode == "pair" else None
         labels, s_main, s_comp = _build_series_for_metrics(
-            db, ddf, row_index, spec["metrics"], pairs, mode=mode, labels_override=spec.get("labels")
+            meta, row_index, spec["metrics"], mode=mode,
+            compare_suffix=spec.get("compare_suffix", "_átlag"), labels_override=spec.get("labels")
         )
         # Fallback: ha pair-t kértünk, de nincs egyetlen összepárosítható metrika sem,
         # essünk vissza single módra, hogy legalább a partner értékek kirajzolódjanak.
         if not labels and mode == "pair":
             labels, s_main, s_comp = _build_series_for_metrics(
-                db, ddf, row_index, spec["metrics"], None, mode="single", labels_override=spec.get("labels")
+                meta, row_index, spec["metrics"], mode="single", labels_override=spec.get("labels")
             )
         if not labels:
+            results["table"].append(None)
             continue
         if s_comp is None:
             s_comp = [None] * len(s_main)
-        p = Path(save_partner_group_table(
+        p = Path(_save(chart_cache, save_partner_group_table, "tables",
+            _cohort_name(meta, row_index, spec, mode, partner_id, share_cohort_charts),
             labels=labels,
             partner_values=s_main,
             group_values=s_comp,
-            filename=_fmt_filename(spec.get("filename", "table.png"), partner_id),
+            filename=chart_filename(_fmt_filename(spec.get("filename", DEFAULT_FILENAMES["table"]), partner_id), spec.get("format")),
+            image_format=spec.get("format"),
             title=spec.get("title"),
             col_widths=spec.get("col_widths", (0.52, 0.24, 0.24)),
             zebra_colors=spec.get("zebra_colors"),
@@ -261,45 +397,173 @@ def render_assignment(
 
     return results
 
-def render_pages_from_yaml(
-    *, db: pd.DataFrame, ddf: pd.DataFrame, row_index: int, config: dict, partner_id: str | None = None,
-) -> dict[str, dict[str, list[Path]]]:
+def render_assignment(
+    *,
+    db: pd.DataFrame,
+    ddf: pd.DataFrame,
+    row_index: int,
+    assignment: dict,
+    partner_id: str | None = None,
+    out_dir_charts: Path | None = None,
+    out_dir_tables: Path | None = None,
+    meta: WorkbookMeta | None = None,
+    chart_cache: ChartCache | None = None,
+    share_cohort_charts: bool = True,
+) -> dict[str, list[Path]]:
+    aligned = _render_aligned(
+        db=db, ddf=ddf, row_index=row_index, assignment=assignment, partner_id=partner_id,
+        out_dir_charts=out_dir_charts, out_dir_tables=out_dir_tables, meta=meta,
+        chart_cache=chart_cache, share_cohort_charts=share_cohort_charts,
+    )
+    return {kind: [p for p in paths if p is not None] for kind, paths in aligned.items()}
+
+_TYPE_ALIASES = {
+    "col": "column",
+    "columns": "column",
+    "column_chart": "column",
+    "barh": "bar",
+    "bars": "bar",
+    "bar_chart": "bar",
+    "radar_chart": "radar",
+    "spider": "radar",
+    "spiderweb": "radar",
+    "tbl": "table",
+    "table_chart": "table",
+}
+
+def _norm_type_name(t: str | None) -> str:
+    t = (t or "").strip().lower()
+    return _TYPE_ALIASES.get(t, t)
+
+def plan_pages(config: dict) -> list[tuple[str, dict[str, list[dict]]]]:
     """
-    YAML séma: { pages: [ { id,title, charts:[{type, metrics, filename, ...}], ... } ] }
+    YAML config → [(page_id, assignment), ...], ahol az assignment a render_assignment bemenete
+    ({radar: [...], column: [...], bar: [...], table: [...]}). A párhuzamos renderelő is ezt használja.
     """
-    def _norm_type_name(t: str | None) -> str:
-        t = (t or "").strip().lower()
-        aliases = {
-            "col": "column",
-            "columns": "column",
-            "column_chart": "column",
-            "barh": "bar",
-            "bars": "bar",
-            "bar_chart": "bar",
-            "radar_chart": "radar",
-            "spider": "radar",
-            "spiderweb": "radar",
-            "tbl": "table",
-            "table_chart": "table",
-        }
-        return aliases.get(t, t)
-
-    apply_minimal_theme()  # Rubik + brand színek + rcParams
     pages = config.get("pages")
+    # globális 'format: svg' / 'layout: fixed' / 'template: true' (a YAML gyökerén) → minden chart örökli,
+    # ha nem ad meg sajátot
+    defaults = {k: config[k] for k in ("format", "layout", "template") if config.get(k)}
     if not pages and "charts" in config:
         # Allow root-level 'charts' as a single page
         pages = [{"id": config.get("id", "page_1"), "charts": config.get("charts", [])}]
     if pages is None:
         pages = []
-    out: dict[str, dict[str, list[Path]]] = {}
+    planned: list[tuple[str, dict[str, list[dict]]]] = []
     for i, page in enumerate(pages):
         page_id = page.get("id") or page.get("title") or f"page_{i+1}"
         adict: dict[str, list[dict]] = {"radar": [], "column": [], "bar": [], "table": []}
         for ch in page.get("charts", []) or []:
             t = _norm_type_name(ch.get("type"))
+            missing = {k: v for k, v in defaults.items() if not ch.get(k)}
+            if missing:
+                ch = {**ch, **missing}
             if t in adict:
                 adict[t].append(ch)
-        out[page_id] = render_assignment(
-            db=db, ddf=ddf, row_index=row_index, assignment=adict, partner_id=partner_id
-        )
-    return out
\ No newline at end of file
+        planned.append((page_id, adict))
+    return planned
+
+def partner_scoped_config(config: dict) -> tuple[dict, list[str]]:
+    """
+    Több partneres (batch) futáshoz: minden chart fájlneve függjön a partnertől, különben a partnerek ugyanazt a
+    local/output/assets/<...>/<filename> fájlt írnák felül (párhuzamos futásnál egyszerre). A {partner} nélküli
+    fájlnevek (és a típus alapértelmezett radar.png / bar.png / ... neve) '_{partner}' utótagot kapnak:
+    radar.png → radar_{partner}.png. Visszaad: (az átírt config másolata, az átírt eredeti fájlnevek).
+    """
+    cfg = copy.deepcopy(config)
+    renamed: list[str] = []
+    charts = [ch for page in cfg.get("pages") or [] for ch in (page or {}).get("charts") or []]
+    charts += list(cfg.get("charts") or [])
+    for ch in charts:
+        if not isinstance(ch, dict):
+            continue
+        kind = _norm_type_name(ch.get("type"))
+        if kind not in DEFAULT_FILENAMES:
+            continue
+        name = ch.get("filename") or DEFAULT_FILENAMES[kind]
+        if is_partner_scoped(name):
+            continue
+        stem, suffix = os.path.splitext(name)
+        ch["filename"] = f"{stem}_{{partner}}{suffix}"
+        renamed.append(name)
+    return cfg, list(dict.fromkeys(renamed))
+
+ChartSpec = tuple[str, dict]                     # (kind, spec)
+PageRefs = list[tuple[str, dict[str, list[int]]]]  # [(page_id, {kind: [egyedi spec indexe, ...]}), ...]
+
+def _spec_key(kind: str, spec: dict) -> str:
+    # normalizált spec: a típus álnevei egységesek, a kulcsok sorrendje nem számít
+    norm = {k: v for k, v in spec.items() if k != "type"}
+    return json.dumps([kind, norm], sort_keys=True, ensure_ascii=False, default=repr)
+
+def plan_run(config: dict) -> tuple[list[ChartSpec], PageRefs]:
+    """
+    Futásonkénti terv: az oldalakon ismétlődő, azonos chart spec-eket (típus, metrikák, fájlnév, stílus) egyszer
+    vesszük fel. Visszaad: (egyedi [(kind, spec), ...], oldalanként a hivatkozott egyedi spec-ek indexei).
+    """
+    specs: list[ChartSpec] = []
+    seen: dict[str, int] = {}
+    refs: PageRefs = []
+    for page_id, adict in plan_pages(config):
+        page_refs: dict[str, list[int]] = {}
+        for kind, kind_specs in adict.items():
+            idxs = page_refs.setdefault(kind, [])
+            for spec in kind_specs:
+                key = _spec_key(kind, spec)
+                if key not in seen:
+                    seen[key] = len(specs)
+                    specs.append((kind, spec))
+                idxs.append(seen[key])
+        refs.append((page_id, page_refs))
+    return specs, refs
+
+def render_specs(
+    *, db: pd.DataFrame, ddf: pd.DataFrame, row_index: int, specs: Sequence[ChartSpec],
+    partner_id: str | None = None,
+    meta: WorkbookMeta | None = None,
+    chart_cache: ChartCache | None = None,
+    share_cohort_charts: bool = True,
+) -> list[Path | None]:
+    """A plan_run egyedi spec-jeinek renderelése egyetlen render_assignment körben; a lista a specs-hez igazodik."""
+    adict: dict[str, list[dict]] = {"radar": [], "column": [], "bar": [], "table": []}
+    slots: list[tuple[str, int]] = []
+    for kind, spec in specs:
+        slots.append((kind, len(adict[kind])))
+        adict[kind].append(spec)
+    aligned = _render_aligned(
+        db=db, ddf=ddf, row_index=row_index, assignment=adict, partner_id=partner_id, meta=meta,
+        chart_cache=chart_cache, share_cohort_charts=share_cohort_charts,
+    )
+    return [aligned[kind][i] for kind, i in slots]
+
+def fan_out(refs: PageRefs, rendered: Sequence[Path | None]) -> dict[str, dict[str, list[Path]]]:
+    """Az egyedi spec-ek eredményei vissza minden oldalra, amely hivatkozik rájuk (YAML sorrendben)."""
+    return {
+        page_id: {kind: [rendered[i] for i in idxs if rendered[i] is not None] for kind, idxs in kinds.items()}
+        for page_id, kinds in refs
+    }
+
+def render_pages_from_yaml(
+    *, db: pd.DataFrame, ddf: pd.DataFrame, row_index: int, config: dict, partner_id: str | None = None,
+    meta: WorkbookMeta | None = None,
+    chart_cache: ChartCache | None = None,
+    share_cohort_charts: bool = True,
+    plan: tuple[list[ChartSpec], PageRefs] | None = None,
+) -> dict[str, dict[str, list[Path]]]:
+    """
+    YAML séma: { pages: [ { id,title, charts:[{type, metrics, filename, ...}], ... } ] }
+    meta: workbook-szintű metaadat; ha nincs megadva, itt építjük fel (egyszer, az összes oldalra).
+    chart_cache: tartalom-címzett cache – a változatlan bemenetű chartokat nem rendereljük újra.
+    share_cohort_charts: a több partnernél azonos bemenetű chartok egyszer renderelődnek (assets/<...>/shared/),
+        a partner fájlneve hardlink a közös fájlra.
+    plan: a plan_run(config) eredménye – batch futásnál egyszer számoljuk, nem partnerenként.
+    """
+    apply_minimal_theme()  # Rubik + brand színek + rcParams
+    meta = meta if meta is not None else WorkbookMeta(db, ddf)
+    # több oldalon szereplő azonos chartot egyszer renderelünk, az eredményt minden oldalra visszaosztjuk
+    specs, refs = plan if plan is not None else plan_run(config)
+    rendered = render_specs(
+        db=db, ddf=ddf, row_index=row_index, specs=specs, partner_id=partner_id, meta=meta,
+        chart_cache=chart_cache, share_cohort_charts=share_cohort_charts,
+    )
+    return fan_out(refs, rendered)
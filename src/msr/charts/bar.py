@@ -2,15 +2,23 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Sequence
 import numpy as np
-import matplotlib.pyplot as plt
 import textwrap
+from matplotlib.axes import Axes
+from matplotlib.lines import Line2D
+from matplotlib.patches import Rectangle
 
-from ..utils.paths import local_path, ensure_dir
-from .theme import DEFAULT_PALETTE, ensure_rubik_font, cm_to_in, DEFAULT_DPI
+from ..utils.paths import local_path
+from .theme import DEFAULT_PALETTE, ensure_rubik_font, new_figure, cm_to_in, DEFAULT_DPI, chart_filename
+from .sink import output_dir, save_figure
+from .layout import (
+    EDGE_PAD_PT, TICK_PAD_PT, bottom_legend_height, check_layout, figure_size_pt, place_legend_bottom, rc_font_size,
+    set_margins, text_size,
+)
+from .template import ChartTemplate, get_template, put_template, template_key
 
+# a sablon módban partnerenként cserélt (adat-)paraméterek – minden más a sablon kulcsába kerül
+TEMPLATE_DATA_PARAMS = ("values", "compare_values", "overlay_values")
 
-# Legyen Rubik a default a bar/column chartoknál is
-ensure_rubik_font()
 
 # ─────────────────────────────────────────────────────────
 # Global default size (cm) for bar/column charts
@@ -23,13 +31,12 @@ def set_default_bar_size(size_cm: tuple[float, float]) -> None:
     DEFAULT_BAR_SIZE_CM = size_cm
 
 def _fig(size_cm: tuple[float, float]):
-    fig, ax = plt.subplots(
-        figsize=(cm_to_in(size_cm[0]), cm_to_in(size_cm[1])),
-        dpi=DEFAULT_DPI,
-    )
-    return fig, ax
+    # Legyen Rubik a default a bar/column chartoknál is (az első rajzoláskor, nem importkor)
+    ensure_rubik_font()
+    # Figure + Agg canvas pyplot nélkül → szálból is hívható (lásd theme.new_figure)
+    return new_figure((cm_to_in(size_cm[0]), cm_to_in(size_cm[1])), DEFAULT_DPI)
 
-def _hide_all_axes(ax: plt.Axes) -> None:
+def _hide_all_axes(ax: Axes) -> None:
     """No grid, no spines, no ticks, no tick-labels – completely frameless."""
     ax.grid(False)
     for spine in ax.spines.values():
@@ -39,6 +46,21 @@ def _hide_all_axes(ax: plt.Axes) -> None:
                    labelbottom=False, labelleft=False)
     ax.set_axisbelow(False)
 
+def _chart_path(filename: str, image_format: str | None) -> Path:
+    out_dir = local_path("output", "assets", "charts")
+    output_dir(out_dir)
+    return out_dir / chart_filename(filename, image_format)
+
+def _template_hit(kind: str, params: dict) -> tuple[str, Path | None]:
+    """Sablon mód: (kulcs, kimenet) – a kimenet None, ha még nincs sablon (ilyenkor a hívó épít és eltárol)."""
+    ensure_rubik_font()  # a kulcsban az rcParams is benne van → előbb a font
+    key = template_key(kind, params, TEMPLATE_DATA_PARAMS)
+    tpl = get_template(key)
+    if tpl is None:
+        return key, None
+    tpl.update(*(params[k] for k in TEMPLATE_DATA_PARAMS))
+    return key, tpl.finish(_chart_path(params["filename"], params["image_format"]))
+
 def save_column(
     values: Sequence[float],
     labels: Sequence[str],
@@ -81,9 +103,15 @@ def save_column(
     legend_below: bool = False,
     legend_pad: float = 0.14,
     legend_ncol: int = 2,
+    image_format: str | None = None,
+    layout: str | None = None,
+    template: bool = False,
 ) -> Path:
     """
     Függőleges oszlopdiagram (column).
+    image_format: "png" | "svg" (None → a fájlnév kiterjesztése dönt)
+    layout: "tight" (alap) | "fixed" – fix módban a margók a font-metrikákból jönnek, egyetlen rajzolás (charts.layout)
+    template: True → ugyanerre a specre a figure-t újrahasznosítjuk, csak az adatokat cseréljük (charts.template)
 
     ÚJ:
       - x_label_wrap: több soros (tördelt) X-feliratok
@@ -91,8 +119,13 @@ def save_column(
       - bar_spacing: nagyobb hézag az oszlopcsoportok között
       - bar_width / group_bar_width: oszlop-szélesség kézi állítása
     """
+    if template:
+        tpl_key, hit = _template_hit("save_column", locals())
+        if hit is not None:
+            return hit
     pal = {**DEFAULT_PALETTE, **(palette or {})}
     sec = pal["secondary"]; mut = pal["muted"]; txt = pal["text"]
+    layout = check_layout(layout)
 
     # Fallback formats if the caller passed None via YAML
     if not value_label_fmt:
@@ -115,6 +148,7 @@ def save_column(
 
     default_single_width = 0.7
     default_group_width = 0.36
+    value_texts: list = []  # az oszlopok közepén álló értékfeliratok (sablon módban ezeket frissítjük)
 
     if compare_values is None:
         width = bar_width if bar_width is not None else default_single_width
@@ -124,18 +158,18 @@ def save_column(
 
         bars = ax.bar(x, values, width=width, color=colors, label=main_label)
         # Legend proxy for main series (bar patch) – enforced order
-        main_handle = plt.Rectangle((0, 0), 1, 1, facecolor=sec, edgecolor="none")
+        main_handle = Rectangle((0, 0), 1, 1, facecolor=sec, edgecolor="none")
         legend_handles.append(main_handle); legend_labels.append(main_label)
 
         if annotate:
             for rect, val in zip(bars, values):
                 # érték az oszlop KÖZEPÉN
-                ax.text(rect.get_x() + rect.get_width()/2.0,
+                value_texts.append(ax.text(rect.get_x() + rect.get_width()/2.0,
                         rect.get_height()/2.0,
                         value_label_fmt.format(val=val),
                         ha="center", va="center", fontsize=8,
                         color=(value_label_color or txt)
-                        )
+                        ))
     else:
         width = group_bar_width if group_bar_width is not None else default_group_width
         vals = np.array(values, dtype=float)
@@ -144,8 +178,8 @@ def save_column(
         bars_main = ax.bar(x - width/2.0, vals, width=width, color=sec, label=main_label)
         bars_comp = ax.bar(x + width/2.0, comp, width=width, color=mut, label=comp_label)
         # Legend proxies for side-by-side bars — order: main then comp
-        main_handle = plt.Rectangle((0, 0), 1, 1, facecolor=sec, edgecolor="none")
-        comp_handle = plt.Rectangle((0, 0), 1, 1, facecolor=mut, edgecolor="none")
+        main_handle = Rectangle((0, 0), 1, 1, facecolor=sec, edgecolor="none")
+        comp_handle = Rectangle((0, 0), 1, 1, facecolor=mut, edgecolor="none")
         legend_handles.extend([main_handle, comp_handle]); legend_labels.extend([main_label, comp_label])
 
         if highlight_index is not None and 0 <= highlight_index < len(vals):
@@ -153,43 +187,48 @@ def save_column(
 
         if annotate:
             for rect, val in zip(bars_main, vals):
-                ax.text(rect.get_x() + rect.get_width()/2.0,
+                value_texts.append(ax.text(rect.get_x() + rect.get_width()/2.0,
                         rect.get_height()/2.0,
                         value_label_fmt.format(val=val),
                         ha="center", va="center", fontsize=8,
                         color=(value_label_color or txt)
-                        )
+                        ))
             for rect, val in zip(bars_comp, comp):
-                ax.text(rect.get_x() + rect.get_width()/2.0,
+                value_texts.append(ax.text(rect.get_x() + rect.get_width()/2.0,
                         rect.get_height()/2.0,
                         value_label_fmt.format(val=val),
                         ha="center", va="center", fontsize=8,
                         color=(value_label_color or txt)
-                        )
+                        ))
 
     # Overlay vízszintes vonalak (pl. partner érték)
-    if overlay_values is not None:
-        line_color = overlay_line_color or txt
+    overlay_artists: list = []
+
+    def _draw_overlay(overlay_values) -> None:
         target_bars = (bars_main if compare_values is not None else bars)
         for rect, y in zip(target_bars, overlay_values):
             bw = rect.get_width()
             x0 = rect.get_x() - bw * overlay_line_pad_frac
             x1 = rect.get_x() + bw * (1.0 + overlay_line_pad_frac)
-            ax.hlines(y, x0, x1, color=line_color, linewidth=overlay_line_width, zorder=5)
+            overlay_artists.append(ax.hlines(y, x0, x1, color=line_color, linewidth=overlay_line_width, zorder=5))
 
             # ← ÚJ: data label a vonal BAL oldalán, fix (pont) eltolással
             if overlay_value_labels:
-                ax.annotate(
+                overlay_artists.append(ax.annotate(
                     overlay_value_label_fmt.format(y=y),
                     xy=(x0, y),
                     xytext=(-overlay_value_label_offset_pts, 0),
                     textcoords="offset points",
                     ha="right", va="center",
                     fontsize=8, color=(value_label_color or line_color), zorder=6,
-                )
+                ))
+
+    if overlay_values is not None:
+        line_color = overlay_line_color or txt
+        _draw_overlay(overlay_values)
 
         # Legend proxy for overlay line — appended after main, so order stays consistent
-        overlay_handle = plt.Line2D([0], [0], color=line_color, linewidth=overlay_line_width)
+        overlay_handle = Line2D([0], [0], color=line_color, linewidth=overlay_line_width)
         legend_handles.append(overlay_handle); legend_labels.append(overlay_label)
 
     # LEGEND (explicit order using proxies)
@@ -209,6 +248,7 @@ def save_column(
             leg = ax.legend(legend_handles, legend_labels, frameon=legend_frame, loc=legend_loc, fontsize=8)
 
     # X-feliratok: tördelés + ritkítás
+    tick_texts: list[str] = []
     if show_x_labels:
         if x_label_wrap and x_label_wrap > 0:
             proc_labels = [textwrap.fill(str(lbl), width=int(x_label_wrap)) for lbl in labels]
@@ -217,10 +257,11 @@ def save_column(
 
         if show_every_nth_label > 1:
             sel_idx = np.arange(0, len(x), int(show_every_nth_label), dtype=int)
+            tick_texts = [proc_labels[i] for i in sel_idx]
             ax.set_xticks(x[sel_idx])
-            ax.set_xticklabels([proc_labels[i] for i in sel_idx],
-                               rotation=x_label_rotation, fontsize=x_label_fontsize)
+            ax.set_xticklabels(tick_texts, rotation=x_label_rotation, fontsize=x_label_fontsize)
         else:
+            tick_texts = proc_labels
             ax.set_xticks(x)
             ax.set_xticklabels(proc_labels, rotation=x_label_rotation, fontsize=x_label_fontsize)
     else:
@@ -251,16 +292,69 @@ def save_column(
     if x_margin and x_margin > 0:
         ax.margins(x=float(x_margin))
 
-    out_dir = local_path("output", "assets", "charts")
-    ensure_dir(out_dir)
-
-    out_path = out_dir / filename
-
-    fig.tight_layout()
-    extra_artists = [leg] if (show_legend and leg is not None) else []
-    fig.savefig(out_path, bbox_inches="tight", bbox_extra_artists=extra_artists)
-    plt.close(fig)
-    return out_path
+    out_path = _chart_path(filename, image_format)
+    # a layout kiinduló állapota: sablon módban minden újrafelhasználás innen számolja újra a margókat
+    subplotpars = vars(fig.subplotpars).copy()
+
+    def _finish(out_path: Path) -> Path:
+        if layout == "fixed":
+            # fix layout: margók a font-metrikákból, tight_layout és tight bbox nélkül → egyetlen rajzolás
+            top = bottom = EDGE_PAD_PT
+            side_l = side_r = 0.0
+            if title:
+                title_size = title_fontsize if title_fontsize is not None else rc_font_size("axes.titlesize")
+                top += text_size(title, title_size, weight="bold")[1] + 6.0
+            if tick_texts:
+                tick_sizes = [text_size(t, x_label_fontsize, rotation=x_label_rotation) for t in tick_texts]
+                bottom += max(h for _, h in tick_sizes) + TICK_PAD_PT
+                # a szélső (akár elforgatott) feliratok a tick körül középre állnak → félszélességnyi hely kell
+                side_l, side_r = tick_sizes[0][0] / 2.0, tick_sizes[-1][0] / 2.0
+            if overlay_values is not None and overlay_value_labels and len(overlay_values):
+                # az overlay érték a vonal BAL oldalán áll → az első oszlop előtt hely kell neki
+                side_l = max(side_l, overlay_value_label_offset_pts + max(
+                    text_size(overlay_value_label_fmt.format(y=v), 8)[0] for v in overlay_values
+                ))
+            left, right = EDGE_PAD_PT + side_l, EDGE_PAD_PT + side_r
+            if leg is not None and legend_below:
+                place_legend_bottom(fig, leg)
+                bottom += bottom_legend_height(legend_labels, 8, legend_ncol)
+            set_margins(fig, left=left, right=right, top=top, bottom=bottom)
+            save_figure(fig, out_path)
+            return out_path
+
+        fig.tight_layout()
+        extra_artists = [leg] if (show_legend and leg is not None) else []
+        save_figure(fig, out_path, bbox_inches="tight", bbox_extra_artists=extra_artists)
+        return out_path
+
+    if template:
+        def _update(new_values, new_compare, new_overlay) -> None:
+            nonlocal overlay_values
+            if compare_values is None:
+                series = [(bars, list(new_values))]
+            else:
+                series = [(bars_main, np.array(new_values, dtype=float)),
+                          (bars_comp, np.array(new_compare, dtype=float))]
+            texts = iter(value_texts)
+            for bar_set, vals_ in series:
+                for rect, val, h in zip(bar_set, vals_, np.asarray(vals_, dtype=float)):
+                    rect.set_height(h)
+                    if annotate:
+                        t = next(texts)
+                        t.set_y(rect.get_height()/2.0)
+                        t.set_text(value_label_fmt.format(val=val))
+            for artist in overlay_artists:
+                artist.remove()
+            overlay_artists.clear()
+            ax.relim()
+            overlay_values = new_overlay
+            if overlay_values is not None:
+                _draw_overlay(overlay_values)
+            ax.autoscale_view()
+            fig.subplots_adjust(**subplotpars)
+
+        put_template(tpl_key, ChartTemplate(fig, _update, _finish))
+    return _finish(out_path)
 
 def save_bar(
         values: Sequence[float],
@@ -309,6 +403,9 @@ def save_bar(
         group_title_fontsize: float = 8.0,  # csoportcím betűméret
         group_title_wrap: int | None = None,  # opcionális: csoportcím tördelése (max karakter/sor, csak szóköznél)
         group_colors: dict[str, str] | None = None,  # opcionális: csoportonként más rúd-szín (fő sorozatra)
+        image_format: str | None = None,  # "png" | "svg" (None → a fájlnév kiterjesztése dönt)
+        layout: str | None = None,  # "tight" (alap) | "fixed": margók a font-metrikákból, egyetlen rajzolás
+        template: bool = False,  # True → ugyanarra a specre a figure újrahasznosítása, csak adatcsere (charts.template)
 ) -> Path:
     """
     Vízszintes 'bar' diagram (barh).
@@ -317,9 +414,15 @@ def save_bar(
       - Kiemelés: highlight_index → text szín
       - Tengelyek/tickek/spine-ok: nincsenek
       - Kétszintű Y: csoportcímek opcionális tördelése (group_title_wrap, csak szóköznél)
+      - layout="fixed": a csoportcímek, szeparátorok, cím és legend helye renderer nélkül, előre számolva
     """
+    if template:
+        tpl_key, hit = _template_hit("save_bar", locals())
+        if hit is not None:
+            return hit
     pal = {**DEFAULT_PALETTE, **(palette or {})}
     sec = pal["secondary"]; mut = pal["muted"]; txt = pal["text"]
+    layout = check_layout(layout)
 
     # Fallback formats if the caller passed None via YAML
     if not value_label_fmt:
@@ -338,6 +441,7 @@ def save_bar(
     sep_specs: list = []  # (title_text_artist, ysep) párok – a vonalakat később, a rendererrel rajzoljuk
     reserved_left = None
     y = np.arange(len(labels))
+    value_texts: list = []  # a rudak közepén álló értékfeliratok (sablon módban ezeket frissítjük)
 
     if compare_values is None:
         height = 0.7
@@ -347,15 +451,15 @@ def save_bar(
 
         bars = ax.barh(y, values, height=height, color=colors, label=main_label)
         # Legend proxy for main series (bar patch)
-        main_handle = plt.Rectangle((0, 0), 1, 1, facecolor=sec, edgecolor="none")
+        main_handle = Rectangle((0, 0), 1, 1, facecolor=sec, edgecolor="none")
         legend_handles.append(main_handle); legend_labels.append(main_label)
 
         if annotate:
             for rect, val in zip(bars, values):
                 ymid = rect.get_y() + rect.get_height() / 2.0
                 xmid = rect.get_x() + rect.get_width() / 2.0
-                ax.text(xmid, ymid, value_label_fmt.format(val=val), va="center", ha="center", fontsize=8,
-                        color = (value_label_color or txt))
+                value_texts.append(ax.text(xmid, ymid, value_label_fmt.format(val=val), va="center", ha="center",
+                                           fontsize=8, color = (value_label_color or txt)))
     else:
         height = 0.36
         vals = np.array(values, dtype=float)
@@ -364,8 +468,8 @@ def save_bar(
         bars_main = ax.barh(y - height/2.0, vals, height=height, color=sec, label=main_label)
         bars_comp = ax.barh(y + height/2.0, comp, height=height, color=mut, label=comp_label)
         # Legend proxies for side-by-side bars — order: main then comp
-        main_handle = plt.Rectangle((0, 0), 1, 1, facecolor=sec, edgecolor="none")
-        comp_handle = plt.Rectangle((0, 0), 1, 1, facecolor=mut, edgecolor="none")
+        main_handle = Rectangle((0, 0), 1, 1, facecolor=sec, edgecolor="none")
+        comp_handle = Rectangle((0, 0), 1, 1, facecolor=mut, edgecolor="none")
         legend_handles.extend([main_handle, comp_handle]); legend_labels.extend([main_label, comp_label])
 
         if highlight_index is not None and 0 <= highlight_index < len(vals):
@@ -376,17 +480,18 @@ def save_bar(
                 ymid = rect.get_y() + rect.get_height() / 2.0
                 xmid = rect.get_x() + rect.get_width() / 2.0
                 text_color = value_label_color or txt
-                ax.text(xmid, ymid, value_label_fmt.format(val=val), va="center", ha="center", fontsize=8,
-                        color = text_color)
+                value_texts.append(ax.text(xmid, ymid, value_label_fmt.format(val=val), va="center", ha="center",
+                                           fontsize=8, color = text_color))
             for rect, val in zip(bars_comp, comp):
                 ymid = rect.get_y() + rect.get_height() / 2.0
                 xmid = rect.get_x() + rect.get_width() / 2.0
-                ax.text(xmid, ymid, value_label_fmt.format(val=val), va="center", ha="center", fontsize=8,
-                        color = (value_label_color or txt))
+                value_texts.append(ax.text(xmid, ymid, value_label_fmt.format(val=val), va="center", ha="center",
+                                           fontsize=8, color = (value_label_color or txt)))
 
     # Optional overlay vertical lines (e.g., group averages)
-    if overlay_values is not None:
-        line_color = overlay_line_color or txt
+    overlay_artists: list = []
+
+    def _draw_overlay(overlay_values) -> None:
         # pick the bar collection: main bars if compare, else the only bars
         target_bars = (bars_main if compare_values is not None else bars)
         for rect, xval in zip(target_bars, overlay_values):
@@ -394,11 +499,11 @@ def save_bar(
             # a vonal a sávnál egy kicsit hosszabb legyen
             y0 = rect.get_y() - bh * overlay_line_pad_frac
             y1 = rect.get_y() + bh * (1.0 + overlay_line_pad_frac)
-            ax.vlines(xval, y0, y1, color=line_color, linewidth=overlay_line_width, zorder=5)
+            overlay_artists.append(ax.vlines(xval, y0, y1, color=line_color, linewidth=overlay_line_width, zorder=5))
 
             # LABEL: a vonal fölé
             if overlay_value_labels:
-                ax.text(
+                overlay_artists.append(ax.text(
                     xval,
                     y1 + bh * overlay_label_dy_frac,  # picit fölé
                     overlay_value_label_fmt.format(x=xval),
@@ -407,10 +512,14 @@ def save_bar(
                     fontsize=8,
                     color=(value_label_color or line_color),
                     zorder=6,
-                )
+                ))
+
+    if overlay_values is not None:
+        line_color = overlay_line_color or txt
+        _draw_overlay(overlay_values)
 
         # Legend proxy for overlay line
-        overlay_handle = plt.Line2D([0], [0], color=line_color, linewidth=overlay_line_width)
+        overlay_handle = Line2D([0], [0], color=line_color, linewidth=overlay_line_width)
         legend_handles.append(overlay_handle); legend_labels.append(overlay_label)
 
     # --- Kétszintű Y: csoportcímek + szeparátorok ---
@@ -493,9 +602,45 @@ def save_bar(
     else:
         _hide_all_axes(ax)
 
-    out_dir = local_path("output", "assets", "charts")
-    ensure_dir(out_dir)
-    out_path = out_dir / filename
+    out_path = _chart_path(filename, image_format)
+
+    def _update(new_values, new_compare, new_overlay) -> None:
+        if compare_values is None:
+            series = [(bars, list(new_values))]
+        else:
+            series = [(bars_main, np.array(new_values, dtype=float)), (bars_comp, np.array(new_compare, dtype=float))]
+        texts = iter(value_texts)
+        for bar_set, vals_ in series:
+            for rect, val, w in zip(bar_set, vals_, np.asarray(vals_, dtype=float)):
+                rect.set_width(w)
+                if annotate:
+                    t = next(texts)
+                    t.set_x(rect.get_x() + rect.get_width() / 2.0)
+                    t.set_text(value_label_fmt.format(val=val))
+        for artist in overlay_artists:
+            artist.remove()
+        overlay_artists.clear()
+        ax.relim()
+        if new_overlay is not None:
+            _draw_overlay(new_overlay)
+        ax.autoscale_view()
+        if layout != "fixed":
+            fig.subplots_adjust(**subplotpars)
+
+    if layout == "fixed":
+        _fixed_bar_layout(
+            fig, ax, labels=(labels if show_y_labels else []), y_label_fontsize=y_label_fontsize,
+            group_titles=extra_artists, group_title_fontsize=group_title_fontsize,
+            group_title_rotation=group_title_rotation, group_title_offset_axes=group_title_offset_axes,
+            sep_specs=sep_specs, sep_color=(group_sep_color or txt),
+            title=title, title_fontsize=title_fontsize,
+            overlay_labels=(overlay_values is not None and overlay_value_labels),
+            legend=legend_handles_labels, legend_frame=legend_frame, legend_ncol=legend_ncol,
+        )
+        if template:
+            put_template(tpl_key, ChartTemplate(fig, _update, lambda path: save_figure(fig, path)))
+        save_figure(fig, out_path)
+        return out_path
 
     # 1) renderer előállítása (bbox számításokhoz)
     try:
@@ -553,7 +698,7 @@ def save_bar(
             # a bal szélt display→axes frakcióra alakítjuk (csak X kell)
             x0_axes = ax.transAxes.inverted().transform((bbox.x0, 0))[0]
             x1_axes = -0.02  # enyhén az y-tengely bal oldalán végződjön
-            sep_line = plt.Line2D([x0_axes, x1_axes], [ysep, ysep],
+            sep_line = Line2D([x0_axes, x1_axes], [ysep, ysep],
                                   transform=ax.get_yaxis_transform(),
                                   color=sep_col, linewidth=0.5, alpha=0.25,
                                   zorder=1, clip_on=False)
@@ -575,15 +720,75 @@ def save_bar(
     import warnings
     tl_rect_left = float(reserved_left) if reserved_left is not None else 0.06
     tl_rect_top = 0.92 if title else 0.98
-    with warnings.catch_warnings():
-        warnings.simplefilter("ignore", category=UserWarning)
-        fig.tight_layout(rect=[tl_rect_left, 0.0, 1.0, tl_rect_top])
+    subplotpars = vars(fig.subplotpars).copy()
 
-    # 6) mentés – az összes extra artisttal (legend, csoportcímek, szeparátorok, cím)
-    fig.savefig(out_path, bbox_inches="tight", bbox_extra_artists=extra)
+    def _finish(out_path: Path) -> Path:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", category=UserWarning)
+            fig.tight_layout(rect=[tl_rect_left, 0.0, 1.0, tl_rect_top])
 
-    plt.close(fig)
-    return out_path
+        # 6) mentés – az összes extra artisttal (legend, csoportcímek, szeparátorok, cím)
+        save_figure(fig, out_path, bbox_inches="tight", bbox_extra_artists=extra)
+        return out_path
+
+    # "best" helyű legendnél a fenti mérések (cím közepe) az adattól függnek → nem sablonosítható
+    if template and not (leg is not None and legend_loc == "best"):
+        put_template(tpl_key, ChartTemplate(fig, _update, _finish))
+    return _finish(out_path)
+
+
+def _fixed_bar_layout(
+    fig, ax, *, labels: Sequence[str], y_label_fontsize: float,
+    group_titles: list, group_title_fontsize: float, group_title_rotation: float, group_title_offset_axes: float,
+    sep_specs: list, sep_color: str, title: str | None, title_fontsize: float | None, overlay_labels: bool,
+    legend: tuple[list, list[str]] | None, legend_frame: bool, legend_ncol: int,
+) -> None:
+    """
+    A save_bar fix layoutja: ugyanazok az elemek, mint tight módban, de a helyüket a font-metrikákból számoljuk
+    (nincs canvas.draw, get_window_extent, tight_layout és tight bbox). A kép pontosan a figure mérete; a cím és
+    az alsó legend a figure közepére igazodik.
+    """
+    fig_w, fig_h = figure_size_pt(fig)
+    left = right = top = bottom = EDGE_PAD_PT
+    if len(labels):
+        left += max(text_size(str(lbl), y_label_fontsize)[0] for lbl in labels) + TICK_PAD_PT
+
+    # csoportcímek: a közepük az axes bal szélétől group_title_offset_axes * axes-szélességre van
+    title_widths = [
+        text_size(t.get_text(), group_title_fontsize, rotation=group_title_rotation)[0] for t in group_titles
+    ]
+    if title_widths:
+        off = max(0.0, -float(group_title_offset_axes))
+        left = max(left, (off * (fig_w - right) + max(title_widths) / 2.0 + EDGE_PAD_PT) / (1.0 + off))
+
+    # a cím fig.text, mint tight módban → alapból a font.size méretével
+    title_size = title_fontsize if title_fontsize is not None else rc_font_size("font.size")
+    if title:
+        top += text_size(title, title_size, weight="bold")[1] + EDGE_PAD_PT
+    if overlay_labels:
+        # a legfelső overlay felirat a rúd fölé lóg
+        top += text_size("0", 8)[1]
+    if legend is not None:
+        bottom += bottom_legend_height(legend[1], 8, legend_ncol)
+    set_margins(fig, left=left, right=right, top=top, bottom=bottom)
+
+    # szeparátorok a csoportcím bal széléig (a szélesség a metrikából, nem a rendererből)
+    ax_w = fig_w * (fig.subplotpars.right - fig.subplotpars.left)
+    widths = dict(zip(map(id, group_titles), title_widths))
+    for title_artist, ysep in sep_specs:
+        x0_axes = title_artist.get_position()[0] - widths[id(title_artist)] / 2.0 / ax_w
+        ax.add_line(Line2D([x0_axes, -0.02], [ysep, ysep],
+                           transform=ax.get_yaxis_transform(),
+                           color=sep_color, linewidth=0.5, alpha=0.25,
+                           zorder=1, clip_on=False))
+
+    if legend is not None:
+        handles, labels_ = legend
+        leg = fig.legend(handles, labels_, frameon=legend_frame, ncol=legend_ncol, fontsize=8)
+        place_legend_bottom(fig, leg)
+    if title:
+        fig.text(0.5, 1.0 - EDGE_PAD_PT / fig_h, title, ha="center", va="top", fontweight="bold",
+                 fontsize=title_size)
 
 
 # Visszafelé kompatibilitás (régi demókhoz)
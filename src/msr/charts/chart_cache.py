@@ -0,0 +1,191 @@
+"""
+Tartalom-címzett chart cache: ha egy chart minden releváns bemenete ugyanaz, nem rendereljük újra.
+
+KULCS (sha256):
+- a chart típusa (a save_* függvény neve) és a save_* összes paramétere a fájlnév (és a sablon mód) kivételével
+  → ez a normalizált spec + a sorozat-értékek + label-ek + paletta/méret/formázás,
+- környezet: a csomag és a matplotlib verziója, a theme (DPI, alap paletta), a Rubik font fájlok (út + méret + mtime),
+  és a chart-modulok forrásának hash-e (kódváltozás → minden kulcs elavul).
+
+TÁROLÁS:
+- local/output/.chart-cache/<kulcs[:2]>/<kulcs>.<png|svg> – a blob HARDLINK a renderelt fájlra (ha a fájlrendszer
+  nem engedi, pl. más eszközön van a cache: másolat); ez biztonságos, mert a save_figure sosem ír helyben, hanem
+  ideiglenes fájlt cserél atomikusan, így egy újrarenderelés új inode-ot kap, a blob tartalma nem változik,
+- találatkor a blobot ugyanígy linkeljük (vagy másoljuk) a célhelyre; ha a célfájl már maga a blob, hozzá sem nyúlunk,
+- aktív memória-sinknél (msr.charts.sink) a találat a sinkbe kerül, tároláskor pedig a sinkből olvasunk.
+
+MÉRETKORLÁT:
+- a találat frissíti a blob mtime-ját; a prune() a max_bytes fölötti részt a legrégebben használt blobokkal kezdve
+  törli (a charts-from-yaml / charts-batch a futás végén hívja),
+- a méretbe a blobok teljes mérete számít akkor is, ha egy kimeneti fájllal közös az inode (a törlésük ilyenkor
+  csak a hivatkozást szünteti meg) – a korlát így felülről becsli a cache saját lemezigényét.
+"""
+from __future__ import annotations
+import hashlib
+import json
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import Any, Callable
+
+from ..utils.paths import local_path, ensure_dir
+from .sink import active_sink
+
+CHART_CACHE_VERSION = 1
+
+# a cache alapértelmezett méretkorlátja (prune); None → korlát nélkül
+DEFAULT_MAX_BYTES = 2 * 1024 ** 3
+
+_ENV_KEY: str | None = None
+
+
+def _package_version() -> str:
+    try:
+        from importlib.metadata import version
+        return version("msr-report")
+    except Exception:
+        return "0"
+
+
+def environment_key() -> str:
+    """A renderelés környezetének ujjlenyomata (processzenként egyszer számolva)."""
+    global _ENV_KEY
+    if _ENV_KEY is None:
+        import matplotlib
+        from . import theme, bar, radar, table, layout, template, sink
+
+        fonts = []
+        for p in theme.rubik_font_candidates():
+            try:
+                st = p.stat()
+                fonts.append([str(p), st.st_size, st.st_mtime_ns])
+            except OSError:
+                continue
+        sources = []
+        for mod in (theme, bar, radar, table, layout, template, sink):
+            sources.append(hashlib.sha256(Path(mod.__file__).read_bytes()).hexdigest())
+        payload = [
+            CHART_CACHE_VERSION, _package_version(), matplotlib.__version__,
+            theme.DEFAULT_DPI, theme.DEFAULT_PALETTE, fonts, sources,
+        ]
+        _ENV_KEY = hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+    return _ENV_KEY
+
+
+def tmp_tag() -> str:
+    """Ideiglenes fájlnév-tag: processz + szál, hogy párhuzamos workerek / render-szálak ne írják egymás fájlját."""
+    return f"{os.getpid()}-{threading.get_ident()}"
+
+
+def _jsonable(value: Any) -> Any:
+    # numpy skalárok / egyéb típusok stabil szöveges alakja
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    return repr(value)
+
+
+def chart_key(kind: str, params: dict[str, Any]) -> str:
+    """A chart tartalom-kulcsa: típus + paraméterek (a fájlnév és a sablon mód nélkül) + környezet."""
+    p = {k: v for k, v in params.items() if k not in ("filename", "template")}
+    blob = json.dumps([kind, p, environment_key()], sort_keys=True, ensure_ascii=False, default=_jsonable)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def _place(src: Path, dst: Path) -> None:
+    """dst ugyanaz a fájl legyen, mint src: hardlink (ha nem megy: másolat), ideiglenes néven és atomikus cserével."""
+    tmp = dst.with_name(f".{dst.name}.{tmp_tag()}.tmp")
+    tmp.unlink(missing_ok=True)
+    try:
+        os.link(src, tmp)
+    except OSError:
+        shutil.copyfile(src, tmp)
+    os.replace(tmp, dst)
+
+
+def _same_file(a: Path, b: Path) -> bool:
+    try:
+        return os.path.samefile(a, b)
+    except OSError:
+        return False
+
+
+class ChartCache:
+    def __init__(self, directory: Path | None = None, max_bytes: int | None = DEFAULT_MAX_BYTES) -> None:
+        self.dir = Path(directory) if directory is not None else local_path("output", ".chart-cache")
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, kind: str, params: dict[str, Any]) -> str:
+        return chart_key(kind, params)
+
+    def _blob(self, key: str, suffix: str = ".png") -> Path:
+        # a formátum a kulcsban is benne van (image_format paraméter); a kiterjesztés csak az olvashatóságot szolgálja
+        return self.dir / key[:2] / f"{key}{suffix or '.png'}"
+
+    def fetch(self, key: str, target: Path) -> bool:
+        """Találat esetén a cache-elt képet a célhelyre teszi (ha ott még nincs ugyanaz) és True-t ad."""
+        blob = self._blob(key, target.suffix)
+        if not blob.exists():
+            return False
+        try:
+            os.utime(blob)  # LRU a prune-hoz
+        except OSError:
+            pass
+        sink = active_sink()
+        if sink is not None:
+            sink.put(target, blob.read_bytes())
+            return True
+        if not _same_file(blob, target):
+            _place(blob, ensure_dir(target.parent) / target.name)
+        return True
+
+    def store(self, key: str, produced: Path) -> None:
+        blob = self._blob(key, Path(produced).suffix)
+        ensure_dir(blob.parent)
+        sink = active_sink()
+        if sink is not None and produced in sink:
+            tmp = blob.with_name(f".{blob.name}.{tmp_tag()}.tmp")
+            tmp.write_bytes(sink.get(produced))
+            os.replace(tmp, blob)
+        elif not _same_file(produced, blob):
+            _place(Path(produced), blob)
+
+    def prune(self, max_bytes: int | None = None) -> int:
+        """
+        A cache-t max_bytes (alapból self.max_bytes) alá csökkenti, a legrégebben használt blobokkal kezdve.
+        Visszaadja a törölt blobok számát; None korlátnál nem töröl.
+        """
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        if limit is None or not self.dir.is_dir():
+            return 0
+        blobs = []
+        for p in self.dir.glob("*/*"):
+            if p.name.startswith("."):
+                continue
+            try:
+                st = p.stat()
+            except OSError:
+                continue
+            blobs.append((st.st_mtime_ns, st.st_size, p))
+        total = sum(size for _, size, _ in blobs)
+        removed = 0
+        for _, size, p in sorted(blobs):
+            if total <= limit:
+                break
+            p.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        return removed
+
+    def render(self, fn: Callable[..., Any], target: Path, **params: Any) -> Path:
+        """fn(**params) futtatása, ha a kulcs nincs a cache-ben; különben a cache-elt képet adjuk vissza."""
+        key = self.key(fn.__name__, params)
+        if self.fetch(key, target):
+            self.hits += 1
+            return target
+        out = Path(fn(**params))
+        self.store(key, out)
+        self.misses += 1
+        return out
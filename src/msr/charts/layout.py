@@ -0,0 +1,116 @@
+"""
+Fix (analitikus) layout: a margókat a szövegek font-metrikáiból előre számoljuk, így a chart pontosan egyszer rajzolódik.
+
+MIÉRT KELL:
+- a savefig(bbox_inches="tight") a kiterjedés méréséhez egy teljes extra rajzolást futtat, a tight_layout további
+  layout-lépést; a save_bar ezen felül canvas.draw()-val kér renderert a csoportcímek, szeparátorok és a középre
+  igazítás méréséhez → chartonként 2-3 teljes rajzolás,
+- fix módban a feliratok, a legend és a csoportcímek helyét a font-metrikákból (matplotlib TextToPath, renderer
+  nélkül, processzenként cache-elve) számoljuk; a kép pontosan size_cm méretű, és egyetlen rajzolás készül.
+
+Választás: a YAML-ben `layout: fixed` (gyökér szinten vagy chartonként), illetve a save_column / save_bar / save_radar
+layout paramétere. Alapértelmezés a "tight" (a korábbi, bájtra azonos kimenet). Minden méret pontban (1/72 hüvelyk).
+"""
+from __future__ import annotations
+import math
+from functools import lru_cache
+from typing import Sequence
+
+import matplotlib as mpl
+
+LAYOUT_MODES = ("tight", "fixed")
+
+# a figure széle és a legkülső artist közti hézag (pont)
+EDGE_PAD_PT = 4.0
+# tick-felirat távolsága a tengelytől (rcParams xtick.major.size + xtick.major.pad alapértékei)
+TICK_PAD_PT = 7.0
+# polar (radar) tengelyfeliratok középpontja ennyivel a kör fölött (matplotlib ThetaTick: a pad duplán hat)
+THETA_LABEL_PAD_PT = 14.0
+# sorköz a több soros szövegeknél (matplotlib Text alapértéke)
+LINE_SPACING = 1.2
+
+
+def check_layout(layout: str | None) -> str:
+    """A layout mód ellenőrzése ('tight' | 'fixed'; None → 'tight')."""
+    mode = str(layout or "tight").lower()
+    if mode not in LAYOUT_MODES:
+        raise ValueError(f"Ismeretlen layout mód: {layout!r} (lehetséges: {', '.join(LAYOUT_MODES)})")
+    return mode
+
+
+@lru_cache(maxsize=8192)
+def _line_size(line: str, fontsize: float, weight: str, family: tuple[str, ...]) -> tuple[float, float]:
+    from matplotlib.font_manager import FontProperties
+    from matplotlib.textpath import text_to_path
+
+    prop = FontProperties(family=list(family), size=fontsize, weight=weight)
+    w, _, _ = text_to_path.get_text_width_height_descent(line or " ", prop, ismath=False)
+    return float(w), float(fontsize) * LINE_SPACING
+
+
+def text_size(text: str, fontsize: float, *, weight: str = "normal", rotation: float = 0.0) -> tuple[float, float]:
+    """
+    Egy (akár több soros) szöveg befoglaló mérete pontban: (szélesség, magasság), a forgatással együtt.
+    A font-családot az aktuális rcParams-ból vesszük (Rubik, ha regisztrálva van), a soronkénti méretet cache-eljük.
+    """
+    family = tuple(mpl.rcParams["font.family"])
+    sizes = [_line_size(line, float(fontsize), str(weight), family) for line in str(text).split("\n")]
+    w = max(s[0] for s in sizes)
+    h = sum(s[1] for s in sizes)
+    if rotation:
+        a = math.radians(rotation)
+        w, h = abs(w * math.cos(a)) + abs(h * math.sin(a)), abs(w * math.sin(a)) + abs(h * math.cos(a))
+    return w, h
+
+
+def legend_size(labels: Sequence[str], fontsize: float, ncol: int = 1) -> tuple[float, float]:
+    """
+    A legend mérete pontban a matplotlib alapértelmezett térközeivel (borderpad, labelspacing, handlelength, ...),
+    oszlopfolytonos kitöltéssel – mint a Legend.
+    """
+    labels = [str(lbl) for lbl in labels]
+    if not labels:
+        return 0.0, 0.0
+    rc = mpl.rcParams
+    ncol = max(1, min(int(ncol), len(labels)))
+    nrows = math.ceil(len(labels) / ncol)
+    sizes = [text_size(lbl, fontsize) for lbl in labels]
+    row_h = max(max(h for _, h in sizes), rc["legend.handleheight"] * fontsize)
+    height = nrows * row_h + (nrows - 1) * rc["legend.labelspacing"] * fontsize + 2 * rc["legend.borderpad"] * fontsize
+    handle = (rc["legend.handlelength"] + rc["legend.handletextpad"]) * fontsize
+    cols = [sizes[c * nrows:(c + 1) * nrows] for c in range(ncol)]
+    width = sum(handle + max(w for w, _ in col) for col in cols if col)
+    width += (ncol - 1) * rc["legend.columnspacing"] * fontsize + 2 * rc["legend.borderpad"] * fontsize
+    return width, height
+
+
+def rc_font_size(key: str) -> float:
+    """Egy rcParams betűméret pontban (a 'large' / 'small' stb. relatív értékeket is feloldva)."""
+    from matplotlib.font_manager import FontProperties
+    return float(FontProperties(size=mpl.rcParams[key]).get_size_in_points())
+
+
+def bottom_legend_height(labels: Sequence[str], fontsize: float, ncol: int = 1) -> float:
+    """A place_legend_bottom legendjének helyigénye alul: legend + borderaxespad + hézag a rajzterület felé."""
+    _, h = legend_size(labels, fontsize, ncol)
+    return h + mpl.rcParams["legend.borderaxespad"] * fontsize + EDGE_PAD_PT
+
+
+def figure_size_pt(fig) -> tuple[float, float]:
+    w, h = fig.get_size_inches()
+    return float(w) * 72.0, float(h) * 72.0
+
+
+def set_margins(fig, *, left: float, right: float, top: float, bottom: float) -> None:
+    """subplots_adjust pontban megadott margókkal (a figure feléig szorítva, hogy mindig maradjon rajzterület)."""
+    w, h = figure_size_pt(fig)
+    left, right = min(left / w, 0.45), min(right / w, 0.45)
+    bottom, top = min(bottom / h, 0.45), min(top / h, 0.45)
+    fig.subplots_adjust(left=left, right=1.0 - right, bottom=bottom, top=1.0 - top)
+
+
+def place_legend_bottom(fig, leg) -> None:
+    """A legend a figure alsó szélére, vízszintesen középre (fix módban a legend_below legendje)."""
+    _, h = figure_size_pt(fig)
+    leg.set_loc("lower center")
+    leg.set_bbox_to_anchor((0.5, EDGE_PAD_PT / h), transform=fig.transFigure)
@@ -0,0 +1,136 @@
+"""
+Párhuzamos chart-renderelés processz-poolban, "meleg" workerekkel.
+
+MIÉRT KELL:
+- a matplotlib raszterizálás (300 DPI) CPU-kötött, a render_assignment pedig sorosan, egy magon fut,
+- itt a partnereket (kevés partnernél partnerenként a chartokat is) egy processz-poolra osztjuk szét,
+- minden worker EGYSZER inicializál: Agg backend, Rubik font, minimal theme, és a szülő (a YAML oszlopaira már
+  kivetített) db-jéből felépített WorkbookMeta (párok, label map, sorozat-mátrixok) – utána sok chartot renderel
+  ugyanabban a processzben. A workerek ugyanazt a float64 db-t kapják, amiből a soros út renderel, így a chartok,
+  a chart cache kulcsai és a kohorsz-fájlnevek bájtra azonosak a soros futáséval.
+
+A workerek spawn kontextusban indulnak (nincs fork-olt matplotlib/szál állapot). A cwd és az MSR_LOCAL_ROOT
+öröklődik, így a kimenet ugyanoda kerül, mint soros futásnál. A pool (msr.charts.pool.WorkerPool) N feladat után
+vagy memória-plafon fölött újraindítja a workereket, és feladatonként jelenti a nyitva maradt figure-öket.
+"""
+from __future__ import annotations
+import os
+from pathlib import Path
+from typing import Callable, Iterator, Sequence
+import pandas as pd
+
+from .pool import WorkerPool, PoolStats
+
+# worker-oldali állapot (processzenként egyszer töltjük ki az initializerben)
+_WORKER: dict = {}
+
+PageResult = dict[str, list[Path]]
+
+
+def default_workers() -> int:
+    """Alapértelmezett worker-szám: az elérhető CPU magok száma."""
+    try:
+        return max(1, len(os.sched_getaffinity(0)))
+    except AttributeError:
+        return max(1, os.cpu_count() or 1)
+
+
+def warm_up() -> None:
+    """
+    Processzenkénti egyszeri matplotlib-előkészítés: Agg backend (a pyplot import ELŐTT), font-regisztráció, theme.
+    A font-keresés és a theme a theme modulban cache-elt, így a renderelés közbeni hívások már nem dolgoznak.
+    """
+    import matplotlib
+    matplotlib.use("Agg")
+    from .theme import register_rubik_fonts, apply_minimal_theme
+    register_rubik_fonts()
+    apply_minimal_theme()
+
+
+def _init_worker(db: pd.DataFrame, ddf: pd.DataFrame | None, cache_dir: str | None) -> None:
+    warm_up()
+    from ..data.meta import WorkbookMeta
+    from .chart_cache import ChartCache
+    _WORKER["meta"] = WorkbookMeta(db, ddf)
+    _WORKER["chart_cache"] = ChartCache(Path(cache_dir)) if cache_dir else None
+
+
+def _render_task(
+    partner_id: str,
+    position: int,
+    chunk: list[tuple[int, str, dict]],
+) -> tuple[str, dict[int, Path | None]]:
+    from .assignment import render_specs
+
+    meta = _WORKER["meta"]
+    # a pozíció iloc; a render_specs a db.loc címkét várja (mint a soros út)
+    rendered = render_specs(
+        db=meta.db, ddf=meta.ddf, row_index=meta.db.index[position], specs=[(kind, spec) for _, kind, spec in chunk],
+        partner_id=partner_id, meta=meta, chart_cache=_WORKER["chart_cache"],
+    )
+    return partner_id, {idx: p for (idx, _, _), p in zip(chunk, rendered)}
+
+
+def iter_render_parallel(
+    *,
+    db: pd.DataFrame,
+    ddf: pd.DataFrame | None,
+    config: dict,
+    partners: Sequence[tuple[str, int]],
+    pid_col: str = "ResponseID",
+    workers: int | None = None,
+    max_tasks_per_worker: int = 0,
+    max_worker_rss_mb: int = 0,
+    on_leak: Callable[[str, int], None] | None = None,
+    stats: PoolStats | None = None,
+    chart_cache_dir: Path | None = None,
+) -> Iterator[tuple[str, dict[str, PageResult]]]:
+    """
+    A render_pages_from_yaml párhuzamos megfelelője több partnerre.
+    - partners: [(partner_id, iloc_pozíció), ...] – a pozíció a db-beli sor (PartnerIndex.position)
+    - workers:  processzek száma (None → CPU magok száma)
+    - max_tasks_per_worker / max_worker_rss_mb: worker-újraindítás N feladat után / memória-plafon fölött (0 = nincs)
+    - on_leak, stats: szivárgó figure-ök jelzése, illetve a pool statisztikái (PoolStats) a hívónak
+    - chart_cache_dir: a tartalom-címzett chart cache mappája (None → nincs cache)
+    A partnereket a befejezés sorrendjében adja vissza: (partner_id, {page_id: {kind: [Path, ...]}}).
+    Worker-hiba esetén a kivétel a hívónál jelenik meg (a többi workert leállítjuk).
+    """
+    from .assignment import plan_run, fan_out
+
+    # az oldalak közt ismétlődő chartokat egyszer küldjük ki; az eredményt a szülő osztja vissza az oldalakra
+    specs, refs = plan_run(config)
+    workers = max(1, workers or default_workers())
+    if not partners or not specs:
+        return
+
+    # kevés partnernél partnerenként a chartokat is szétosztjuk (legfeljebb oldalnyi darabra), hogy minden mag dolgozzon
+    indexed = [(i, kind, spec) for i, (kind, spec) in enumerate(specs)]
+    n_chunks = min(len(refs), len(specs), -(-workers // len(partners))) if len(partners) < workers else 1
+    chunks = [indexed[k::n_chunks] for k in range(max(1, n_chunks))]
+    expected: dict[str, int] = {}
+    merged: dict[str, dict[int, Path | None]] = {}
+
+    tasks: list[tuple] = []
+    labels: list[str] = []
+    for partner_id, position in partners:
+        expected[partner_id] = len(chunks)
+        for k, chunk in enumerate(chunks):
+            tasks.append((partner_id, int(position), chunk))
+            labels.append(partner_id if len(chunks) == 1 else f"{partner_id}/{k + 1}")
+
+    pool = WorkerPool(
+        min(workers, len(tasks)),
+        initializer=_init_worker,
+        initargs=(db, ddf, (str(chart_cache_dir) if chart_cache_dir else None)),
+        max_tasks=max_tasks_per_worker,
+        max_rss_mb=max_worker_rss_mb,
+        on_leak=on_leak,
+        stats=stats,
+    )
+    for partner_id, res in pool.imap_unordered(_render_task, tasks, labels=labels):
+        merged.setdefault(partner_id, {}).update(res)
+        expected[partner_id] -= 1
+        if expected[partner_id] == 0:
+            # az oldalak és a chartok sorrendje a YAML sorrendje marad
+            done = merged.pop(partner_id)
+            yield partner_id, fan_out(refs, [done[i] for i in range(len(specs))])
@@ -0,0 +1,259 @@
+"""
+Korlátos memóriájú worker pool hosszú batch futásokhoz.
+
+MIÉRT KELL:
+- a matplotlib (font cache, nyitva felejtett figure-ök) processzenként több ezer render alatt memóriát halmoz fel,
+- a ProcessPoolExecutor-ban egy worker nem tud "szólni", hogy túl nagy lett (a max_tasks_per_child is csak 3.11+),
+- itt minden worker minden feladat után:
+    * lezárja és JELENTI a nyitva maradt figure-öket (plt.get_fignums()),
+    * megméri a saját RSS-ét,
+    * és nyugdíjba vonul, ha elérte a feladat-limitet vagy a memória-plafont – a szülő ilyenkor újat indít
+      (ugyanazzal az initializerrel, tehát az új worker is "meleg").
+- a feladatokat a szülő osztja ki; ha egy worker elhal (pl. OOM-kill), a nála lévő feladatot egyszer újra sorba állítjuk.
+
+A psutil opcionális: ha nincs telepítve, Linuxon a /proc/self/statm-ből olvassuk az RSS-t.
+"""
+from __future__ import annotations
+import multiprocessing as mp
+import os
+import pickle
+import queue
+import traceback
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Iterator, Sequence
+
+
+def current_rss() -> int:
+    """A processz aktuális rezidens memóriája bájtban (0, ha nem mérhető)."""
+    try:
+        import psutil
+        return int(psutil.Process().memory_info().rss)
+    except ImportError:
+        pass
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return 0
+
+
+def close_leaked_figures() -> int:
+    """Feladat végén nyitva maradt matplotlib figure-ök lezárása; visszaadja a számukat (0 = nincs szivárgás)."""
+    import matplotlib.pyplot as plt
+    nums = plt.get_fignums()
+    if nums:
+        plt.close("all")
+    return len(nums)
+
+
+@dataclass
+class PoolStats:
+    tasks: int = 0
+    started_workers: int = 0
+    recycled: int = 0
+    crashed: int = 0
+    peak_rss: int = 0
+    leaked_figures: int = 0
+    leaks: list[tuple[str, int]] = field(default_factory=list)  # (feladat címke, nyitva maradt figure-ök)
+
+
+def _worker_main(inbox, result_q, initializer, initargs, max_tasks: int, max_rss: int) -> None:
+    if initializer is not None:
+        initializer(*initargs)
+    pid = os.getpid()
+    result_q.put(("ready", pid))
+    done = 0
+    while True:
+        item = inbox.get()
+        if item is None:
+            break
+        tid, fn, args = item
+        try:
+            value, err = fn(*args), None
+        except BaseException as e:
+            value = None
+            try:
+                pickle.dumps(e)
+                err = (e, traceback.format_exc())
+            except Exception:
+                err = (None, traceback.format_exc())
+        leaked = close_leaked_figures()
+        rss = current_rss()
+        done += 1
+        retire = bool((max_tasks and done >= max_tasks) or (max_rss and rss > max_rss))
+        result_q.put(("done", tid, pid, value, err, leaked, rss, retire))
+        if retire:
+            break
+
+
+class WorkerPool:
+    """
+    pool = WorkerPool(8, initializer=_init, initargs=(...), max_tasks=200, max_rss_mb=1500)
+    for value in pool.imap_unordered(fn, [(args...), ...], labels=[...]): ...
+    - max_tasks:  ennyi feladat után a worker újraindul (0 = nincs limit)
+    - max_rss_mb: ha egy feladat után a worker RSS-e e fölött van, újraindul (0 = nincs plafon)
+    - on_leak:    callback (feladat címke, nyitva maradt figure-ök száma) – a pool ettől függetlenül lezárja őket
+    A feladatfüggvénynek modul-szintűnek kell lennie (spawn → név szerint picklelődik).
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        *,
+        initializer: Callable[..., None] | None = None,
+        initargs: tuple = (),
+        max_tasks: int = 0,
+        max_rss_mb: int = 0,
+        on_leak: Callable[[str, int], None] | None = None,
+        stats: PoolStats | None = None,
+    ) -> None:
+        self.workers = max(1, int(workers))
+        self.initializer = initializer
+        self.initargs = initargs
+        self.max_tasks = max(0, int(max_tasks))
+        self.max_rss = max(0, int(max_rss_mb)) * 1024 * 1024
+        self.on_leak = on_leak
+        self.stats = stats if stats is not None else PoolStats()
+        self._ctx = mp.get_context("spawn")
+
+    def _spawn(self, result_q, procs: dict) -> None:
+        inbox = self._ctx.SimpleQueue()
+        p = self._ctx.Process(
+            target=_worker_main,
+            args=(inbox, result_q, self.initializer, self.initargs, self.max_tasks, self.max_rss),
+            daemon=True,
+        )
+        p.start()
+        procs[p.pid] = (p, inbox)
+        self.stats.started_workers += 1
+
+    def imap_unordered(
+        self,
+        fn: Callable[..., Any],
+        tasks: Iterable[tuple],
+        *,
+        labels: Sequence[str] | None = None,
+    ) -> Iterator[Any]:
+        """
+        A feladatok eredményei a befejezés sorrendjében. Feladat-hiba esetén a kivétel a hívónál jelenik meg.
+        A feladatokat a szülő osztja ki (mindig csak szabad workernek), így elhalt workernél tudjuk, mi veszett el.
+        """
+        tasks = [tuple(t) for t in tasks]
+        if not tasks:
+            return
+        labels = list(labels) if labels is not None else [str(i) for i in range(len(tasks))]
+        result_q = self._ctx.Queue()
+        backlog = deque(range(len(tasks)))
+        procs: dict[int, tuple[Any, Any]] = {}   # worker pid → (processz, saját feladat-sor)
+        running: dict[int, int] = {}             # worker pid → kiosztott feladat
+        retried: set[int] = set()               # elhalt worker miatt újra sorba állított feladatok
+        finished: set[int] = set()
+        inbox: deque = deque()                   # a sorból már kiolvasott, még fel nem dolgozott üzenetek
+        remaining = len(tasks)
+
+        def _dispatch(pid: int) -> None:
+            if backlog and pid in procs and pid not in running:
+                tid = backlog.popleft()
+                running[pid] = tid
+                procs[pid][1].put((tid, fn, tasks[tid]))
+
+        for _ in range(min(self.workers, len(tasks))):
+            self._spawn(result_q, procs)
+        try:
+            while remaining:
+                try:
+                    msg = inbox.popleft() if inbox else result_q.get(timeout=1.0)
+                except queue.Empty:
+                    self._reap_crashed(result_q, inbox, procs, running, retried, backlog, labels)
+                    for pid in list(procs):
+                        _dispatch(pid)
+                    continue
+                if msg[0] == "ready":
+                    if msg[1] not in running:
+                        _dispatch(msg[1])
+                    continue
+                _, tid, pid, value, err, leaked, rss, retire = msg
+                running.pop(pid, None)
+                self.stats.peak_rss = max(self.stats.peak_rss, rss)
+                if tid in finished:
+                    # biztonsági háló: egy feladat eredményét csak egyszer rögzítjük
+                    self._after_task(pid, retire, result_q, procs, backlog, _dispatch)
+                    continue
+                if leaked:
+                    self.stats.leaked_figures += leaked
+                    self.stats.leaks.append((labels[tid], leaked))
+                    if self.on_leak is not None:
+                        self.on_leak(labels[tid], leaked)
+                if err is not None:
+                    exc, tb = err
+                    raise (exc if exc is not None else RuntimeError(tb)) from RuntimeError(f"worker traceback:\n{tb}")
+                finished.add(tid)
+                if tid in backlog:
+                    backlog.remove(tid)
+                remaining -= 1
+                self.stats.tasks += 1
+                self._after_task(pid, retire, result_q, procs, backlog, _dispatch)
+                yield value
+        finally:
+            for proc, inbox in procs.values():
+                if remaining:
+                    # hiba / megszakítás: a félkész munkát nem várjuk meg
+                    proc.terminate()
+                else:
+                    inbox.put(None)
+            for proc, _ in procs.values():
+                proc.join(timeout=5)
+                if proc.is_alive():
+                    proc.terminate()
+            result_q.close()
+
+    def _after_task(self, pid, retire, result_q, procs, backlog, dispatch) -> None:
+        if retire:
+            # a worker magától kilép; ha van még kiosztatlan munka, helyette újat indítunk
+            entry = procs.pop(pid, None)
+            if entry is not None:
+                self.stats.recycled += 1
+                entry[0].join(timeout=5)
+                if backlog:
+                    self._spawn(result_q, procs)
+        else:
+            dispatch(pid)
+
+    def _reap_crashed(self, result_q, inbox, procs, running, retried, backlog, labels) -> None:
+        dead = [pid for pid, (proc, _) in procs.items() if not proc.is_alive()]
+        if not dead:
+            return
+        # a leállt worker utolsó üzenete már a sorban lehet: előbb mindent kiolvasunk, és csak az számít elhaltnak,
+        # akinek a feladata eredmény nélkül maradt
+        while True:
+            try:
+                inbox.append(result_q.get_nowait())
+            except queue.Empty:
+                break
+        reported = {m[2]: m[7] for m in inbox if m[0] == "done"}  # pid → retire
+        for pid in dead:
+            proc = procs[pid][0]
+            if pid in reported:
+                if not reported[pid]:
+                    # az eredményét elküldte, de a következő feladat előtt leállt: pótoljuk, a feladat nem veszett el
+                    procs.pop(pid)
+                    self.stats.crashed += 1
+                    if backlog:
+                        self._spawn(result_q, procs)
+                # nyugdíjba vonult worker: az üzenet feldolgozása (_after_task) intézi a pótlást
+                continue
+            procs.pop(pid)
+            tid = running.pop(pid, None)
+            self.stats.crashed += 1
+            if tid is None:
+                # feladaton kívül halt el (pl. az initializerben) – az újraindítás ugyanide vezetne
+                raise RuntimeError(f"A worker (pid {pid}) feladaton kívül leállt (exitcode {proc.exitcode}).")
+            if tid in retried:
+                raise RuntimeError(
+                    f"A(z) {labels[tid]!r} feladat kétszer is a worker elhalását okozta (exitcode {proc.exitcode})."
+                )
+            # pl. OOM-kill: a feladatot egyszer újra sorba állítjuk, a worker helyett újat indítunk
+            retried.add(tid)
+            backlog.appendleft(tid)
+            self._spawn(result_q, procs)
@@ -2,10 +2,18 @@ from logging import fatal
 from typing import Sequence, Optional, Tuple
 import math
 import numpy as np
-import matplotlib.pyplot as plt
 
-from ..utils.paths import local_path, ensure_dir
-from .theme import apply_minimal_theme, cm_to_in, DEFAULT_PALETTE
+from ..utils.paths import local_path
+from .theme import apply_minimal_theme, new_figure, cm_to_in, DEFAULT_PALETTE, chart_filename
+from .sink import output_dir, save_figure
+from .layout import (
+    EDGE_PAD_PT, THETA_LABEL_PAD_PT, bottom_legend_height, check_layout, figure_size_pt, place_legend_bottom,
+    rc_font_size, text_size,
+)
+from .template import ChartTemplate, get_template, put_template, template_key
+
+# a sablon módban partnerenként cserélt (adat-)paraméterek – minden más a sablon kulcsába kerül
+TEMPLATE_DATA_PARAMS = ("series_main", "series_comp")
 
 # ─────────────────────────────────────────────────────────
 # Global default size (cm) for radar charts
@@ -36,12 +44,23 @@ def save_radar(
     legend_pad: float = 0.14,
     legend_ncol: int = 2,
     label_fontsize: float | None = None,
+    image_format: str | None = None,  # "png" | "svg" (None → a fájlnév kiterjesztése dönt)
+    layout: str | None = None,  # "tight" (alap) | "fixed": a kör mérete a feliratok metrikáiból, egyetlen rajzolás
+    template: bool = False,  # True → ugyanarra a specre a figure újrahasznosítása, csak adatcsere (charts.template)
 ):
     """
     Radar chart egy (vagy két) sorozattal, brand-palettával (secondary / muted).
     Diszkrét háttérráccsal, címkékkel és kapcsolható legenddel.
     """
+    params = dict(locals())
     apply_minimal_theme()
+    layout = check_layout(layout)
+    if template:
+        tpl_key = template_key("save_radar", params, TEMPLATE_DATA_PARAMS)
+        tpl = get_template(tpl_key)
+        if tpl is not None:
+            tpl.update(series_main, series_comp)
+            return tpl.finish(_chart_path(filename, image_format))
 
     # Merge brand palette with any caller overrides
     pal = {**DEFAULT_PALETTE, **(palette or {})}
@@ -61,23 +80,20 @@ def save_radar(
     s1 = list(series_main) + [series_main[0]]
     s2 = list(series_comp) + [series_comp[0]] if series_comp is not None else None
 
-    fig, ax = plt.subplots(
-        subplot_kw=dict(polar=True),
-        figsize=(cm_to_in(size_cm[0]), cm_to_in(size_cm[1])),
-        dpi=300,
-    )
+    fig, ax = new_figure((cm_to_in(size_cm[0]), cm_to_in(size_cm[1])), 300, polar=True)
 
     # Surágon lévő data labelek
     ax.tick_params(axis="y", which="both", labelsize=7)
 
     # Fő sorozat
-    ax.plot(angles, s1, linewidth=2.0, color=color_main, label=main_label)
-    ax.fill(angles, s1, alpha=0.10, color=color_main)
+    series_artists = [(*ax.plot(angles, s1, linewidth=2.0, color=color_main, label=main_label),
+                       *ax.fill(angles, s1, alpha=0.10, color=color_main))]
 
     # Összehasonlító sorozat (opcionális)
     if s2 is not None:
-        ax.plot(angles, s2, linewidth=1.8, linestyle="-", color=color_comp, label=(comp_label or ""))
-        ax.fill(angles, s2, alpha=0.08, color=color_comp)
+        series_artists.append((*ax.plot(angles, s2, linewidth=1.8, linestyle="-", color=color_comp,
+                                        label=(comp_label or "")),
+                               *ax.fill(angles, s2, alpha=0.08, color=color_comp)))
 
     # Címkék / tengelyek
     ax.set_xticks(angles[:-1])
@@ -127,14 +143,73 @@ def save_radar(
         leg.set_zorder(10)
 
     # Mentés (közös kimeneti mappa)
+    out_path = _chart_path(filename, image_format)
+
+    def _finish(out_path):
+        return _save_radar_layout(fig, ax, out_path, layout=layout, title=title, leg=leg, legend_below=legend_below,
+                                  legend_ncol=legend_ncol, angles=angles, labels=labels, label_fontsize=label_fontsize)
+
+    if template:
+        # a layout kiinduló állapota: adatcsere után a tight_layout innen számol újra, mint egy friss figure-nél
+        subplotpars = vars(fig.subplotpars).copy()
+
+        def _update(new_main, new_comp) -> None:
+            new_series = [new_main] + ([new_comp] if new_comp is not None else [])
+            for (line, poly), series in zip(series_artists, new_series):
+                closed = list(series) + [series[0]]
+                line.set_data(angles, closed)
+                poly.set_xy(np.column_stack([angles, closed]))
+            ax.relim()
+            if not r_range:
+                # a set_rmin/set_rmax közvetlenül a viewLim-et írja → fix tartománynál nincs újraskálázás
+                ax.autoscale_view()
+            fig.subplots_adjust(**subplotpars)
+
+        put_template(tpl_key, ChartTemplate(fig, _update, _finish))
+    return _finish(out_path)
+
+
+def _chart_path(filename: Optional[str], image_format: str | None):
     out_dir = local_path("output", "assets", "charts")
-    ensure_dir(out_dir)
-    out_path = out_dir / (filename or "radar.png")
+    output_dir(out_dir)
+    return out_dir / chart_filename(filename or "radar.png", image_format)
+
+
+def _save_radar_layout(fig, ax, out_path, *, layout, title, leg, legend_below, legend_ncol, angles, labels,
+                       label_fontsize):
+    """A save_radar befejező lépése (layout + mentés) – sablon módban adatcsere után ez fut újra."""
+    if layout == "fixed":
+        # fix layout: a legnagyobb kör, amely mellett minden tengelyfelirat kifér – renderer és tight bbox nélkül
+        fig_w, fig_h = figure_size_pt(fig)
+        top = bottom = EDGE_PAD_PT
+        if title:
+            top += text_size(title, rc_font_size("axes.titlesize"), weight="bold")[1] + 16.0
+        if leg is not None and legend_below:
+            place_legend_bottom(fig, leg)
+            bottom += bottom_legend_height([t.get_text() for t in leg.get_texts()], rc_font_size("legend.fontsize"),
+                                           legend_ncol)
+        half_w = fig_w / 2.0 - EDGE_PAD_PT
+        half_h = (fig_h - top - bottom) / 2.0
+        radius = min(half_w, half_h)
+        fs = label_fontsize if label_fontsize is not None else 7
+        for angle, lbl in zip(angles[:-1], labels):
+            w, h = text_size(str(lbl), fs)
+            c, s = abs(math.cos(angle)), abs(math.sin(angle))
+            if c > 1e-6:
+                radius = min(radius, (half_w - w / 2.0) / c - THETA_LABEL_PAD_PT)
+            if s > 1e-6:
+                radius = min(radius, (half_h - h / 2.0) / s - THETA_LABEL_PAD_PT)
+        radius = max(radius, 0.25 * min(half_w, half_h))
+        cy = bottom + half_h
+        ax.set_position([
+            (fig_w / 2.0 - radius) / fig_w, (cy - radius) / fig_h, 2 * radius / fig_w, 2 * radius / fig_h,
+        ])
+        save_figure(fig, out_path)
+        return out_path
 
     fig.tight_layout()
     if leg is not None:
-        fig.savefig(out_path, bbox_inches="tight", bbox_extra_artists=[leg])
+        save_figure(fig, out_path, bbox_inches="tight", bbox_extra_artists=[leg])
     else:
-        fig.savefig(out_path, bbox_inches="tight")
-        plt.close(fig)
+        save_figure(fig, out_path, bbox_inches="tight")
     return out_path
\ No newline at end of file
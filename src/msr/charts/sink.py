@@ -0,0 +1,121 @@
+"""
+Memória-alapú chart kimenet (sink): a chartok bájtként egy szótárba kerülnek, nem a local/output/assets/ alá.
+
+MIÉRT KELL:
+- batch futásnál partnerenként több tucat kis PNG/SVG íródik ki, amit a render_structure utána újra megkeres
+  (exists/resolve) és a böngésző file:// úton megint beolvas – ez több ezer fájlírás és stat futásonként,
+- aktív sinknél a save_* függvények ugyanazt az útvonalat adják vissza, de a kép csak a memóriában létezik;
+  a render_structure az útvonal alapján a sinkből data URI-ként ágyazza be a HTML-be.
+
+HASZNÁLAT (egy processzen belül: chartok + riport):
+    with MemorySink() as sink:
+        render_pages_from_yaml(...)
+        render_structure(struct_path, fmt_ctx={"partner": pid}, sink=sink)
+
+Az aktív sink kontextus-változó (contextvars): a with blokkot futtató szál (és async task) látja, más szálak nem –
+egy render-szálnak contextvars.copy_context().run(...)-nal kell átadni. A processz-poolos párhuzamos render workerei
+külön processzek, ott a fájl-alapú kimenet marad. CLI: msr render-structure --charts-config ... --partner-id ... A kulcs az abszolút útvonal (lemez-hozzáférés nélkül normalizálva).
+"""
+from __future__ import annotations
+import base64
+import contextvars
+import io
+import os
+import threading
+from pathlib import Path
+
+from ..utils.paths import ensure_dir
+from .theme import savefig_options
+
+_ACTIVE: contextvars.ContextVar["MemorySink | None"] = contextvars.ContextVar("msr_chart_sink", default=None)
+
+MIME_TYPES = {".png": "image/png", ".svg": "image/svg+xml"}
+
+
+def _key(path: Path | str) -> str:
+    return os.path.abspath(os.fspath(path))
+
+
+class MemorySink:
+    def __init__(self) -> None:
+        self._blobs: dict[str, bytes] = {}
+        self._lock = threading.Lock()
+        self._tokens: list[contextvars.Token] = []
+
+    def __enter__(self) -> "MemorySink":
+        self._tokens.append(_ACTIVE.set(self))
+        return self
+
+    def __exit__(self, *exc) -> None:
+        _ACTIVE.reset(self._tokens.pop())
+
+    def __contains__(self, path: Path | str) -> bool:
+        return _key(path) in self._blobs
+
+    def __len__(self) -> int:
+        return len(self._blobs)
+
+    def put(self, path: Path | str, data: bytes) -> Path:
+        with self._lock:
+            self._blobs[_key(path)] = bytes(data)
+        return Path(path)
+
+    def get(self, path: Path | str) -> bytes | None:
+        return self._blobs.get(_key(path))
+
+    def link(self, src: Path | str, target: Path | str) -> Path:
+        """A target ugyanarra a bájt-objektumra mutat, mint az src (kohorsz-chart: egy render, több partner)."""
+        with self._lock:
+            self._blobs[_key(target)] = self._blobs[_key(src)]
+        return Path(target)
+
+    def data_uri(self, path: Path | str) -> str | None:
+        """A kép data URI-ként (a HTML közvetlenül beágyazza); None, ha a sinkben nincs ilyen útvonal."""
+        data = self.get(path)
+        if data is None:
+            return None
+        mime = MIME_TYPES.get(Path(path).suffix.lower(), "application/octet-stream")
+        return f"data:{mime};base64,{base64.b64encode(data).decode('ascii')}"
+
+    def dump(self, root: Path | str | None = None) -> list[Path]:
+        """Hibakereséshez: a sink tartalmának kiírása az eredeti útvonalakra (root megadásakor az alá, relatívan)."""
+        written = []
+        for key, data in sorted(self._blobs.items()):
+            out = Path(root) / Path(key).relative_to(Path(key).anchor) if root is not None else Path(key)
+            ensure_dir(out.parent)
+            out.write_bytes(data)
+            written.append(out)
+        return written
+
+
+def active_sink() -> MemorySink | None:
+    """Az éppen aktív (with MemorySink(): ...) sink, vagy None → fájl-alapú kimenet."""
+    return _ACTIVE.get()
+
+
+def output_dir(path: Path) -> Path:
+    """A save_* kimeneti mappája: aktív sinknél nem hozzuk létre (a lemezhez nem nyúlunk), különben ensure_dir."""
+    return Path(path) if _ACTIVE.get() is not None else ensure_dir(path)
+
+
+def save_figure(fig, path: Path, **kwargs) -> Path:
+    """
+    fig.savefig a formátumfüggő opciókkal (savefig_options); aktív sinknél bájt-pufferbe, és a sinkbe az útvonal
+    kulcsa alá. A formátum mindkét esetben a kiterjesztésből jön, így a bájtok azonosak a fájlba írt képével.
+    Fájlba ideiglenes néven írunk és atomikusan cseréljük: a célfájl inode-ját sosem írjuk felül helyben, így
+    a rá mutató hardlinkek (kohorsz-chart, chart cache) tartalma nem változik meg alattuk.
+    """
+    path = Path(path)
+    fmt = path.suffix.lstrip(".").lower() or "png"
+    sink = _ACTIVE.get()
+    if sink is None:
+        tmp = path.with_name(f".{path.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+        try:
+            fig.savefig(tmp, format=fmt, **kwargs, **savefig_options(path))
+            os.replace(tmp, path)
+        finally:
+            tmp.unlink(missing_ok=True)
+        return path
+    buf = io.BytesIO()
+    fig.savefig(buf, format=fmt, **kwargs, **savefig_options(path))
+    return sink.put(path, buf.getvalue())
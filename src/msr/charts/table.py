@@ -1,13 +1,10 @@
 from __future__ import annotations
 from typing import Sequence, Any, Optional, Tuple
 import numpy as np
-import matplotlib.pyplot as plt
 
-from ..utils.paths import local_path, ensure_dir
-from .theme import DEFAULT_PALETTE, ensure_rubik_font, cm_to_in, DEFAULT_DPI
-
-# Rubik betűcsalád aktiválása (ha már betöltötted máshol is, ez harmless)
-ensure_rubik_font()
+from ..utils.paths import local_path
+from .theme import DEFAULT_PALETTE, ensure_rubik_font, new_figure, cm_to_in, DEFAULT_DPI, chart_filename
+from .sink import output_dir, save_figure
 
 def _fmt_cell(x: Any) -> str:
     # Egységes, szép formázás számokra
@@ -33,9 +30,10 @@ def save_table(
     grid: bool = False,
     grid_width: float = 0.6,
     align: str = "left",            # "left" | "center" | "right"
+    image_format: str | None = None,  # "png" | "svg" (None → a fájlnév kiterjesztése dönt)
 ) -> str:
     """
-    Brand-aligned táblázat mentése PNG-be (Rubik + brand színek).
+    Brand-aligned táblázat mentése PNG-be vagy SVG-be (Rubik + brand színek).
     - Fejléc: text háttér, secondary felirat (alapértelmezés)
     - Törzs: text színű felirat, váltakozó háttér (zebra)
     """
@@ -55,10 +53,9 @@ def save_table(
         height_cm = max(4.0, 1.6 + 0.8 * (nrows + 1))
         size_cm = (width_cm, height_cm)
 
-    fig, ax = plt.subplots(
-        figsize=(cm_to_in(size_cm[0]), cm_to_in(size_cm[1])),
-        dpi=DEFAULT_DPI,
-    )
+    # Rubik betűcsalád aktiválása az első rajzoláskor (ha már betöltötted máshol is, ez harmless)
+    ensure_rubik_font()
+    fig, ax = new_figure((cm_to_in(size_cm[0]), cm_to_in(size_cm[1])), DEFAULT_DPI)
     ax.set_axis_off()
 
     cell_text = [[_fmt_cell(x) for x in row] for row in rows]
@@ -113,12 +110,11 @@ def save_table(
         ax.set_title(title, pad=8, fontweight="bold")
 
     out_dir = local_path("output", "assets", "tables")
-    ensure_dir(out_dir)
-    out_path = out_dir / filename
+    output_dir(out_dir)
+    out_path = out_dir / chart_filename(filename, image_format)
 
     fig.tight_layout()
-    fig.savefig(out_path, bbox_inches="tight")
-    plt.close(fig)
+    save_figure(fig, out_path, bbox_inches="tight")
     return str(out_path)
 
 
@@ -134,6 +130,7 @@ def save_partner_group_table(
     col_align: Sequence[str] | None = ("left", "center", "center"),
     zebra_colors: tuple[str, str] | None = None,
     font_size: float = 9.0,
+    image_format: str | None = None,
 ) -> str:
     columns = ["Kérdés", "Partner", "Csoport"]
     rows = [[lab, p, g] for lab, p, g in zip(labels, partner_values, group_values)]
@@ -147,4 +144,5 @@ def save_partner_group_table(
         zebra_colors=zebra_colors,
         font_size=font_size,
         align="left",
+        image_format=image_format,
     )
\ No newline at end of file
@@ -0,0 +1,90 @@
+"""
+Újrahasznosítható chart-sablonok: ugyanarra a chart spec-re a figure-t egyszer építjük fel, partnerenként csak az
+adat-artistokat (oszlop-magasság, overlay vonal, radar poligon, értékfeliratok) cseréljük, és újra mentjük.
+
+MIÉRT KELL:
+- egy spec minden partnernél ugyanazokat a tengelyeket, tickeket, tördelt feliratokat, legendet, rácsot rajzolja –
+  batch futásnál ezek felépítése (Figure, Axes, Text-ek, legend) a chartidő jelentős része,
+- sablon módban (YAML: `template: true`) a save_column / save_bar / save_radar (v1 és v2) az első hívásnál a
+  szokásos módon épít, és eltárolja a figure-t a frissítő és a befejező (layout + mentés) lépéssel; a további
+  hívások csak frissítenek és befejeznek. A kimenet bájtra azonos a frissen épített chartéval.
+
+KULCS: a chart típusa + minden nem-adat paraméter (címkék, stílus, méret, formázás...) + az adat-sorozatok megléte és
+hossza + az rcParams ujjlenyomata (más theme → más sablon). Szálanként külön tár (egy figure-t egyszerre csak egy
+szál rajzolhat), legfeljebb MAX_TEMPLATES sablonnal (a legrégebben használt esik ki).
+
+MEMÓRIA: egy sablon a figure-rel együtt az utolsó rajzolás Agg rendererét is őrzi (a szöveg-artistok hivatkoznak
+rá) – 300 DPI-s, 10×10 cm-es chartnál kb. 5-6 MB, így szálanként legfeljebb ~100 MB.
+"""
+from __future__ import annotations
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+MAX_TEMPLATES = 16
+
+# a kimenet helyét adó paraméterek: partnerenként mások, de a figure-t nem befolyásolják
+_PATH_PARAMS = ("filename", "out_dir")
+
+_LOCAL = threading.local()
+
+
+@dataclass
+class ChartTemplate:
+    fig: Any
+    update: Callable[..., None]   # update(**adat) → az adat-artistok frissítése
+    finish: Callable[[Path], Path]  # layout + mentés a megadott útvonalra
+
+
+def _store() -> OrderedDict[str, ChartTemplate]:
+    store = getattr(_LOCAL, "templates", None)
+    if store is None:
+        store = _LOCAL.templates = OrderedDict()
+    return store
+
+
+def _jsonable(value: Any) -> Any:
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    return repr(value)
+
+
+def _rc_fingerprint() -> str:
+    import matplotlib as mpl
+    # dict.items: a nyers értékek, az RcParams kulcsonkénti validálása / deprecation-ellenőrzése nélkül
+    return hashlib.sha256(repr(sorted(dict.items(mpl.rcParams))).encode("utf-8")).hexdigest()
+
+
+def template_key(kind: str, params: dict[str, Any], data_keys: Iterable[str]) -> str:
+    """A sablon kulcsa: a nem-adat paraméterek (fájlnév / mappa nélkül) + az adat-sorozatok alakja + az rcParams."""
+    data_keys = set(data_keys)
+    static = {k: v for k, v in params.items() if k not in data_keys and k not in _PATH_PARAMS}
+    shape = {k: (None if params.get(k) is None else len(params[k])) for k in sorted(data_keys)}
+    blob = json.dumps([kind, static, shape, _rc_fingerprint()], sort_keys=True, ensure_ascii=False, default=_jsonable)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def get_template(key: str) -> ChartTemplate | None:
+    store = _store()
+    tpl = store.get(key)
+    if tpl is not None:
+        store.move_to_end(key)
+    return tpl
+
+
+def put_template(key: str, tpl: ChartTemplate) -> None:
+    store = _store()
+    store[key] = tpl
+    store.move_to_end(key)
+    while len(store) > MAX_TEMPLATES:
+        store.popitem(last=False)
+
+
+def clear_templates() -> None:
+    """Az aktuális szál sablonjainak eldobása (pl. theme-váltás vagy egy batch vége után)."""
+    _store().clear()
+
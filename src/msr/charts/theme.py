@@ -1,9 +1,15 @@
+import threading
 from pathlib import Path
 import matplotlib.pyplot as plt
 from matplotlib import font_manager as fm
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 
 DEFAULT_DPI = 300
 
+# Chart kimeneti formátumok: png (raszter, DEFAULT_DPI) vagy svg (vektoros – kisebb, gyorsabb, a PDF-ben éles marad)
+CHART_FORMATS = ("png", "svg")
+
 # ─────────────────────────────────────────────────────────
 # Brand palette (tükör a brand.css-hez)
 # ─────────────────────────────────────────────────────────
@@ -16,17 +22,11 @@ DEFAULT_PALETTE: dict[str, str] = {
     "background": "#EEEEEE",
 }
 
-def ensure_rubik_font() -> None:
-    """Regisztrálja a Rubik TTF(eke)t Matplotlibhez, ha megtalálja (idempotens)."""
-    # Ha már Rubik az aktív család, kilépünk
-    fam = plt.rcParams.get("font.family")
-    if fam == "Rubik" or fam == ["Rubik"]:
-        return
-
-    # Lehetséges helyek (Regular/Variable + BOLD!)
+def rubik_font_candidates() -> list[Path]:
+    """A Rubik TTF-ek lehetséges helyei (Regular/Variable + BOLD!) – a chart cache kulcsához is ezeket nézzük."""
     here = Path(__file__).resolve()
     project_root = here.parents[3]  # .../src/msr/charts -> projekt gyökér
-    candidates = [
+    return [
         # local/ alatt
         project_root / "local" / "assets" / "fonts" / "Rubik" / "Rubik-Bold.ttf",
         project_root / "local" / "assets" / "fonts" / "Rubik" / "Rubik-Regular.ttf",
@@ -37,17 +37,44 @@ def ensure_rubik_font() -> None:
         project_root / "templates" / "assets" / "fonts" / "Rubik" / "Rubik-VariableFont_wght.ttf",
     ]
 
-    found_any = False
-    for p in candidates:
-        try:
-            if p.exists():
-                fm.fontManager.addfont(str(p))
-                found_any = True
-        except Exception:
-            pass
+# processzenkénti egyszeri inicializálás eredményei
+_RUBIK_FILES: list[Path] | None = None        # a megtalált (és a fontManager-be regisztrált) Rubik fájlok
+_LAST_RC: tuple[dict, dict] | None = None     # (kért rcParams, a validált értékek a beállítás után)
+_INIT_LOCK = threading.RLock()                # a globális font/rcParams írások szálak közötti sorosítása
+
+def register_rubik_fonts() -> list[Path]:
+    """
+    A Rubik TTF-ek keresése és regisztrálása (fm.fontManager.addfont) – processzenként EGYSZER; az eredmény cache-elt,
+    a v2 engine is ezt használja. Visszaadja a regisztrált fájlokat (üres lista → nincs Rubik, marad a DejaVu).
+    """
+    global _RUBIK_FILES
+    if _RUBIK_FILES is None:
+        with _INIT_LOCK:
+            if _RUBIK_FILES is None:
+                found: list[Path] = []
+                for p in rubik_font_candidates():
+                    try:
+                        if p.exists():
+                            fm.fontManager.addfont(str(p))
+                            found.append(p)
+                    except Exception:
+                        pass
+                _RUBIK_FILES = found
+    return _RUBIK_FILES
+
+def ensure_rubik_font() -> None:
+    """Regisztrálja a Rubik TTF(eke)t Matplotlibhez, ha megtalálja (idempotens, a keresés processzenként egyszer fut)."""
+    # Ha már Rubik az aktív család, kilépünk
+    fam = plt.rcParams.get("font.family")
+    if fam == "Rubik" or fam == ["Rubik"]:
+        return
 
     # Ha találtunk legalább egy Rubik fájlt, állítsuk be alapértelmezettnek
-    if found_any:
+    if not register_rubik_fonts():
+        # Nem találtuk – marad a fallback (DejaVu)
+        # (Ha szeretnél, ide tehetsz console logot is.)
+        return
+    with _INIT_LOCK:
         plt.rcParams["font.family"] = "Rubik"
         # opcionálisan: a sans-serif lista elejére is betesszük
         try:
@@ -57,16 +84,26 @@ def ensure_rubik_font() -> None:
             plt.rcParams["font.sans-serif"] = ["Rubik", *[x for x in ss if x != "Rubik"]]
         except Exception:
             pass
-    else:
-        # Nem találtuk – marad a fallback (DejaVu)
-        # (Ha szeretnél, ide tehetsz console logot is.)
-        pass
+
+def apply_rc_once(params: dict) -> None:
+    """
+    rcParams.update csak akkor, ha a kért téma eltér a legutóbb beállítottól, vagy azóta valaki felülírta
+    (az update minden kulcsot validál – chartonként hívva ez fölösleges munka).
+    A processz-globális rcParams-ot írja: egy másik szálban épp futó, más theme-ű renderelést is átállít (new_figure).
+    """
+    global _LAST_RC
+    if _LAST_RC is not None and _LAST_RC[0] == params:
+        if all(plt.rcParams.get(k) == v for k, v in _LAST_RC[1].items()):
+            return
+    with _INIT_LOCK:
+        plt.rcParams.update(params)
+        _LAST_RC = (dict(params), {k: plt.rcParams[k] for k in params})
 
 def apply_minimal_theme(*args, **kwargs) -> None:
-    """Visszafogott (grid és fölös spines nélkül) + brand színezés és Rubik font."""
+    """Visszafogott (grid és fölös spines nélkül) + brand színezés és Rubik font. Ismételt hívásnál nem csinál semmit."""
     ensure_rubik_font()
     pal = DEFAULT_PALETTE
-    plt.rcParams.update({
+    apply_rc_once({
         "text.color": pal["text"],
         "axes.labelcolor": pal["text"],
         "axes.titleweight": "bold",
@@ -87,7 +124,42 @@ def apply_minimal_theme(*args, **kwargs) -> None:
         # legenda keret nélkül
         "legend.frameon": False,
         "legend.fontsize": 8,
+        # SVG: fix hash-só → determinisztikus elem-azonosítók (chart cache, journal hash)
+        "svg.hashsalt": SVG_HASHSALT,
     })
 
+SVG_HASHSALT = "msr-report"
+
+def chart_filename(filename: str, image_format: str | None) -> str:
+    """
+    A fájlnév kiterjesztése a kért formátumhoz igazítva ('format: svg' a YAML-ben, globálisan vagy chartonként).
+    image_format=None → a fájlnév marad (a savefig a kiterjesztésből dönt, alapból png).
+    """
+    if not image_format:
+        return filename
+    fmt = str(image_format).lower().lstrip(".")
+    if fmt not in CHART_FORMATS:
+        raise ValueError(f"Ismeretlen chart formátum: {image_format!r} (lehetséges: {', '.join(CHART_FORMATS)})")
+    return str(Path(filename).with_suffix(f".{fmt}"))
+
+def savefig_options(path) -> dict:
+    """Formátumfüggő savefig paraméterek: SVG-nél dátum nélküli metaadat (azonos chart → azonos bájtok)."""
+    return {"metadata": {"Date": None}} if str(path).lower().endswith(".svg") else {}
+
+def new_figure(figsize: tuple[float, float], dpi: float = DEFAULT_DPI, *, polar: bool = False, **fig_kw):
+    """
+    Figure + Agg canvas pyplot nélkül: nem kerül a pyplot globális figure-listájába (nem kell plt.close, nem szivárog).
+    SZÁLAK: a figure maga szálbiztos, az rcParams (font, alap theme) viszont processz-globális, és az artistok
+    létrehozáskor abból olvasnak. Szálakból párhuzamosan renderelni CSAK egyetlen, rögzített theme mellett szabad:
+    a v1 (apply_minimal_theme) és a v2 (msr_v2.theme.apply_theme), illetve két eltérő alap-Style egyszerre futó
+    renderelése egymás rcParams-át írja felül (a _INIT_LOCK csak az írásokat sorosítja, a renderelés közbeni
+    olvasást nem; az rc_context is ugyanazt a globális szótárt cseréli). Vegyes theme-ű párhuzamos renderelésre
+    a processz-pool (msr.charts.parallel / msr_v2.parallel) való.
+    """
+    fig = Figure(figsize=figsize, dpi=dpi, **fig_kw)
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot(projection="polar" if polar else None)
+    return fig, ax
+
 def cm_to_in(cm: float) -> float:
     return cm / 2.54
\ No newline at end of file
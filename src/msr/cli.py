@@ -8,21 +8,21 @@ parancsok:
 - pdf-from-html: HTML -> PDF konvertálás
 - pages-validate: riport struktúra bemutatása
 - render-structure: teljes riport a YAML-manifesztből
+- charts-batch: több partner chartjai egy futásban (--shard i/n több gépes futáshoz)
+- batch-manifest-merge: a shard-manifesztek összefésülése
+- v2-render: a v2 chart engine partnerenkénti (párhuzamosítható) futtatása
 """
-import typer, yaml
+import typer
 from rich.console import Console
 from pathlib import Path
 
 console = Console()
 
-# belső segédek
+# belső segédek – a nehéz modulokat (pandas, matplotlib, playwright, jinja) csak a parancsok töltik be,
+# így a `msr --help`, `doctor`, `pages-validate` nem fizeti meg a teljes rajzoló-stack importját
 from .utils.paths import local_path, ensure_dir, local_root
-from .utils.templating import format_tree
-from .data.manifest import load_structure, summarize
-from .commands.utils import resolve_brand_css_paths
-from .commands import rendering as R
-from .commands import charts as C
-from .commands.charts_from_yaml import charts_from_yaml
+from .commands.charts_from_yaml import charts_from_yaml, charts_batch, batch_manifest_merge
+from .commands.v2_render import v2_render
 
 
 app = typer.Typer(help="msr-report – riport generátor")
@@ -69,6 +69,7 @@ def doctor() -> None:
 # ──────────────────────────────────────────────────────────────
 @app.command("pdf-from-html")
 def cmd_pdf_from_html(file: str = typer.Argument(..., help="HTML fájl neve a local/output/html alatt")):
+    from .commands import rendering as R
     R.pdf_from_html(file)
 
 
@@ -77,6 +78,7 @@ def cmd_pdf_from_html(file: str = typer.Argument(..., help="HTML fájl neve a lo
 # ──────────────────────────────────────────────────────────────
 @app.command("render-cover-demo")
 def cmd_render_cover_demo():
+    from .commands import rendering as R
     R.render_cover_demo()
 
 
@@ -85,6 +87,7 @@ def cmd_render_cover_demo():
 # ──────────────────────────────────────────────────────────────
 @app.command("render-content-demo")
 def cmd_render_content_demo():
+    from .commands import rendering as R
     R.render_content_demo()
 
 
@@ -93,6 +96,7 @@ def cmd_render_content_demo():
 # ──────────────────────────────────────────────────────────────
 @app.command("render-cover-and-content-demo")
 def cmd_render_cover_and_content_demo():
+    from .commands import rendering as R
     R.render_cover_and_content_demo()
 
 
@@ -102,9 +106,10 @@ def cmd_render_cover_and_content_demo():
 @app.command("charts-demo")
 def cmd_charts_demo(
     xlsx: str = typer.Option("data/input/MCC demo eredmények.xlsx",
-                             help="Excel helye (relatív a local/ gyökeréhez)"),
+                             help="Excel / Parquet / CSV helye (relatív a local/ gyökeréhez)"),
     partner_id: str | None = typer.Option(None, help="Kiemelendő PartnerId (STRING)…"),
 ):
+    from .commands import charts as C
     C.charts_demo(xlsx=xlsx, partner_id=partner_id)
 
 
@@ -113,6 +118,7 @@ def cmd_charts_demo(
 # ──────────────────────────────────────────────────────────────
 @app.command("render-thanks")
 def cmd_render_thanks():
+    from .commands import rendering as R
     R.render_thanks()
 
 
@@ -127,7 +133,22 @@ def cmd_render_structure(
     partner_id: str | None = typer.Option(
         None, "--partner-id", help="Helyettesítő változó a YAML-ben (pl. {partner})."
     ),
+    charts_config: str | None = typer.Option(
+        None, help="Assignment YAML (local/ alatt): a partner chartjai memóriában készülnek és a HTML-be ágyazódnak "
+                   "(lemezre írás nélkül). --partner-id kell hozzá.",
+    ),
+    xlsx_path: str = typer.Option(
+        "data/input/Egyedi reportok adatbázis_2024_anonim.xlsm",
+        help="A --charts-config forrása (.xlsm / .parquet / .csv, relatív a local/ gyökeréhez).",
+    ),
+    pid_col: str = typer.Option("ResponseID", help="Azonosító oszlop neve az Adatbázis sheeten."),
 ):
+    from .commands import rendering as R
+    if charts_config:
+        if not partner_id:
+            raise typer.BadParameter("A --charts-config mellé --partner-id is kell.")
+        R.render_structure_with_charts(struct_path, partner_id, charts_config, xlsx_path, pid_col=pid_col)
+        return
     fmt_ctx = {"partner": partner_id} if partner_id else None
     R.render_structure(struct_path, fmt_ctx=fmt_ctx)
 
@@ -136,6 +157,21 @@ def cmd_render_structure(
 # ──────────────────────────────────────────────────────────────
 app.command("charts-from-yaml")(charts_from_yaml)
 
+# ──────────────────────────────────────────────────────────────
+# több partner chartjai egy futásban (workbook egyszer betöltve)
+# ──────────────────────────────────────────────────────────────
+app.command("charts-batch")(charts_batch)
+
+# ──────────────────────────────────────────────────────────────
+# shard-manifesztek összefésülése (több gépes batch futás után)
+# ──────────────────────────────────────────────────────────────
+app.command("batch-manifest-merge")(batch_manifest_merge)
+
+# ──────────────────────────────────────────────────────────────
+# v2 chart engine: partnerenként, közvetlenül a local/output/assets/<partner_id>/ mappába
+# ──────────────────────────────────────────────────────────────
+app.command("v2-render")(v2_render)
+
 
 # ──────────────────────────────────────────────────────────────
 # oldalszerkezet ellenőrzése (YAML) – csak listáz
@@ -149,6 +185,8 @@ def pages_validate(struct_path: str = typer.Option(
     Beolvassa a local/config/report_structure.yaml fájlt és kilistázza az oldalakat:
     sorszám, típus (COVER/CONTENT), és a címek kivonata.
     """
+    from .data.manifest import load_structure, summarize
+
     # 1) betöltés
     path = Path(struct_path) if struct_path else None
     struct = load_structure(path)
@@ -4,6 +4,8 @@ console = Console()
 
 import pandas as pd
 from ..utils.paths import local_path
+from ..data.index import PartnerIndex
+from ..data.sources import read_table
 from ..charts.bar import save_column, save_bar
 from ..charts.radar import save_radar
 
@@ -12,7 +14,7 @@ from ..charts.table import save_partner_group_table
 def charts_demo(
     xlsx: str = typer.Option(
         "data/input/MCC demo eredmények.xlsx",
-        help="Excel helye (relatív a local/ gyökeréhez)",
+        help="Excel / Parquet / CSV helye (relatív a local/ gyökeréhez)",
     ),
     partner_id: str | None = typer.Option(
         None,
@@ -27,21 +29,22 @@ def charts_demo(
     # 1) adat betöltése
     xls_path = local_path(*xlsx.split("/"))
     if not xls_path.exists():
-        console.print(f"[red]Nem találom az Excelt:[/red] {xls_path}")
+        console.print(f"[red]Nem találom a forrásfájlt:[/red] {xls_path}")
         raise typer.Exit(code=1)
 
-    df = pd.read_excel(xls_path, sheet_name=0)
+    df = read_table(xlsx, sheet_name=0)
     metric_cols = [c for c in df.columns if c.lower().startswith("kérdés")]
     if not metric_cols:
-        console.print("[red]Nem találtam 'Kérdés*' oszlopokat az Excelben.[/red]")
+        console.print("[red]Nem találtam 'Kérdés*' oszlopokat a forrásban.[/red]")
         raise typer.Exit(code=1)
 
     # Partner kiválasztás
     pid_col = "PartnerId"
-    row = df.loc[df[pid_col].astype(str) == str(partner_id)] if partner_id else pd.DataFrame()
-    if row.empty:
+    pos = PartnerIndex(df, pid_col).position(partner_id) if partner_id else None
+    if pos is None:
         console.print(f"[yellow]Figyelem:[/yellow] nincs ilyen PartnerId: {partner_id!r}, az első sort használom.")
-        row = df.iloc[[0]]
+        pos = 0
+    row = df.iloc[[pos]]
     pid_for_title = str(row[pid_col].iloc[0])
 
 
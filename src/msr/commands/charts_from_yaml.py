@@ -1,24 +1,75 @@
 from __future__ import annotations
+import time
+from typing import TYPE_CHECKING
 import typer
 from rich.console import Console
-import pandas as pd
 
-from ..data.loaders import load_workbook
-from ..config.assignment_yaml import load_assignment_yaml
-from ..charts.assignment import render_pages_from_yaml
+# a CLI ezt a modult mindig importálja (a Typer az opciókat a szignatúrából olvassa) → itt csak könnyű importok;
+# a pandas / matplotlib / workbook-olvasás a parancsok törzsében töltődik be
+from ..data.shards import parse_shard, select_shard, write_shard_manifest, merge_manifests
+from ..utils.paths import local_path
+
+if TYPE_CHECKING:
+    from ..data.index import PartnerIndex
+    from ..data.meta import WorkbookMeta
 
 console = Console()
 
-def _resolve_row_index(db: pd.DataFrame, partner_id: str, pid_col: str) -> int:
-    idx = db.index[db[pid_col].astype(str) == str(partner_id)]
-    if len(idx) == 0:
-        raise typer.BadParameter(f"Nincs ilyen {pid_col}: {partner_id!r}")
-    return int(idx[0])
+def _partner_index(meta: WorkbookMeta, pid_col: str) -> PartnerIndex:
+    try:
+        return meta.partner_index(pid_col)
+    except KeyError as e:
+        raise typer.BadParameter(str(e.args[0]))
+
+def _resolve_row_index(index: PartnerIndex, partner_id: str) -> int:
+    row = index.row_index(partner_id)
+    if row is None:
+        raise typer.BadParameter(f"Nincs ilyen {index.pid_col}: {partner_id!r}")
+    return int(row)
+
+def _print_timings(timings: dict[str, float]) -> None:
+    """Betöltési idők kiírása (snapshotból, vagy megnyitás + sheetenként)."""
+    if "cache" in timings:
+        console.print(f"[dim]betöltés: snapshotból {timings['cache']:.2f} s[/dim]")
+        return
+    parts = [f"{('megnyitás' if k == 'open' else k)} {v:.2f} s" for k, v in timings.items()]
+    console.print(f"[dim]betöltés: {' | '.join(parts)}[/dim]")
+
+def render_partner_charts(
+    xlsx_path: str,
+    config_path: str,
+    partner_id: str,
+    *,
+    pid_col: str = "ResponseID",
+    cache: bool = True,
+    streaming: bool | None = None,
+    chart_cache=None,
+) -> dict[str, dict[str, list]]:
+    """
+    Egy partner chartjai az assignment YAML szerint (forrás betöltése + render_pages_from_yaml); a charts-from-yaml
+    és a render-structure --charts-config is ezt hívja. Aktív memória-sinknél a chartok a sinkbe kerülnek.
+    """
+    from ..data.sources import load_source
+    from ..data.meta import WorkbookMeta
+    from ..config.assignment_yaml import load_assignment_yaml, required_columns
+    from ..charts.assignment import render_pages_from_yaml
+
+    cfg = load_assignment_yaml(config_path)
+    # csak a YAML által hivatkozott oszlopokat töltjük be (metrikák + párjaik + azonosító)
+    usecols = required_columns(cfg, id_cols=[pid_col])
+    timings: dict[str, float] = {}
+    ddf, db = load_source(xlsx_path, usecols=usecols, use_cache=cache, streaming=streaming, timings=timings)
+    _print_timings(timings)
+    meta = WorkbookMeta(db, ddf)
+    row_index = _resolve_row_index(_partner_index(meta, pid_col), partner_id)
+    return render_pages_from_yaml(
+        db=db, ddf=ddf, row_index=row_index, config=cfg, partner_id=partner_id, meta=meta, chart_cache=chart_cache,
+    )
 
 def charts_from_yaml(
     xlsx_path: str = typer.Option(
         "data/input/Egyedi reportok adatbázis_2024_anonim.xlsm",
-        help="Forrás .xlsm (relatív a local/ gyökeréhez).",
+        help="Forrás .xlsm / .parquet / .csv (relatív a local/ gyökeréhez; Parquet/CSV mellé <név>.dict.* dictionary).",
     ),
     config_path: str = typer.Option(
         "config/assignment.yaml",
@@ -26,13 +77,294 @@ def charts_from_yaml(
     ),
     partner_id: str = typer.Option(..., help="Partner azonosító (pl. P01203012)."),
     pid_col: str = typer.Option("ResponseID", help="Azonosító oszlop neve az Adatbázis sheeten."),
+    cache: bool = typer.Option(True, "--cache/--no-cache", help="Bináris workbook-snapshot használata (a forrás mellett)."),
+    streaming: bool | None = typer.Option(
+        None, "--streaming/--no-streaming",
+        help="Soronkénti (read-only) Excel-beolvasás; alapértelmezés: automatikus a fájlméret alapján.",
+    ),
+    chart_cache: bool = typer.Option(
+        True, "--chart-cache/--no-chart-cache",
+        help="Tartalom-címzett chart cache (local/output/.chart-cache/): változatlan chartot nem renderelünk újra.",
+    ),
 ) -> None:
-    ddf, db = load_workbook(xlsx=xlsx_path)
-    row_index = _resolve_row_index(db, partner_id, pid_col)
-    cfg = load_assignment_yaml(config_path)
-    res = render_pages_from_yaml(db=db, ddf=ddf, row_index=row_index, config=cfg, partner_id=partner_id)
+    from ..charts.chart_cache import ChartCache
+
+    started = time.time()
+    cc = ChartCache() if chart_cache else None
+    res = render_partner_charts(
+        xlsx_path, config_path, partner_id, pid_col=pid_col, cache=cache, streaming=streaming, chart_cache=cc,
+    )
+    if cc is not None:
+        console.print(f"[dim]chart cache: {cc.hits} találat, {cc.misses} renderelve[/dim]")
+        _prune_chart_cache(cc)
+    _prune_shared(started)
 
     for page_id, buckets in res.items():
         for kind, paths in buckets.items():
             for p in paths:
-                console.print(f"[green]OK[/green] {page_id}/{kind}: {p}")
\ No newline at end of file
+                console.print(f"[green]OK[/green] {page_id}/{kind}: {p}")
+
+
+def _prune_chart_cache(cc) -> None:
+    """A chart cache méretkorlát (ChartCache.max_bytes) alá csökkentése a futás végén."""
+    removed = cc.prune()
+    if removed:
+        console.print(f"[dim]chart cache: {removed} régi kép törölve (méretkorlát)[/dim]")
+
+
+def _prune_shared(started: float) -> None:
+    """A már egyetlen partner-fájl által sem hivatkozott kohorsz-fájlok törlése (a futás előttiek közül)."""
+    from ..charts.assignment import prune_shared
+
+    removed = prune_shared(older_than=started)
+    if removed:
+        console.print(f"[dim]{removed} elárvult kohorsz-fájl törölve (assets/*/shared/)[/dim]")
+
+
+def _read_partner_ids_file(path: str) -> list[str]:
+    """Soronként egy azonosító (local/ gyökérhez relatív fájl); üres és '#'-os sorokat kihagyjuk."""
+    f = local_path(*path.split("/"))
+    if not f.exists():
+        raise typer.BadParameter(f"Nem található a partner-lista: {f}")
+    ids = []
+    for line in f.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if line and not line.startswith("#"):
+            ids.append(line)
+    return ids
+
+
+def select_partner_ids(
+    index: PartnerIndex,
+    partner_ids: str | None = None,
+    partner_ids_file: str | None = None,
+) -> list[str]:
+    """
+    Batch partner-kiválasztás:
+    - partner_ids: vesszővel elválasztott lista, vagy 'all'
+    - partner_ids_file: soronként egy azonosító
+    - ha egyik sincs megadva: az összes (nem üres) azonosító a sheet sorrendjében
+    """
+    ids: list[str] = []
+    if partner_ids and partner_ids.strip().lower() != "all":
+        ids.extend(x.strip() for x in partner_ids.split(",") if x.strip())
+    if partner_ids_file:
+        ids.extend(_read_partner_ids_file(partner_ids_file))
+    if not ids:
+        ids = list(index.ids())
+    # duplikátumok kiszűrése, sorrendtartóan
+    return list(dict.fromkeys(ids))
+
+
+def charts_batch(
+    xlsx_path: str = typer.Option(
+        "data/input/Egyedi reportok adatbázis_2024_anonim.xlsm",
+        help="Forrás .xlsm / .parquet / .csv (relatív a local/ gyökeréhez; Parquet/CSV mellé <név>.dict.* dictionary).",
+    ),
+    config_path: str = typer.Option(
+        "config/assignment.yaml",
+        help="Assignment YAML (relatív a local/ gyökeréhez).",
+    ),
+    partner_ids: str | None = typer.Option(
+        None, help="Vesszővel elválasztott azonosítók, vagy 'all'. Alapértelmezés: mind.",
+    ),
+    partner_ids_file: str | None = typer.Option(
+        None, help="Partner-lista fájl (soronként egy azonosító, relatív a local/ gyökeréhez).",
+    ),
+    pid_col: str = typer.Option("ResponseID", help="Azonosító oszlop neve az Adatbázis sheeten."),
+    cache: bool = typer.Option(True, "--cache/--no-cache", help="Bináris workbook-snapshot használata (a forrás mellett)."),
+    streaming: bool | None = typer.Option(
+        None, "--streaming/--no-streaming",
+        help="Soronkénti (read-only) Excel-beolvasás; alapértelmezés: automatikus a fájlméret alapján.",
+    ),
+    chart_cache: bool = typer.Option(
+        True, "--chart-cache/--no-chart-cache",
+        help="Tartalom-címzett chart cache (local/output/.chart-cache/): változatlan chartot nem renderelünk újra.",
+    ),
+    workers: int = typer.Option(
+        1, min=0, help="Párhuzamos render processzek száma (1 = soros, 0 = annyi, ahány CPU mag).",
+    ),
+    max_tasks_per_worker: int = typer.Option(
+        200, min=0, help="Párhuzamos futásnál ennyi feladat után a worker újraindul (0 = nincs limit).",
+    ),
+    max_worker_mem: int = typer.Option(
+        0, min=0, help="Worker memória-plafon MB-ban: fölötte a worker a feladata után újraindul (0 = nincs).",
+    ),
+    shard: str | None = typer.Option(
+        None, help="Csak az i/n szelet renderelése (pl. 2/4) – a partner ID stabil hash-e alapján, több gépes futáshoz.",
+    ),
+    resume: bool = typer.Option(
+        True, "--resume/--no-resume",
+        help="A journal szerint kész és friss partnerek kihagyása (local/output/journal/); --no-resume: mindent újra.",
+    ),
+) -> None:
+    """
+    Több partner chartjai egy futásban: a workbookot és a YAML-t EGYSZER töltjük be,
+    majd partnerenként csak a renderelés fut (render_pages_from_yaml).
+    A legyártott fájlokat shard-manifesztbe írjuk: local/output/manifests/charts-batch.shard-<i>-of-<n>.json
+    (több gépes futás után: msr batch-manifest-merge).
+    Több partnernél a {partner} nélküli chart-fájlnevek partnerenkénti utótagot kapnak (radar.png → radar_<id>.png),
+    hogy a partnerek ne írják felül egymás fájlját.
+    A kész partnereket append-only journal rögzíti (bemeneti kulcs + kimeneti hash-ek) – egy megszakadt futás
+    újraindításakor csak a hiányzó vagy elavult partnerek renderelődnek újra.
+    """
+    from ..data.sources import load_source
+    from ..data.meta import WorkbookMeta
+    from ..config.assignment_yaml import load_assignment_yaml, required_columns
+    from ..charts.assignment import render_pages_from_yaml, plan_run, partner_scoped_config, is_partner_scoped
+    from ..charts.parallel import iter_render_parallel
+    from ..charts.pool import PoolStats, close_leaked_figures
+    from ..charts.chart_cache import ChartCache, environment_key
+    from ..data.journal import JobJournal, config_key, context_key, partner_input_key
+
+    try:
+        shard_spec = parse_shard(shard)
+    except ValueError as e:
+        raise typer.BadParameter(str(e))
+    started = time.time()
+    cfg = load_assignment_yaml(config_path)
+    usecols = required_columns(cfg, id_cols=[pid_col])
+    timings: dict[str, float] = {}
+    ddf, db = load_source(xlsx_path, usecols=usecols, use_cache=cache, streaming=streaming, timings=timings)
+    _print_timings(timings)
+    # workbook-szintű metaadat: párok, label map, partner-index – minden partner közösen használja
+    meta = WorkbookMeta(db, ddf)
+    index = _partner_index(meta, pid_col)
+    if index.duplicates:
+        console.print(
+            f"[yellow]Figyelem:[/yellow] {len(index.duplicates)} duplikált {pid_col} – az első előfordulást használjuk."
+        )
+    ids = select_partner_ids(index, partner_ids, partner_ids_file)
+    total = len(ids)
+    if total > 1:
+        # a {partner} nélküli fájlnévvel minden partner ugyanazt a fájlt írná felül → partnerenkénti utótag
+        cfg, renamed = partner_scoped_config(cfg)
+        if renamed:
+            console.print(
+                f"[yellow]Figyelem:[/yellow] {{partner}} nélküli fájlnév(ek) – partnerenkénti utótaggal írjuk: "
+                f"{', '.join(renamed)}"
+            )
+    # partner-független kimeneti útvonalat (egy partneres futásnál maradhat) a journal nem tud partnerenként ellenőrizni
+    paths_scoped = all(is_partner_scoped(spec.get("filename")) for _, spec in plan_run(cfg)[0])
+    if shard_spec != (1, 1):
+        ids = select_shard(ids, shard_spec)
+        console.print(f"[bold]Shard {shard_spec[0]}/{shard_spec[1]}:[/bold] {len(ids)} / {total} partner")
+    console.print(f"[bold]Batch:[/bold] {len(ids)} partner, forrás: {xlsx_path}")
+
+    todo: list[tuple[str, int]] = []
+    skipped: list[str] = []
+    for partner_id in ids:
+        try:
+            row_index = _resolve_row_index(index, partner_id)
+        except typer.BadParameter as e:
+            console.print(f"[yellow]Kihagyva:[/yellow] {e}")
+            skipped.append(partner_id)
+            continue
+        todo.append((partner_id, row_index))
+
+    produced: dict[str, list] = {}
+    journal = JobJournal("charts-batch", shard=shard_spec)
+    cfg_k = config_key(cfg)
+    # a címkeszótár vagy a chart-kód / theme változása is elavulttá teszi a kész partnereket
+    ctx_k = context_key(meta.label_map, environment_key())
+    input_keys = {pid: partner_input_key(db, index.position(pid), cfg_k, ctx_k) for pid, _ in todo}
+    if resume:
+        pending: list[tuple[str, int]] = []
+        for partner_id, row_index in todo:
+            prev = journal.completed(partner_id, "charts", input_keys[partner_id])
+            if prev is None:
+                pending.append((partner_id, row_index))
+            else:
+                produced[partner_id] = prev
+        if len(pending) < len(todo):
+            console.print(f"[dim]journal: {len(todo) - len(pending)} partner kész és friss – kihagyva[/dim]")
+    else:
+        pending = list(todo)
+
+    unjournaled: list[str] = []
+
+    def _report(partner_id: str, res: dict) -> None:
+        # ugyanaz a chart több oldalon is szerepelhet – a manifesztbe fájlonként egyszer kerül
+        files = list(dict.fromkeys(p for buckets in res.values() for paths in buckets.values() for p in paths))
+        produced[partner_id] = files
+        if not (paths_scoped and journal.record(partner_id, "charts", input_keys[partner_id], files)):
+            # a kimenet nem függ a partnertől / egy másik partneré is → partnerenként nem ellenőrizhető
+            unjournaled.append(partner_id)
+        console.print(f"[green]OK[/green] {partner_id}: {len(files)} fájl")
+
+    def _leak(label: str, n: int) -> None:
+        console.print(f"[yellow]Figyelem:[/yellow] {label}: {n} nyitva maradt matplotlib figure (lezárva)")
+
+    done = 0
+    stats = PoolStats()
+    cc = ChartCache() if chart_cache else None
+    plan = plan_run(cfg)  # oldalak közt ismétlődő chartok összevonása – egyszer, az egész futásra
+    with journal:
+        if workers != 1 and pending:
+            # processz-pool: a workerek egyszer inicializálnak (Agg, font, theme, metaadat), utána sok partnert renderelnek;
+            # N feladat után / memória-plafon fölött újraindulnak
+            partners = [(partner_id, index.position(partner_id)) for partner_id, _ in pending]
+            for partner_id, res in iter_render_parallel(
+                db=db, ddf=ddf, config=cfg, partners=partners, pid_col=pid_col, workers=workers or None,
+                max_tasks_per_worker=max_tasks_per_worker, max_worker_rss_mb=max_worker_mem,
+                on_leak=_leak, stats=stats, chart_cache_dir=(cc.dir if cc is not None else None),
+            ):
+                _report(partner_id, res)
+                done += 1
+            console.print(
+                f"[dim]workerek: {stats.started_workers} indítva, {stats.recycled} újraindítva, "
+                f"{stats.crashed} elhalt; csúcs RSS {stats.peak_rss / 2**20:.0f} MB; "
+                f"szivárgó figure: {stats.leaked_figures}[/dim]"
+            )
+        else:
+            for partner_id, row_index in pending:
+                res = render_pages_from_yaml(
+                    db=db, ddf=ddf, row_index=row_index, config=cfg, partner_id=partner_id, meta=meta,
+                    chart_cache=cc, plan=plan,
+                )
+                leaked = close_leaked_figures()
+                if leaked:
+                    _leak(partner_id, leaked)
+                _report(partner_id, res)
+                done += 1
+            if cc is not None:
+                console.print(f"[dim]chart cache: {cc.hits} találat, {cc.misses} renderelve[/dim]")
+
+    if cc is not None:
+        _prune_chart_cache(cc)
+    _prune_shared(started)
+    if unjournaled:
+        console.print(
+            f"[yellow]Figyelem:[/yellow] {len(unjournaled)} partner kimeneti útvonala nem függ a partnertől – "
+            f"nem került a journalba (a fájlnévbe tegyél {{partner}}-t): {', '.join(unjournaled[:5])}"
+            + (" ..." if len(unjournaled) > 5 else "")
+        )
+    manifest = write_shard_manifest(
+        "charts-batch", shard_spec,
+        partners={pid: produced[pid] for pid, _ in todo if pid in produced},
+        skipped=skipped,
+        info={"source": xlsx_path, "config": config_path, "pid_col": pid_col},
+    )
+    console.print(f"[dim]manifeszt: {manifest}[/dim]")
+    console.print(f"[bold green]Kész![/bold green] {done} partner renderelve, {len(skipped)} kihagyva.")
+
+
+def batch_manifest_merge(
+    name: str = typer.Option("charts-batch", help="A manifeszt neve (local/output/manifests/<name>.shard-*-of-*.json)."),
+    allow_partial: bool = typer.Option(False, "--allow-partial", help="Hiányzó shardok esetén is sikeres kilépés."),
+) -> None:
+    """Több gépes (sharded) batch futás shard-manifesztjeinek összefésülése: <name>.json."""
+    try:
+        out, merged = merge_manifests(name)
+    except ValueError as e:
+        console.print(f"[red]Hiba:[/red] {e}")
+        raise typer.Exit(code=1)
+    console.print(
+        f"[green]OK[/green] {len(merged['shards'])}/{merged['shard_count']} shard, "
+        f"{len(merged['partners'])} partner → {out}"
+    )
+    if merged["missing_shards"]:
+        missing = ", ".join(f"{i}/{merged['shard_count']}" for i in merged["missing_shards"])
+        console.print(f"[yellow]Hiányzó shardok:[/yellow] {missing}")
+        if not allow_partial:
+            raise typer.Exit(code=1)
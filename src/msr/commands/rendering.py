@@ -1,5 +1,5 @@
 import typer
-from typing import Any
+from typing import Any, TYPE_CHECKING
 from rich.console import Console
 console = Console()
 
@@ -13,6 +13,9 @@ from .utils import resolve_brand_css_paths
 
 from ..utils.templating import format_tree
 
+if TYPE_CHECKING:
+    from ..charts.sink import MemorySink
+
 
 def render_cover_demo() -> None:
     """
@@ -274,12 +277,39 @@ def render_thanks() -> None:
     console.print("→ PDF:  msr pdf-from-html thanks.html")
 
 
+# ──────────────────────────────────────────────────────────────
+# teljes riport + a partner chartjai memória-sinkben (lemezre írás nélkül)
+# ──────────────────────────────────────────────────────────────
+def render_structure_with_charts(
+    struct_path: str | None,
+    partner_id: str,
+    charts_config: str,
+    xlsx_path: str,
+    pid_col: str = "ResponseID",
+    cache: bool = True,
+    streaming: bool | None = None,
+) -> None:
+    """
+    A partner chartjait (charts_config assignment YAML) MemorySink-be rendereli, és ugyanabban a blokkban
+    a render_structure data URI-ként ágyazza be őket: a local/output/assets/ alá nem kerül chart-fájl.
+    A chart cache itt nem fut (az a lemezre írna); a workbook-snapshot (cache) igen.
+    """
+    from ..charts.sink import MemorySink
+    from .charts_from_yaml import render_partner_charts
+
+    with MemorySink() as sink:
+        render_partner_charts(xlsx_path, charts_config, partner_id, pid_col=pid_col, cache=cache, streaming=streaming)
+        console.print(f"[dim]memória-sink: {len(sink)} chart[/dim]")
+        render_structure(struct_path, fmt_ctx={"partner": partner_id}, sink=sink)
+
+
 # ──────────────────────────────────────────────────────────────
 # teljes riport renderelése YAML-ből (több COVER is támogatott)
 # ──────────────────────────────────────────────────────────────
 def render_structure(
     struct_path: str | None = None,
     fmt_ctx: dict[str, Any] | None = None,
+    sink: "MemorySink | None" = None,
 ) -> None:
     """
     Beolvassa a report_structure.yaml-t és a teljes decket egyben rendereli:
@@ -287,8 +317,13 @@ def render_structure(
     - 'content' oldalak a megszokott fejléc/logó/layout logikával.
     - Oldalszámozás: minden slide beleszámít, de csak a content oldalak JELENÍTIK MEG.
       (page_number = page_config.start + slide_index; a cover is számít, csak nem látszik rajta.)
+    - sink: memória-sink (msr.charts.sink) – az ott lévő chartok data URI-ként ágyazódnak be, lemez nélkül
+      (None → az éppen aktív sink, ha van; különben a szokásos fájl-feloldás).
     Kimenet: local/output/html/report_structure.html
     """
+    from ..charts.sink import active_sink
+    sink = sink if sink is not None else active_sink()
+
     # 1) CSS ellenőrzés
     css_paths = resolve_brand_css_paths()
     if not css_paths:
@@ -326,6 +361,13 @@ def render_structure(
         """
         if not rel:
             return rel
+        # memória-sink: a generált chart nincs a lemezen, data URI-ként ágyazzuk be
+        if sink is not None:
+            parts = [p for p in rel.split("/") if p]
+            for cand in (_lp(rel), local_path("output", *parts)):
+                uri = sink.data_uri(cand)
+                if uri is not None:
+                    return uri
         # try as-is under local/
         img = _lp(rel)
         if not img.exists():
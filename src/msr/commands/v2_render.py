@@ -0,0 +1,122 @@
+from __future__ import annotations
+import typer
+from rich.console import Console
+
+from ..data.shards import parse_shard, select_shard, write_shard_manifest
+from ..utils.paths import local_path
+from .charts_from_yaml import _partner_index, _print_timings, select_partner_ids
+
+console = Console()
+
+
+def v2_render(
+    xlsx_path: str = typer.Option(
+        "data/input/Egyedi reportok adatbázis_2024_anonim.xlsm",
+        help="Forrás .xlsm / .parquet / .csv (relatív a local/ gyökeréhez; Parquet/CSV mellé <név>.dict.* dictionary).",
+    ),
+    config_path: str = typer.Option(
+        "config/assignment_v2.yaml",
+        help="v2 chart YAML (relatív a local/ gyökeréhez).",
+    ),
+    partner_ids: str | None = typer.Option(
+        None, help="Vesszővel elválasztott azonosítók, vagy 'all'. Alapértelmezés: mind.",
+    ),
+    partner_ids_file: str | None = typer.Option(
+        None, help="Partner-lista fájl (soronként egy azonosító, relatív a local/ gyökeréhez).",
+    ),
+    limit: int = typer.Option(0, min=0, help="Csak az első N partner (0 = nincs korlát)."),
+    pid_col: str = typer.Option("ResponseID", help="Azonosító oszlop neve az Adatbázis sheeten."),
+    workers: int = typer.Option(
+        1, min=0, help="Párhuzamos render processzek száma (1 = soros, 0 = annyi, ahány CPU mag).",
+    ),
+    max_tasks_per_worker: int = typer.Option(
+        200, min=0, help="Párhuzamos futásnál ennyi partner után a worker újraindul (0 = nincs limit).",
+    ),
+    max_worker_mem: int = typer.Option(
+        0, min=0, help="Worker memória-plafon MB-ban: fölötte a worker a feladata után újraindul (0 = nincs).",
+    ),
+    shard: str | None = typer.Option(
+        None, help="Csak az i/n szelet renderelése (pl. 2/4) – a partner ID stabil hash-e alapján.",
+    ),
+    cache: bool = typer.Option(True, "--cache/--no-cache", help="Bináris workbook-snapshot használata (a forrás mellett)."),
+) -> None:
+    """
+    v2 chart engine: a YAML-ben leírt chartok partnerenként, közvetlenül a local/output/assets/<partner_id>/ mappába
+    (nincs közös mappába renderelés + áthelyezés). A workbook és a YAML egyszer töltődik be.
+    """
+    from msr_v2.assign import render_from_yaml
+    from msr_v2.parallel import iter_render_parallel
+    from ..data.sources import load_source
+    from ..data.meta import WorkbookMeta
+    from ..charts.pool import PoolStats, close_leaked_figures
+    from ..config.assignment_yaml import load_assignment_yaml, required_columns
+
+    try:
+        shard_spec = parse_shard(shard)
+    except ValueError as e:
+        raise typer.BadParameter(str(e))
+
+    yaml_path = local_path(*config_path.split("/"))
+    cfg = load_assignment_yaml(config_path)
+    usecols = required_columns(cfg, id_cols=[pid_col])
+    timings: dict[str, float] = {}
+    ddf, db = load_source(xlsx_path, usecols=usecols, use_cache=cache, timings=timings)
+    _print_timings(timings)
+
+    meta = WorkbookMeta(db, ddf)
+    index = _partner_index(meta, pid_col)
+    ids = select_partner_ids(index, partner_ids, partner_ids_file)
+    if shard_spec != (1, 1):
+        ids = select_shard(ids, shard_spec)
+    if limit:
+        ids = ids[:limit]
+
+    todo: list[str] = []
+    skipped: list[str] = []
+    for partner_id in ids:
+        if partner_id in index:
+            todo.append(partner_id)
+        else:
+            console.print(f"[yellow]Kihagyva:[/yellow] Nincs ilyen {pid_col}: {partner_id!r}")
+            skipped.append(partner_id)
+    console.print(f"[bold]v2 render:[/bold] {len(todo)} partner, forrás: {xlsx_path}")
+
+    out_root = local_path("output", "assets")
+    produced: dict[str, list] = {}
+
+    def _report(partner_id: str, paths: list) -> None:
+        produced[partner_id] = list(paths)
+        console.print(f"[green]OK[/green] {partner_id}: {len(paths)} fájl → {out_root / partner_id}")
+
+    def _leak(label: str, n: int) -> None:
+        console.print(f"[yellow]Figyelem:[/yellow] {label}: {n} nyitva maradt matplotlib figure (lezárva)")
+
+    if workers != 1 and todo:
+        stats = PoolStats()
+        for partner_id, paths in iter_render_parallel(
+            yaml_path, db=db, partners=[(p, index.position(p)) for p in todo], pid_col=pid_col,
+            workers=workers or None, max_tasks_per_worker=max_tasks_per_worker, max_worker_rss_mb=max_worker_mem,
+            on_leak=_leak, stats=stats, config=cfg, out_root=out_root,
+        ):
+            _report(partner_id, paths)
+        console.print(
+            f"[dim]workerek: {stats.started_workers} indítva, {stats.recycled} újraindítva, "
+            f"{stats.crashed} elhalt; csúcs RSS {stats.peak_rss / 2**20:.0f} MB[/dim]"
+        )
+    else:
+        for partner_id in todo:
+            paths = render_from_yaml(
+                yaml_path, db=db, row_index=index.row_index(partner_id), partner_id=partner_id, meta=meta,
+                config=cfg, out_dir=out_root / partner_id,
+            )
+            leaked = close_leaked_figures()
+            if leaked:
+                _leak(partner_id, leaked)
+            _report(partner_id, paths)
+
+    manifest = write_shard_manifest(
+        "v2-render", shard_spec, partners=produced, skipped=skipped,
+        info={"source": xlsx_path, "config": config_path, "pid_col": pid_col},
+    )
+    console.print(f"[dim]manifeszt: {manifest}[/dim]")
+    console.print(f"[bold green]Kész![/bold green] {len(produced)} partner renderelve, {len(skipped)} kihagyva.")
@@ -1,5 +1,6 @@
 from __future__ import annotations
 from pathlib import Path
+from typing import Iterable, Iterator
 import yaml
 from ..utils.paths import local_path
 
@@ -9,4 +10,42 @@ def load_assignment_yaml(path: str = "config/assignment.yaml") -> dict:
     if not cfg_path.exists():
         raise FileNotFoundError(f"Assignment YAML nem található: {cfg_path}")
     with cfg_path.open("r", encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
\ No newline at end of file
+        return yaml.safe_load(f) or {}
+
+def iter_chart_specs(cfg: dict) -> Iterator[dict]:
+    """
+    Az assignment összes chart-specifikációja, sémától függetlenül:
+    - v1: { pages: [ { charts: [...] }, ... ] }
+    - gyökér-szintű / v2: { charts: [...] }
+    """
+    for page in cfg.get("pages") or []:
+        for ch in (page or {}).get("charts") or []:
+            if isinstance(ch, dict):
+                yield ch
+    for ch in cfg.get("charts") or []:
+        if isinstance(ch, dict):
+            yield ch
+
+
+def required_columns(
+    cfg: dict,
+    *,
+    id_cols: Iterable[str] = ("ResponseID",),
+    default_suffix: str = "_átlag",
+) -> list[str]:
+    """
+    Tervezési lépés: mely 'Adatbázis' oszlopokra van ténylegesen szükség a chartokhoz.
+    - az azonosító oszlop(ok),
+    - minden chart 'metrics' listája,
+    - pair módnál a metrika + compare_suffix (alap: '_átlag') párja is.
+    A sorrend stabil (első előfordulás), duplikátum nélkül.
+    """
+    cols: dict[str, None] = {str(c): None for c in id_cols}
+    for ch in iter_chart_specs(cfg):
+        pair = (ch.get("source_type") or "").strip().lower() == "pair"
+        suffix = ch.get("compare_suffix") or default_suffix
+        for m in ch.get("metrics") or []:
+            cols.setdefault(str(m), None)
+            if pair:
+                cols.setdefault(f"{m}{suffix}", None)
+    return list(cols)
@@ -0,0 +1,97 @@
+"""
+Bináris pillanatkép (pickle) a beolvasott munkafüzet sheetjeiről.
+
+GONDOLAT:
+- az .xlsm openpyxl-es parse-olása másodpercekig tart, a pickle visszatöltése töredék ennyi,
+- a snapshot a munkafüzet MELLÉ kerül (.<fájlnév>.msrcache.pkl), így a local/ alatt marad (git-ignored),
+- frissességi kulcs: abszolút út + méret + mtime + tartalom-hash (sha256);
+  ha bármelyik eltér, a snapshot elavult → újra parse-olunk és felülírjuk.
+"""
+from __future__ import annotations
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Iterable
+
+# ha a snapshot szerkezete változik, ezt léptetjük → a régi fájlok automatikusan elavulnak
+CACHE_VERSION = 1
+
+_HASH_CHUNK = 1 << 20  # 1 MiB
+
+
+def file_sha256(path: Path) -> str:
+    """A fájl tartalmának sha256 hash-e (darabolva olvasva, hogy nagy fájlnál se fogyjon a memória)."""
+    h = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def workbook_fingerprint(path: Path) -> dict[str, Any]:
+    """Út + méret + mtime + tartalom-hash – ez a snapshot kulcsa."""
+    st = path.stat()
+    return {
+        "version": CACHE_VERSION,
+        "path": str(path.resolve()),
+        "size": st.st_size,
+        "mtime_ns": st.st_mtime_ns,
+        "sha256": file_sha256(path),
+    }
+
+
+def variant_key(parts: Iterable[str] | None) -> str | None:
+    """Rövid, stabil azonosító egy beolvasási változathoz (pl. oszlop-projekció) – None: teljes sheet."""
+    if parts is None:
+        return None
+    joined = "\x1f".join(sorted(str(p) for p in parts))
+    return hashlib.sha256(joined.encode("utf-8")).hexdigest()[:12]
+
+
+def cache_path_for(path: Path, variant: str | None = None) -> Path:
+    """
+    local/data/input/db.xlsm → local/data/input/.db.xlsm.msrcache.pkl
+    variant megadásakor külön fájl: .db.xlsm.<variant>.msrcache.pkl (így a projekciók nem írják felül egymást).
+    """
+    if variant:
+        return path.with_name(f".{path.name}.{variant}.msrcache.pkl")
+    return path.with_name(f".{path.name}.msrcache.pkl")
+
+
+def load_cached(path: Path, fingerprint: dict[str, Any], variant: str | None = None) -> Any | None:
+    """
+    Visszaadja a snapshotban tárolt adatot, ha a kulcs egyezik; különben None.
+    Sérült/olvashatatlan snapshot esetén is None (ilyenkor egyszerűen újra parse-olunk).
+    """
+    cp = cache_path_for(path, variant)
+    if not cp.exists():
+        return None
+    try:
+        with cp.open("rb") as f:
+            payload = pickle.load(f)
+    except Exception:
+        return None
+    if not isinstance(payload, dict) or payload.get("key") != fingerprint:
+        return None
+    return payload.get("data")
+
+
+def store_cached(path: Path, fingerprint: dict[str, Any], data: Any, variant: str | None = None) -> Path | None:
+    """
+    Snapshot írása atomikusan (tmp fájl + os.replace), hogy párhuzamos futások ne lássanak félkész fájlt.
+    Ha a mappa nem írható, csendben kihagyjuk – a cache csak gyorsítás, nem feltétel.
+    """
+    cp = cache_path_for(path, variant)
+    tmp = cp.with_name(f"{cp.name}.{os.getpid()}.tmp")
+    try:
+        with tmp.open("wb") as f:
+            pickle.dump({"key": fingerprint, "data": data}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, cp)
+        return cp
+    except OSError:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+        return None
@@ -0,0 +1,55 @@
+"""
+Partner-index: azonosító (string) → sor pozíció, egyszer felépítve egy betöltött workbookra.
+
+MIÉRT KELL:
+- a `db[pid_col].astype(str) == str(partner_id)` minden hívásnál a teljes oszlopot castolja és összehasonlítja,
+  ez batch futásnál partnerenként O(N) → összesen O(N²),
+- itt egyetlen menetben felépítünk egy dict-et, utána minden keresés O(1).
+"""
+from __future__ import annotations
+from typing import Any, Iterator
+import pandas as pd
+
+
+class PartnerIndex:
+    """
+    ID string → sor pozíció (iloc) és index-címke (loc) leképezés.
+    - az azonosítót ugyanúgy stringesítjük, mint korábban (astype(str)), hiányzó (NaN) értéket kihagyunk,
+    - duplikált azonosítónál az ELSŐ előfordulás nyer (a régi viselkedés), a többit a `duplicates` rögzíti.
+    """
+
+    def __init__(self, db: pd.DataFrame, pid_col: str = "ResponseID") -> None:
+        if pid_col not in db.columns:
+            raise KeyError(f"Nincs ilyen azonosító oszlop az Adatbázis sheeten: {pid_col!r}")
+        self.pid_col = pid_col
+        self._labels = db.index
+        self._pos: dict[str, int] = {}
+        self.duplicates: dict[str, list[int]] = {}
+
+        col = db[pid_col]
+        notna = col.notna().to_numpy()
+        for pos, (pid, ok) in enumerate(zip(col.astype(str).tolist(), notna)):
+            if not ok:
+                continue
+            first = self._pos.setdefault(pid, pos)
+            if first != pos:
+                self.duplicates.setdefault(pid, [first]).append(pos)
+
+    def __len__(self) -> int:
+        return len(self._pos)
+
+    def __contains__(self, partner_id: object) -> bool:
+        return str(partner_id) in self._pos
+
+    def ids(self) -> Iterator[str]:
+        """Az azonosítók a sheet sorrendjében (duplikátum nélkül)."""
+        return iter(self._pos)
+
+    def position(self, partner_id: Any) -> int | None:
+        """Sor pozíció (db.iloc-hoz), vagy None, ha nincs ilyen azonosító."""
+        return self._pos.get(str(partner_id))
+
+    def row_index(self, partner_id: Any) -> Any | None:
+        """Index-címke (db.loc-hoz), vagy None, ha nincs ilyen azonosító."""
+        pos = self.position(partner_id)
+        return None if pos is None else self._labels[pos]
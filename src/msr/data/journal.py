@@ -0,0 +1,168 @@
+"""
+Append-only job journal (JSONL) a folytatható batch futásokhoz.
+
+GONDOLAT:
+- minden kész partner/szakasz (stage) egy sort kap: bemeneti kulcs + a legyártott fájlok sha256 hash-e,
+- újrafuttatáskor a partnert kihagyjuk, ha a bemeneti kulcsa ugyanaz ÉS minden kimenete megvan változatlanul;
+  ami hiányzik vagy elavult (változott az adatsora / a YAML / a kimeneti fájl), az újra lefut,
+- a bemeneti kulcs partnerenkénti: a partner (kivetített) adatsora + a normalizált YAML config + csomagverzió –
+  így egy munkafüzet-frissítés csak az érintett partnereket rendereli újra; a futás-szintű környezet (a "Változó info"
+  címkéi, a chart-kód és a theme – context_key) változása viszont minden partnert elavulttá tesz,
+- a fájl csak bővül (soronként flush), így egy elhalt futás után is olvasható; a csonka utolsó sort kihagyjuk,
+- egy kimeneti fájl csak EGY partneré lehet: ha a partner kimenete egy másik partnernél is szerepel (a fájlnév nem
+  függ a partnertől), a record nem rögzíti – a hash-ellenőrzés ilyenkor minden futásban elbukna, és a partner
+  sosem lenne "kész".
+
+Hely: local/output/journal/<név>.shard-<i>-of-<n>.jsonl – shardonként külön fájl (egy író / fájl),
+olvasáskor viszont az összes <név>.*.jsonl-t betöltjük, így a shardszám változása sem veszíti el a kész munkát.
+"""
+from __future__ import annotations
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Any, Sequence
+import pandas as pd
+
+from ..utils.paths import local_path, ensure_dir, relative_to_local
+from .cache import file_sha256
+
+JOURNAL_VERSION = 1
+
+
+def _package_version() -> str:
+    try:
+        from importlib.metadata import version
+        return version("msr-report")
+    except Exception:
+        return "0"
+
+
+def config_key(cfg: Any) -> str:
+    """A (YAML-ből betöltött) config normalizált hash-e – a kulcssorrend és a formázás nem számít."""
+    blob = json.dumps(cfg, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def context_key(label_map: dict[str, str], env_key: str) -> str:
+    """
+    A futás minden partnerére közös bemenetek hash-e: a "Változó info" label map (chart-címek, tengelyfeliratok)
+    és a renderelés környezete (chart_cache.environment_key: chart-modulok forrása, theme, fontok, verziók).
+    """
+    blob = json.dumps([sorted(label_map.items()), env_key], ensure_ascii=False, default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def partner_input_key(db: pd.DataFrame, position: int, cfg_key: str, ctx_key: str = "") -> str:
+    """Egy partner bemeneti kulcsa: az adatsora (a kivetített oszlopokkal) + config + közös környezet + verziók."""
+    row = db.iloc[int(position)]
+    payload = json.dumps(
+        [JOURNAL_VERSION, _package_version(), cfg_key, ctx_key, [str(c) for c in row.index], row.tolist()],
+        ensure_ascii=False, default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class JobJournal:
+    """
+    journal = JobJournal("charts-batch", shard=(1, 1))
+    if journal.completed(pid, "charts", key) is None: ... render ... journal.record(pid, "charts", key, paths)
+    """
+
+    def __init__(self, name: str, *, shard: tuple[int, int] = (1, 1), directory: Path | None = None) -> None:
+        self.name = name
+        self.dir = directory or local_path("output", "journal")
+        i, n = shard
+        self.path = self.dir / f"{name}.shard-{i}-of-{n}.jsonl"
+        self._entries: dict[tuple[str, str], dict] = {}
+        self._owners: dict[tuple[str, str], str] = {}  # (stage, kimenet) → partner
+        self._fh = None
+        self._load()
+
+    def _load(self) -> None:
+        if not self.dir.exists():
+            return
+        for f in sorted(self.dir.glob(f"{self.name}.*.jsonl")):
+            with f.open(encoding="utf-8") as fh:
+                for line in fh:
+                    try:
+                        e = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # csonka sor (megszakadt írás)
+                    if e.get("version") != JOURNAL_VERSION:
+                        continue
+                    prev = self._entries.get((e["partner"], e["stage"]))
+                    if prev is None or e.get("ts", 0) >= prev.get("ts", 0):
+                        self._put(e)
+
+    def _put(self, entry: dict) -> None:
+        partner, stage = entry["partner"], entry["stage"]
+        prev = self._entries.get((partner, stage))
+        if prev is not None:
+            for rel in prev.get("outputs", {}):
+                if self._owners.get((stage, rel)) == partner:
+                    del self._owners[(stage, rel)]
+        self._entries[(partner, stage)] = entry
+        for rel in entry.get("outputs", {}):
+            self._owners[(stage, rel)] = partner
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def completed(self, partner_id: str, stage: str, input_key: str, *, verify: bool = True) -> list[Path] | None:
+        """
+        A korábbi futás kimenetei, ha a partner/stage kész és friss; különben None.
+        verify=True: a kimeneti fájlok tartalmát is ellenőrizzük (sha256), nem csak a létezésüket.
+        """
+        e = self._entries.get((str(partner_id), stage))
+        if e is None or e.get("input") != input_key:
+            return None
+        paths: list[Path] = []
+        for rel, digest in e.get("outputs", {}).items():
+            p = Path(rel)
+            p = p if p.is_absolute() else local_path(*p.parts)
+            if not p.exists():
+                return None
+            if verify and file_sha256(p) != digest:
+                return None
+            paths.append(p)
+        return paths
+
+    def shared_outputs(self, partner_id: str, stage: str, outputs: Sequence[Path | str]) -> list[str]:
+        """A kimenetek közül azok, amelyeket a journal szerint egy MÁSIK partner is legyártott (local/-relatív út)."""
+        rels = [relative_to_local(p) for p in dict.fromkeys(outputs)]
+        return [r for r in rels if self._owners.get((stage, r), str(partner_id)) != str(partner_id)]
+
+    def record(self, partner_id: str, stage: str, input_key: str, outputs: Sequence[Path | str]) -> bool:
+        """
+        Kész partner/stage hozzáfűzése a journalhoz (azonnal flush-olva). False (és nincs bejegyzés), ha valamelyik
+        kimenet egy másik partneré is (shared_outputs) – az ilyen partner minden futásban újra renderelődik.
+        """
+        if self.shared_outputs(partner_id, stage, outputs):
+            return False
+        entry = {
+            "version": JOURNAL_VERSION,
+            "partner": str(partner_id),
+            "stage": stage,
+            "input": input_key,
+            "outputs": {relative_to_local(p): file_sha256(Path(p)) for p in dict.fromkeys(outputs)},
+            "ts": time.time(),
+        }
+        if self._fh is None:
+            ensure_dir(self.dir)
+            self._fh = self.path.open("a", encoding="utf-8")
+        self._fh.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._fh.flush()
+        self._put(entry)
+        return True
+
+    def close(self) -> None:
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+    def __enter__(self) -> "JobJournal":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -1,20 +1,89 @@
 from __future__ import annotations
+import time
+from typing import Iterable
 import pandas as pd
 from ..utils.paths import local_path
+from .cache import workbook_fingerprint, load_cached, store_cached, variant_key
+from .matrix import MetricMatrix
+from .streaming import read_sheets_streaming, should_stream
 
+DICT_SHEET = "Változó info"
+DB_SHEET = "Adatbázis"
 
-def load_workbook(xlsx: str = "data/input/Egyedi reportok adatbázis_2024_anonim.xlsm"):
+
+def load_workbook(
+    xlsx: str = "data/input/Egyedi reportok adatbázis_2024_anonim.xlsm",
+    *,
+    usecols: Iterable[str] | None = None,
+    use_cache: bool = True,
+    streaming: bool | None = None,
+    timings: dict[str, float] | None = None,
+):
+    """
+    A 'Változó info' (ddf) és az 'Adatbázis' (db) sheet betöltése.
+    usecols: ha meg van adva, az 'Adatbázis'-ból csak ezek az oszlopok kerülnek a DataFrame-be
+             (a hiányzókat csendben kihagyjuk) – lásd config.assignment_yaml.required_columns.
+    use_cache=True: a munkafüzet mellé írt bináris snapshotból tölt, ha az friss
+    (út + méret + mtime + tartalom-hash egyezik); különben parse-ol és frissíti a snapshotot.
+    streaming: True → soronkénti openpyxl read-only beolvasás (a kivetítéssel arányos memória), False → pd.read_excel,
+               None → automatikus: nagy fájlnál (lásd streaming.STREAMING_MIN_BYTES) streaming.
+    Mindkét sheetet a munkafüzet EGYSZERI megnyitásával olvassuk.
+    timings: ha megadod, kitöltjük a betöltési időkkel (mp): 'cache' (snapshotból),
+             vagy 'open' + sheetenként ('Változó info', 'Adatbázis').
+    """
     # védjük le: legyen biztosan string
     if not isinstance(xlsx, str):
         raise TypeError(f"xlsx must be str path, got {type(xlsx).__name__}")
 
     xls_path = local_path(*xlsx.split("/"))
 
-    # .xlsm-hez jó az openpyxl engine
-    ddf = pd.read_excel(xls_path, sheet_name="Változó info", engine="openpyxl")
-    db  = pd.read_excel(xls_path, sheet_name="Adatbázis", engine="openpyxl")
+    wanted = None if usecols is None else {str(c) for c in usecols}
+    variant = variant_key(wanted)
+
+    t_start = time.perf_counter()
+    fingerprint = workbook_fingerprint(xls_path) if use_cache else None
+    if fingerprint is not None:
+        cached = load_cached(xls_path, fingerprint, variant)
+        if cached is not None:
+            if timings is not None:
+                timings["cache"] = time.perf_counter() - t_start
+            return cached
+
+    if should_stream(xls_path, streaming):
+        frames = read_sheets_streaming(xls_path, {DICT_SHEET: None, DB_SHEET: wanted}, timings=timings)
+        ddf, db = frames[DICT_SHEET], frames[DB_SHEET]
+    else:
+        # .xlsm-hez jó az openpyxl engine; az ExcelFile egyszer nyitja meg a konténert, mindkét sheet ebből parse-ol
+        t0 = time.perf_counter()
+        with pd.ExcelFile(xls_path, engine="openpyxl") as xf:
+            t1 = time.perf_counter()
+            ddf = xf.parse(DICT_SHEET)
+            t2 = time.perf_counter()
+            db  = xf.parse(DB_SHEET, usecols=(None if wanted is None else (lambda c: str(c) in wanted)))
+            t3 = time.perf_counter()
+        if timings is not None:
+            timings.update({"open": t1 - t0, DICT_SHEET: t2 - t1, DB_SHEET: t3 - t2})
+
+    if fingerprint is not None:
+        store_cached(xls_path, fingerprint, (ddf, db), variant)
     return ddf, db
 
+def load_metric_matrix(
+    xlsx: str = "data/input/Egyedi reportok adatbázis_2024_anonim.xlsm",
+    *,
+    usecols: Iterable[str] | None = None,
+    pid_col: str = "ResponseID",
+    use_cache: bool = True,
+    streaming: bool | None = None,
+    timings: dict[str, float] | None = None,
+) -> tuple[pd.DataFrame, MetricMatrix]:
+    """
+    Mint a load_workbook, de az 'Adatbázis' helyett kompakt MetricMatrix-ot ad vissza
+    (azonosítók + float32 metrika-mátrix + NaN maszk; a dtype-konverzió itt, egyszer történik).
+    """
+    ddf, db = load_workbook(xlsx, usecols=usecols, use_cache=use_cache, streaming=streaming, timings=timings)
+    return ddf, MetricMatrix.from_frame(db, pid_col=pid_col)
+
 def label_map_from_dict(ddf: pd.DataFrame) -> dict[str, str]:
     """
     'Változó' → 'Változó neve' leképezés a dictionary sheetből.
@@ -0,0 +1,135 @@
+"""
+Kompakt adatmodell az 'Adatbázis' sheethez: azonosító tömb + metrika-név index + folytonos float32 mátrix.
+
+MIÉRT KELL:
+- a DataFrame vegyes (object) dtype-okkal tárolja az oszlopokat, a chartoknak viszont csak a numerikus
+  metrikák + az azonosító kell,
+- itt a dtype-konverzió EGYSZER történik (pd.to_numeric), utána minden chart/partner ugyanazt a mátrixot olvassa,
+- float32 + bool maszk: a memóriaigény a töredéke, és olcsón átküldhető worker processzeknek (pickle).
+
+PONTOSSÁG:
+- a float32 ~7 értékes jegyet tart meg; visszaalakításkor (as_float64 / to_frame) `restore_decimals` tizedesre
+  kerekítünk, így a kevés jegyű értékek (Likert-átlagok, 1–2 tizedes: pl. 3.35) pontosan az eredeti float64-et adják,
+- a több értékes jegyű oszlopok (pl. árbevétel: 1234.567 → float32-ben 1234.5670166) viszont NEM állnának vissza:
+  a from_frame oszloponként ellenőrzi a visszaalakítást, és ahol az nem pontos, az oszlopot float64-ként is
+  megtartja (exact) – az as_float64 / to_frame ezeknél az eredeti értéket adja. A `values` float32 blokk tehát a
+  kompakt (közelítő) nézet, az as_float64 mindig az eredeti.
+"""
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import Sequence
+import numpy as np
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class MetricMatrix:
+    ids: np.ndarray                 # (n,) azonosítók stringként
+    metrics: tuple[str, ...]        # oszlopnevek (a mátrix oszlopainak sorrendjében)
+    values: np.ndarray              # (n × k) float32, C-folytonos; hiányzó érték helyén NaN
+    mask: np.ndarray                # (n × k) bool – True, ahol az érték hiányzik / nem numerikus
+    pid_col: str = "ResponseID"
+    restore_decimals: int = 6
+    exact_cols: tuple[int, ...] = ()  # a float32-ben nem visszaállítható oszlopok indexe
+    exact: np.ndarray | None = None   # (n × len(exact_cols)) float64 – ezek eredeti értékei
+    _col: dict[str, int] = field(default_factory=dict, repr=False, compare=False)
+    _exact: dict[int, int] = field(default_factory=dict, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._col.update({m: j for j, m in enumerate(self.metrics)})
+        self._exact.update({j: e for e, j in enumerate(self.exact_cols)})
+
+    @classmethod
+    def from_frame(
+        cls,
+        db: pd.DataFrame,
+        pid_col: str = "ResponseID",
+        metrics: Sequence[str] | None = None,
+        *,
+        restore_decimals: int = 6,
+    ) -> "MetricMatrix":
+        """
+        DataFrame → kompakt mátrix.
+        - metrics=None: minden oszlop, ami numerikusra alakítható (a tisztán szöveges oszlopokat kihagyjuk)
+        - a sorok sorrendje a db sorrendje (iloc pozíció = mátrix sor)
+        - ha egy oszlop float32 → `restore_decimals` kerekítés után nem adja vissza az eredetit, float64-ként
+          is eltesszük (exact_metrics)
+        """
+        if pid_col not in db.columns:
+            raise KeyError(f"Nincs ilyen azonosító oszlop az Adatbázis sheeten: {pid_col!r}")
+        ids = db[pid_col].astype(str).to_numpy(dtype=object)
+
+        names: list[str] = []
+        cols: list[np.ndarray] = []
+        exact_cols: list[int] = []
+        exact: list[np.ndarray] = []
+        candidates = [c for c in db.columns if c != pid_col] if metrics is None else list(metrics)
+        for c in candidates:
+            if c not in db.columns:
+                continue
+            raw = db[c]
+            num = pd.to_numeric(raw, errors="coerce")
+            if metrics is None and num.isna().all() and raw.notna().any():
+                continue  # szöveges oszlop – nem metrika
+            full = num.to_numpy(dtype=np.float64, na_value=np.nan)
+            compact = full.astype(np.float32)
+            if not np.array_equal(np.round(compact.astype(np.float64), restore_decimals), full, equal_nan=True):
+                exact_cols.append(len(names))
+                exact.append(full)
+            names.append(str(c))
+            cols.append(compact)
+
+        if cols:
+            values = np.ascontiguousarray(np.column_stack(cols), dtype=np.float32)
+        else:
+            values = np.empty((len(db), 0), dtype=np.float32)
+        return cls(
+            ids=ids,
+            metrics=tuple(names),
+            values=values,
+            mask=np.isnan(values),
+            pid_col=pid_col,
+            restore_decimals=restore_decimals,
+            exact_cols=tuple(exact_cols),
+            exact=(np.column_stack(exact) if exact else None),
+        )
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.values.shape
+
+    @property
+    def nbytes(self) -> int:
+        extra = self.exact.nbytes if self.exact is not None else 0
+        return int(self.values.nbytes + self.mask.nbytes + self.ids.nbytes + extra)
+
+    @property
+    def exact_metrics(self) -> tuple[str, ...]:
+        """A float64-ként is tárolt (float32-ben nem pontosan visszaállítható) metrikák."""
+        return tuple(self.metrics[j] for j in self.exact_cols)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._col
+
+    def column_index(self, names: Sequence[str]) -> list[int]:
+        """Metrika-nevek → mátrix oszlopindexek (KeyError, ha valamelyik hiányzik)."""
+        return [self._col[n] for n in names]
+
+    def as_float64(self, names: Sequence[str] | None = None) -> np.ndarray:
+        """
+        A (kiválasztott) oszlopok float64-ként: `restore_decimals` tizedesre kerekítve, az exact oszlopoknál
+        az eredeti értékkel – az eredmény mindkét esetben pontosan a from_frame bemenete.
+        """
+        idx = list(range(len(self.metrics))) if names is None else self.column_index(names)
+        block = np.round(self.values[:, idx].astype(np.float64), self.restore_decimals)
+        for out_j, j in enumerate(idx):
+            e = self._exact.get(j)
+            if e is not None:
+                block[:, out_j] = self.exact[:, e]
+        return block
+
+    def to_frame(self) -> pd.DataFrame:
+        """Vissza DataFrame-mé (azonosító + float64 metrikák) – pl. a worker processzek oldalán."""
+        df = pd.DataFrame(self.as_float64(), columns=list(self.metrics))
+        df.insert(0, self.pid_col, self.ids)
+        return df
@@ -0,0 +1,74 @@
+"""
+Workbook-szintű metaadat: egyszer számoljuk ki, utána minden chart és minden partner újrahasznosítja.
+
+MIT TART:
+- a metrika-párokat suffixenként ({bázis: bázis_átlag}) – memoizálva,
+- a 'Változó' → 'Változó neve' label-mapet a dictionary sheetből,
+- a partner-indexet azonosító oszloponként,
+- chart-specenként a vektorizáltan kigyűjtött sorozat-mátrixokat (minden partnerre egyszerre).
+
+A db/ddf-et NEM másoljuk, csak hivatkozunk rájuk – a metaadat addig érvényes, amíg a frame-ek nem változnak.
+"""
+from __future__ import annotations
+from typing import Any, Sequence
+import pandas as pd
+
+from .loaders import find_pairs, label_map_from_dict
+from .index import PartnerIndex
+from .series import SeriesMatrix, gather_series
+from .matrix import MetricMatrix
+
+
+class WorkbookMeta:
+    def __init__(self, db: pd.DataFrame, ddf: pd.DataFrame | None = None) -> None:
+        self.db = db
+        self.ddf = ddf
+        self._pairs: dict[str, dict[str, str]] = {}
+        self._label_map: dict[str, str] | None = None
+        self._partner_index: dict[str, PartnerIndex] = {}
+        self._series: dict[tuple, SeriesMatrix] = {}
+
+    @classmethod
+    def from_matrix(cls, matrix: MetricMatrix, ddf: pd.DataFrame | None = None) -> "WorkbookMeta":
+        """
+        Kompakt MetricMatrix-ból – a db azonosító + float64 metrikák. A nem numerikus oszlopok nincsenek benne,
+        ezért a chart-renderelés (soros és párhuzamos is) a kivetített db-ből épített metát használja.
+        """
+        return cls(matrix.to_frame(), ddf)
+
+    def pairs(self, suffix: str = "_átlag") -> dict[str, str]:
+        """{bázis_oszlop: bázis+suffix oszlop} – suffixenként egyszer számolva."""
+        p = self._pairs.get(suffix)
+        if p is None:
+            p = self._pairs[suffix] = find_pairs(self.db, suffix=suffix)
+        return p
+
+    @property
+    def label_map(self) -> dict[str, str]:
+        """'Változó' → 'Változó neve' (üres, ha a dictionary sheetben nincsenek ezek az oszlopok)."""
+        if self._label_map is None:
+            self._label_map = label_map_from_dict(self.ddf) if self.ddf is not None else {}
+        return self._label_map
+
+    def partner_index(self, pid_col: str = "ResponseID") -> PartnerIndex:
+        """Partner-index az adott azonosító oszlopra – oszloponként egyszer építve."""
+        idx = self._partner_index.get(pid_col)
+        if idx is None:
+            idx = self._partner_index[pid_col] = PartnerIndex(self.db, pid_col)
+        return idx
+
+    def row_position(self, row_index: Any) -> int:
+        """db.loc címke → iloc pozíció (alap RangeIndex esetén a kettő ugyanaz)."""
+        return int(self.db.index.get_loc(row_index))
+
+    def series(self, metrics: Sequence[str], *, mode: str = "pair", suffix: str = "_átlag") -> SeriesMatrix:
+        """
+        Egy chart-spec sorozatai az ÖSSZES partnerre, egyetlen gather-rel – specenként egyszer számolva.
+        Partnerenként ezután csak `.row(pos)` kell.
+        """
+        key = (tuple(str(m) for m in metrics), mode, suffix if mode == "pair" else None)
+        sm = self._series.get(key)
+        if sm is None:
+            pairs = self.pairs(suffix) if mode == "pair" else None
+            sm = self._series[key] = gather_series(self.db, list(metrics), mode=mode, pairs=pairs)
+        return sm
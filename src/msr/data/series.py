@@ -0,0 +1,133 @@
+"""
+Vektorizált sorozat-kinyerés: egy chart-spec metrikáit EGYETLEN gather-rel szedjük ki az összes
+(vagy a kiválasztott) partnerre, NumPy mátrixként. A partnerenkénti hívás ezután csak egy sor-szelet.
+
+Korábban: partnerenként és metrikánként db.loc[row_index, col] + float(...) → Python ciklus.
+Most:     chart-specenként egy db[cols].to_numpy() → (sorok × metrikák) mátrix.
+"""
+from __future__ import annotations
+from typing import Any, Sequence
+import numpy as np
+import pandas as pd
+
+
+def _to_matrix(frame: pd.DataFrame, cols: Sequence[str]) -> np.ndarray:
+    """Numerikus (float) mátrix, ha lehet; vegyes/szöveges oszlopoknál object mátrix (az értékek érintetlenek)."""
+    sub = frame[list(cols)]
+    try:
+        return sub.to_numpy(dtype=float)
+    except (TypeError, ValueError):
+        return sub.to_numpy(dtype=object)
+
+
+class SeriesMatrix:
+    """
+    Egy chart-spec összes partnerre kigyűjtött értékei.
+    - keys:       a ténylegesen felvett metrikák (a kért sorrendben)
+    - positions:  a felvett metrikák indexe a kért 'metrics' listában (a label-ek kiválasztásához)
+    - main:       (sorok × metrikák) mátrix a partner értékekkel
+    - comp:       ugyanilyen alakú mátrix az összehasonlító (pl. '_átlag') oszlopokkal; single módnál None
+    - row_positions: ha csak kiválasztott sorokra gyűjtöttünk, ezek db-beli iloc pozíciói (különben None = mind)
+    """
+
+    def __init__(
+        self,
+        keys: Sequence[str],
+        positions: Sequence[int],
+        main: np.ndarray,
+        comp: np.ndarray | None,
+        row_positions: Sequence[int] | None = None,
+    ) -> None:
+        self.keys = tuple(keys)
+        self.positions = tuple(positions)
+        self.main = main
+        self.comp = comp
+        self.row_positions = None if row_positions is None else np.asarray(row_positions, dtype=int)
+        self._row_lookup: dict[int, int] | None = None
+        self._cohort_sizes: np.ndarray | None = None
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def _matrix_row(self, pos: int) -> int:
+        if self.row_positions is None:
+            return int(pos)
+        if self._row_lookup is None:
+            self._row_lookup = {int(p): i for i, p in enumerate(self.row_positions)}
+        try:
+            return self._row_lookup[int(pos)]
+        except KeyError:
+            raise KeyError(f"A(z) {pos}. sor nincs a kigyűjtött partnerek között.") from None
+
+    def cohort_sizes(self) -> np.ndarray:
+        """
+        Soronként: hány sor (partner) rendelkezik pontosan ugyanezekkel a sorozat-értékekkel (partner + összehasonlító).
+        Ha egy sorhoz > 1 tartozik, a chart a kohorszon belül nem változik → elég egyszer renderelni.
+        """
+        if self._cohort_sizes is None:
+            block = self.main if self.comp is None else np.hstack([self.main, self.comp])
+            n = block.shape[0]
+            if n == 0:
+                self._cohort_sizes = np.zeros(0, dtype=int)
+            elif block.dtype == object or block.shape[1] == 0:
+                rows = [repr(r) for r in block.tolist()]
+                counts: dict[str, int] = {}
+                for r in rows:
+                    counts[r] = counts.get(r, 0) + 1
+                self._cohort_sizes = np.array([counts[r] for r in rows], dtype=int)
+            else:
+                # soronként egy bájtsor (void dtype) → np.unique egyetlen vektorizált lépésben csoportosít
+                block = np.ascontiguousarray(block)
+                keys = block.view(np.dtype((np.void, block.dtype.itemsize * block.shape[1]))).ravel()
+                _, inverse, counts = np.unique(keys, return_inverse=True, return_counts=True)
+                self._cohort_sizes = counts[inverse.ravel()]
+        return self._cohort_sizes
+
+    def cohort_size(self, pos: int) -> int:
+        """Egy partner (db-beli iloc pozíció) kohorszának mérete – ennyi partnernek ugyanaz a chartja."""
+        return int(self.cohort_sizes()[self._matrix_row(pos)])
+
+    def select_labels(self, labels: Sequence[str]) -> list[str]:
+        """A teljes 'metrics' listához tartozó label-ekből a felvett metrikákéi."""
+        return [labels[i] for i in self.positions]
+
+    def row(self, pos: int) -> tuple[list[Any], list[Any] | None]:
+        """Egy partner (db-beli iloc pozíció) sorozatai: (partner_értékek, összehasonlító_vagy_None)."""
+        r = self._matrix_row(pos)
+        main = self.main[r].tolist()
+        comp = self.comp[r].tolist() if self.comp is not None else None
+        return main, comp
+
+
+def gather_series(
+    db: pd.DataFrame,
+    metrics: Sequence[str],
+    *,
+    mode: str = "pair",
+    pairs: dict[str, str] | None = None,
+    rows: Sequence[int] | None = None,
+) -> SeriesMatrix:
+    """
+    Egy chart-spec sorozatainak kigyűjtése.
+    - mode="pair":   csak az a metrika kerül be, amelynek a párja (pairs[m]) is létezik a db-ben
+    - mode="single": minden létező metrika, összehasonlítás nélkül
+    - rows:          opcionális iloc pozíciók (csak ezekre a partnerekre gyűjtünk); None → mind
+    """
+    cols = set(db.columns)
+    keys: list[str] = []
+    positions: list[int] = []
+    comp_cols: list[str] = []
+    if mode == "pair":
+        pairs = pairs or {}
+        for i, m in enumerate(metrics):
+            if m in cols and m in pairs and pairs[m] in cols:
+                keys.append(m); positions.append(i); comp_cols.append(pairs[m])
+    else:
+        for i, m in enumerate(metrics):
+            if m in cols:
+                keys.append(m); positions.append(i)
+
+    frame = db if rows is None else db.iloc[list(rows)]
+    main = _to_matrix(frame, keys)
+    comp = _to_matrix(frame, comp_cols) if mode == "pair" else None
+    return SeriesMatrix(keys, positions, main, comp, row_positions=rows)
@@ -0,0 +1,126 @@
+"""
+Determinisztikus partner-sharding több gépes batch futáshoz + shard-manifesztek.
+
+- shard "i/n" (1 ≤ i ≤ n): a partner akkor tartozik az i. shardhoz, ha sha1(partner_id) mod n == i-1.
+  A hash stabil (nem függ a Python hash seedtől, a sorrendtől vagy a partner-listától), így ugyanabból a
+  munkafüzetből minden gép koordináció nélkül ugyanazt a szeletet kapja, és a szeletek együtt pontosan lefedik az összeset.
+- minden shard egy JSON manifesztet ír a local/output/manifests/ alá (partnerenként a legyártott fájlokkal),
+  a merge_manifests() ezeket fésüli össze egyetlen manifesztté, és jelzi a hiányzó shardokat.
+"""
+from __future__ import annotations
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+from typing import Iterable, Mapping, Sequence
+
+from ..utils.paths import local_path, ensure_dir, relative_to_local
+
+MANIFEST_VERSION = 1
+_SHARD_RE = re.compile(r"^\s*(\d+)\s*/\s*(\d+)\s*$")
+
+
+def parse_shard(spec: str | None) -> tuple[int, int]:
+    """'2/4' → (2, 4); None/üres → (1, 1). ValueError hibás formátumnál."""
+    if not spec:
+        return 1, 1
+    m = _SHARD_RE.match(spec)
+    if not m:
+        raise ValueError(f"Hibás shard formátum: {spec!r} (várt: i/n, pl. 2/4)")
+    i, n = int(m.group(1)), int(m.group(2))
+    if n < 1 or not 1 <= i <= n:
+        raise ValueError(f"Hibás shard: {spec!r} (1 ≤ i ≤ n kell)")
+    return i, n
+
+
+def shard_of(partner_id: str, n: int) -> int:
+    """A partner shardja (1..n) – stabil sha1 hash alapján."""
+    if n <= 1:
+        return 1
+    digest = hashlib.sha1(str(partner_id).encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % n + 1
+
+
+def select_shard(partner_ids: Iterable[str], shard: tuple[int, int]) -> list[str]:
+    """A partner-lista i/n szelete (sorrendtartóan)."""
+    i, n = shard
+    return [p for p in partner_ids if shard_of(p, n) == i]
+
+
+def _manifest_dir() -> Path:
+    return local_path("output", "manifests")
+
+
+def shard_manifest_path(name: str, shard: tuple[int, int]) -> Path:
+    i, n = shard
+    return _manifest_dir() / f"{name}.shard-{i}-of-{n}.json"
+
+
+def write_shard_manifest(
+    name: str,
+    shard: tuple[int, int],
+    *,
+    partners: Mapping[str, Sequence[Path | str]],
+    skipped: Sequence[str] = (),
+    info: Mapping[str, object] | None = None,
+) -> Path:
+    """Shard-manifeszt írása (atomikusan): {partner_id: [fájlok]} + kihagyott azonosítók + futási infó."""
+    i, n = shard
+    data = {
+        "version": MANIFEST_VERSION,
+        "name": name,
+        "shard": {"index": i, "count": n},
+        "info": dict(info or {}),
+        "partners": {pid: [relative_to_local(p) for p in files] for pid, files in partners.items()},
+        "skipped": list(skipped),
+    }
+    path = shard_manifest_path(name, shard)
+    ensure_dir(path.parent)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+    os.replace(tmp, path)
+    return path
+
+
+def merge_manifests(name: str) -> tuple[Path, dict]:
+    """
+    A <name>.shard-*-of-*.json manifesztek összefésülése a <name>.json fájlba.
+    Visszaadja (kimeneti_útvonal, összefésült_adat); az adat 'missing_shards' listája jelzi a hiányzó szeleteket.
+    ValueError, ha nincs egy manifeszt sem, ha eltér a shardszám, vagy ha egy partner több shardban is szerepel.
+    """
+    found = sorted(_manifest_dir().glob(f"{name}.shard-*-of-*.json"))
+    if not found:
+        raise ValueError(f"Nincs shard-manifeszt: {_manifest_dir() / (name + '.shard-*-of-*.json')}")
+
+    shards = [json.loads(p.read_text(encoding="utf-8")) for p in found]
+    counts = {s["shard"]["count"] for s in shards}
+    if len(counts) != 1:
+        raise ValueError(f"Eltérő shardszámú manifesztek: {sorted(counts)} – előbb töröld a régi futás fájljait.")
+    n = counts.pop()
+
+    partners: dict[str, list[str]] = {}
+    skipped: list[str] = []
+    for s in sorted(shards, key=lambda s: s["shard"]["index"]):
+        for pid, files in s["partners"].items():
+            if pid in partners:
+                raise ValueError(f"A(z) {pid!r} partner több shardban is szerepel.")
+            partners[pid] = files
+        skipped.extend(s.get("skipped", []))
+
+    present = sorted(s["shard"]["index"] for s in shards)
+    merged = {
+        "version": MANIFEST_VERSION,
+        "name": name,
+        "shards": present,
+        "shard_count": n,
+        "missing_shards": [i for i in range(1, n + 1) if i not in present],
+        "info": shards[0].get("info", {}),
+        "partners": partners,
+        "skipped": skipped,
+    }
+    out = _manifest_dir() / f"{name}.json"
+    tmp = out.with_name(out.name + ".tmp")
+    tmp.write_text(json.dumps(merged, ensure_ascii=False, indent=2), encoding="utf-8")
+    os.replace(tmp, out)
+    return out, merged
@@ -0,0 +1,125 @@
+"""
+Forrás-réteg: a chart pipeline ugyanazzal a szemantikával olvas Excelből, Parquetből vagy CSV-ből.
+
+- Excel (.xlsx/.xlsm/.xls): 'Változó info' + 'Adatbázis' sheet (load_workbook – snapshot cache, streaming).
+- Parquet / CSV: maga a fájl az 'Adatbázis'; a 'Változó info' dictionary egy mellé tett sidecar fájl:
+      adatbazis.parquet  →  adatbazis.dict.parquet   (vagy .dict.csv)
+      adatbazis.csv      →  adatbazis.dict.csv       (vagy .dict.parquet)
+  Ha nincs sidecar, üres dictionary-vel dolgozunk (a label-ek ilyenkor a metrika-nevek).
+
+Új formátum: register_source(".ext", reader) – a reader (Path, usecols) → DataFrame.
+A Parquethez pyarrow (vagy fastparquet) kell; ez opcionális függőség, csak akkor töltjük be, ha Parquetet olvasunk.
+"""
+from __future__ import annotations
+import time
+from pathlib import Path
+from typing import Callable, Iterable
+import pandas as pd
+
+from ..utils.paths import local_path
+from .loaders import load_workbook, DICT_SHEET, DB_SHEET
+
+EXCEL_SUFFIXES = {".xlsx", ".xlsm", ".xls"}
+
+TableReader = Callable[[Path, "set[str] | None"], pd.DataFrame]
+
+
+def _read_csv(path: Path, wanted: set[str] | None) -> pd.DataFrame:
+    # utf-8-sig: a BOM-os (Excelből mentett) és a sima UTF-8 CSV is jól jön be
+    return pd.read_csv(
+        path, encoding="utf-8-sig",
+        usecols=(None if wanted is None else (lambda c: str(c) in wanted)),
+    )
+
+
+def _read_parquet(path: Path, wanted: set[str] | None) -> pd.DataFrame:
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        pq = None
+    columns = None
+    if wanted is not None and pq is not None:
+        # csak a ténylegesen létező oszlopokat kérjük (a hiányzókat csendben kihagyjuk, mint Excelnél)
+        names = pq.ParquetFile(path).schema_arrow.names
+        columns = [c for c in names if c in wanted]
+    try:
+        df = pd.read_parquet(path, columns=columns)
+    except ImportError as e:
+        raise ImportError(
+            f"Parquet olvasásához pyarrow kell: pip install pyarrow  ({path})"
+        ) from e
+    if wanted is not None and columns is None:
+        df = df[[c for c in df.columns if str(c) in wanted]]
+    return df
+
+
+_READERS: dict[str, TableReader] = {
+    ".csv": _read_csv,
+    ".parquet": _read_parquet,
+    ".pq": _read_parquet,
+}
+
+
+def register_source(suffix: str, reader: TableReader) -> None:
+    """Új (nem Excel) táblaformátum regisztrálása kiterjesztés alapján, pl. register_source('.feather', ...)."""
+    _READERS[suffix.lower()] = reader
+
+
+def _reader_for(path: Path) -> TableReader:
+    reader = _READERS.get(path.suffix.lower())
+    if reader is None:
+        supported = ", ".join(sorted(EXCEL_SUFFIXES | set(_READERS)))
+        raise ValueError(f"Nem támogatott forrásformátum: {path.name} (támogatott: {supported})")
+    return reader
+
+
+def dictionary_sidecar(path: Path) -> Path | None:
+    """adatbazis.parquet → adatbazis.dict.parquet / adatbazis.dict.csv (az első létező), különben None."""
+    for suffix in (path.suffix, *(s for s in _READERS if s != path.suffix.lower())):
+        cand = path.with_name(f"{path.stem}.dict{suffix}")
+        if cand.exists():
+            return cand
+    return None
+
+
+def read_table(source: str, *, sheet_name: str | int = 0) -> pd.DataFrame:
+    """Egyetlen tábla (pl. charts-demo): Excelnél a megadott sheet, Parquet/CSV-nél maga a fájl."""
+    path = local_path(*source.split("/"))
+    if path.suffix.lower() in EXCEL_SUFFIXES:
+        return pd.read_excel(path, sheet_name=sheet_name)
+    return _reader_for(path)(path, None)
+
+
+def load_source(
+    source: str = "data/input/Egyedi reportok adatbázis_2024_anonim.xlsm",
+    *,
+    usecols: Iterable[str] | None = None,
+    use_cache: bool = True,
+    streaming: bool | None = None,
+    timings: dict[str, float] | None = None,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    (ddf, db) betöltése a forrás kiterjesztése alapján – ugyanaz a szemantika, mint a load_workbook-nál:
+    usecols csak az 'Adatbázis'-ra vonatkozik, a hiányzó oszlopokat csendben kihagyjuk.
+    use_cache/streaming csak Excel forrásnál számít.
+    """
+    if not isinstance(source, str):
+        raise TypeError(f"source must be str path, got {type(source).__name__}")
+    path = local_path(*source.split("/"))
+    if path.suffix.lower() in EXCEL_SUFFIXES:
+        return load_workbook(source, usecols=usecols, use_cache=use_cache, streaming=streaming, timings=timings)
+
+    reader = _reader_for(path)
+    if not path.exists():
+        raise FileNotFoundError(f"Nem található a forrás: {path}")
+    wanted = None if usecols is None else {str(c) for c in usecols}
+
+    t0 = time.perf_counter()
+    sidecar = dictionary_sidecar(path)
+    ddf = _reader_for(sidecar)(sidecar, None) if sidecar else pd.DataFrame(columns=["Változó", "Változó neve"])
+    t1 = time.perf_counter()
+    db = reader(path, wanted)
+    t2 = time.perf_counter()
+    if timings is not None:
+        timings.update({DICT_SHEET: t1 - t0, DB_SHEET: t2 - t1})
+    return ddf, db
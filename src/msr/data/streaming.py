@@ -0,0 +1,148 @@
+"""
+Soronkénti (streaming) Excel-beolvasás openpyxl read-only módban, a kivetítéssel arányos memóriával.
+
+MIÉRT KELL:
+- a pd.read_excel(engine="openpyxl") a sheet MINDEN cellájából Python listát épít (cellaobjektumokon át),
+  és csak utána dob el oszlopokat (usecols) → széles, nagy sheetnél ez az RSS-csúcs,
+- itt values_only soriterátorral olvasunk, és csak a kért oszlopok értékeit tartjuk meg,
+- a sorokat STREAM_CHUNK_ROWS-os darabokban alakítjuk DataFrame-mé (TextParser), így Python cella-listában
+  egyszerre csak egy darab él; a darabok már tömör (NumPy) oszlopok. A csúcs-memória így a kivetített
+  eredmény (az összefűzés alatt kétszer) + egy darab – a sorszámmal tehát továbbra is nő, de csak a kivetített
+  oszlopok tömör méretével, nem a teljes sheettel és nem soronkénti Python-listával (az openpyxl XML-olvasója
+  ezen felül soronként néhány tíz bájtot tart meg a munkafüzet lezárásáig).
+
+A cella-konverzió és a fejléc/NaN kezelés a pandas openpyxl-olvasóját követi (TextParser), így a kapott DataFrame
+ugyanaz, mint a pd.read_excel(..., usecols=...) eredménye: ahol a darabonként kikövetkeztetett dtype-ok eltérnek
+(pl. az egyik darabban csak egész, a másikban dátum), az oszlopot az összefűzés után egyben konvertáljuk újra.
+"""
+from __future__ import annotations
+import time
+from pathlib import Path
+from typing import Any, Iterable
+
+import numpy as np
+import pandas as pd
+from pandas.io.parsers import TextParser
+
+# e fölötti fájlméretnél a load_workbook automatikusan a streaming utat választja
+STREAMING_MIN_BYTES = 20 * 1024 * 1024
+
+# ennyi sort gyűjtünk Python listában, mielőtt DataFrame-mé alakítjuk
+STREAM_CHUNK_ROWS = 5000
+
+
+def _convert(value: Any) -> Any:
+    """Mint a pandas openpyxl-olvasója: üres → "", egész értékű szám → int, Excel hibakód → NaN."""
+    from openpyxl.cell.cell import ERROR_CODES
+
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)):
+        as_int = int(value)
+        return as_int if as_int == value else float(value)
+    if isinstance(value, str) and value in ERROR_CODES:
+        return np.nan
+    return value
+
+
+def should_stream(path: Path, streaming: bool | None) -> bool:
+    """streaming=None → automatikus választás fájlméret alapján."""
+    if streaming is not None:
+        return bool(streaming)
+    try:
+        return path.stat().st_size >= STREAMING_MIN_BYTES
+    except OSError:
+        return False
+
+
+def _parse_chunk(header: list[Any], rows: list[list[Any]], **kwargs: Any) -> pd.DataFrame:
+    return TextParser([header, *rows], header=0, **kwargs).read()
+
+
+def _reparse_column(name: Any, values: pd.Series) -> pd.Series:
+    # a darabokban eltérő dtype-ú oszlop újrakonvertálása egyben (a hiányzó érték vissza üres cellává)
+    raw = [("" if v is None or (isinstance(v, float) and np.isnan(v)) or v is pd.NaT else v) for v in values.tolist()]
+    return _parse_chunk([name], [[v] for v in raw], skip_blank_lines=False).iloc[:, 0].set_axis(values.index)
+
+
+def _read_open_sheet(wb, sheet_name: str, wanted: set[str] | None, chunk_rows: int | None = None) -> pd.DataFrame:
+    chunk_rows = chunk_rows or STREAM_CHUNK_ROWS
+    ws = wb[sheet_name]
+    ws.reset_dimensions()
+    rows = ws.iter_rows(values_only=True)
+    header = next(rows, None)
+    if header is None:
+        return pd.DataFrame()
+    header = [_convert(v) for v in header]
+    keep = [i for i, h in enumerate(header) if wanted is None or str(h) in wanted]
+    names = [header[i] for i in keep]
+
+    chunks: list[pd.DataFrame] = []
+    buf: list[list[Any]] = []
+    blank = 0  # az utolsó adatsor óta látott üres sorok: a közbülsők megmaradnak, a sheet végiek nem (mint a pandasnál)
+    for row in rows:
+        n = len(row)
+        conv = [_convert(row[i]) if i < n else "" for i in keep]
+        if all(v == "" for v in conv):
+            blank += 1
+            continue
+        if blank:
+            buf.extend([""] * len(keep) for _ in range(blank))
+            blank = 0
+        buf.append(conv)
+        if len(buf) >= chunk_rows:
+            chunks.append(_parse_chunk(names, buf))
+            buf = []
+    if buf or not chunks:
+        chunks.append(_parse_chunk(names, buf))
+    if len(chunks) == 1:
+        return chunks[0]
+
+    out = pd.concat(chunks, ignore_index=True)
+    for j in range(out.shape[1]):
+        if len({str(c.dtypes.iloc[j]) for c in chunks}) > 1:
+            out.isetitem(j, _reparse_column(out.columns[j], out.iloc[:, j]))
+    return out
+
+
+def read_sheets_streaming(
+    path: Path,
+    sheets: dict[str, Iterable[str] | None],
+    timings: dict[str, float] | None = None,
+) -> dict[str, pd.DataFrame]:
+    """
+    Több sheet beolvasása a munkafüzet EGYSZERI megnyitásával (a zip-konténert csak egyszer dolgozzuk fel).
+    sheets: {sheet_név: usecols_vagy_None}
+    timings: ha megadod, sheetenként (és a megnyitásra, 'open' kulccsal) kitöltjük a másodperceket.
+    """
+    from openpyxl import load_workbook as _open_workbook
+
+    t0 = time.perf_counter()
+    wb = _open_workbook(path, read_only=True, data_only=True, keep_links=False)
+    if timings is not None:
+        timings["open"] = time.perf_counter() - t0
+    try:
+        out: dict[str, pd.DataFrame] = {}
+        for name, usecols in sheets.items():
+            t0 = time.perf_counter()
+            out[name] = _read_open_sheet(wb, name, None if usecols is None else {str(c) for c in usecols})
+            if timings is not None:
+                timings[name] = time.perf_counter() - t0
+        return out
+    finally:
+        wb.close()
+
+
+def read_sheet_streaming(
+    path: Path,
+    sheet_name: str,
+    usecols: Iterable[str] | None = None,
+) -> pd.DataFrame:
+    """
+    Egy sheet beolvasása soronként; az első sor a fejléc.
+    usecols: csak ezek a (fejléc szerinti) oszlopok kerülnek be; None → mind.
+    Megjegyzés: a sheet végén lévő (a kivetített oszlopokban) üres sorokat kihagyjuk, a közbülsők NaN sorként maradnak.
+    """
+    return read_sheets_streaming(path, {sheet_name: usecols})[sheet_name]
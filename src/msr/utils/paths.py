@@ -4,6 +4,7 @@ Egyetlen forráshely az útvonal-logikának. Ha később kell valami extra (pl.
 - repo_root(): a repó gyökere
 - local_root(): a ./local mappa a repó gyökerében (vagy MSR_LOCAL_ROOT környezeti változóval felülírható)
 - ensure_dir(), local_path(): kényelmi függvények
+- relative_to_local(): útvonal a local/ gyökérhez képest (manifesztekhez, journalhoz)
 """
 from __future__ import annotations
 from pathlib import Path
@@ -30,3 +31,11 @@ def ensure_dir(path: Path) -> Path:
 def local_path(*segments: str) -> Path:
     #Rövidítő: local_path("output","pdf") → <repo>/local/output/pdf (vagy az override-olt útvonal).
     return local_root().joinpath(*segments)
+
+def relative_to_local(path: Path | str) -> str:
+    # a local/ gyökérhez relatív (posix) útvonal, ha alatta van – így gépek között is összevethető; különben változatlan
+    p = Path(path)
+    try:
+        return p.resolve().relative_to(local_root().resolve()).as_posix()
+    except ValueError:
+        return str(p)
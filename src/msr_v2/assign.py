@@ -8,20 +8,12 @@ import pandas as pd
 
 from .config import Style
 from .theme import apply_theme
+from msr.charts.theme import chart_filename
 from .charts.bar import save_bar
 from .charts.column import save_column
 from .charts.radar import save_radar
 from .charts.table import save_table
-
-# Egyszerű párosító: "X" -> "X{suffix}" ha létezik
-def _find_pairs(db: pd.DataFrame, suffix: str) -> dict[str, str]:
-    cols = set(db.columns)
-    pairs = {}
-    for c in db.columns:
-        cand = f"{c}{suffix}"
-        if cand in cols:
-            pairs[c] = cand
-    return pairs
+from msr.data.meta import WorkbookMeta
 
 def _series_for_metrics(
     db: pd.DataFrame,
@@ -30,22 +22,18 @@ def _series_for_metrics(
     *,
     mode: str,                # "single" | "pair"
     compare_suffix: str = "_átlag",
+    meta: WorkbookMeta | None = None,  # workbook-szintű cache: párok + vektorizált sorozat-mátrixok
 ) -> tuple[list[str], list[float], Optional[list[float]]]:
-    labels = [str(m) for m in metrics]
+    # a metrikák értékeit a meta egyszerre, az összes partnerre gyűjti ki; itt csak a sort szeleteljük
+    # ("X" -> "X{suffix}" párosítás, ha mindkét oszlop létezik)
+    meta = meta if meta is not None else WorkbookMeta(db)
+    sm = meta.series(metrics, mode=mode, suffix=compare_suffix)
+    main, comp = sm.row(meta.row_position(row_index))
+    labs = [str(m) for m in sm.keys]
+    vals_main = [float(v) for v in main]
     if mode == "single":
-        vals = [float(db.loc[row_index, m]) for m in metrics if m in db.columns]
-        return labels, vals, None
-    # pair
-    pairs = _find_pairs(db, compare_suffix)
-    vals_main: list[float] = []
-    vals_comp: list[float] = []
-    labs: list[str] = []
-    for m in metrics:
-        if m in db.columns and m in pairs and pairs[m] in db.columns:
-            labs.append(m)
-            vals_main.append(float(db.loc[row_index, m]))
-            vals_comp.append(float(db.loc[row_index, pairs[m]]))
-    return labs, vals_main, vals_comp
+        return labs, vals_main, None
+    return labs, vals_main, [float(v) for v in comp]
 
 def _fmt_filename(name: str, partner_id: str | None) -> str:
     if not name:
@@ -63,8 +51,17 @@ def render_from_yaml(
     db: pd.DataFrame,
     row_index: int,
     partner_id: str | None = None,
+    meta: WorkbookMeta | None = None,
+    config: dict | None = None,
+    out_dir: Path | None = None,
 ):
-    cfg = yaml.safe_load(Path(yaml_path).read_text())
+    """
+    config:  előre betöltött YAML (batch futásnál egyszer olvassuk be); None → a yaml_path-ból olvassuk
+    out_dir: ide kerül minden chart és tábla (pl. local/output/assets/<partner_id>/); None → a közös mappák
+    """
+    cfg = config if config is not None else yaml.safe_load(Path(yaml_path).read_text())
+    # workbook-szintű cache (párok, sorozat-mátrixok) – batch futásnál a meta kívülről jön, partnerek között közös
+    meta = meta if meta is not None else WorkbookMeta(db)
 
     # 1) Globális stílus
     base_style = Style()
@@ -76,7 +73,11 @@ def render_from_yaml(
     # 2) Chartok
     for ch in cfg.get("charts", []):
         typ = (ch.get("type") or "").strip().lower()
-        filename = _fmt_filename(ch.get("filename") or f"{typ}.png", partner_id)
+        # 'format: svg' chartonként, vagy globálisan a settings alatt
+        image_format = ch.get("format") or settings.get("format")
+        # 'template: true' chartonként vagy a settings alatt: a figure újrahasznosítása partnerek között
+        use_template = bool(ch.get("template", settings.get("template", False)))
+        filename = chart_filename(_fmt_filename(ch.get("filename") or f"{typ}.png", partner_id), image_format)
         title = ch.get("title")
         overrides = ch.get("overrides")
         source_type = (ch.get("source_type") or "single").lower()
@@ -85,9 +86,11 @@ def render_from_yaml(
         metrics = ch.get("metrics") or []
         labels_override = ch.get("labels")
 
+        mode = "pair" if source_type == "pair" else "single"
         labels, vals, comps = _series_for_metrics(
-            db, row_index, metrics, mode=("pair" if source_type == "pair" else "single"),
-            compare_suffix=compare_suffix
+            db, row_index, metrics, mode=mode,
+            compare_suffix=compare_suffix,
+            meta=meta,
         )
         # ha van labels_override és stimmel a hossz:
         if labels_override and len(labels_override) == len(labels):
@@ -101,6 +104,9 @@ def render_from_yaml(
                 title=title,
                 style=base_style,
                 overrides=overrides,
+                out_dir=out_dir,
+                image_format=image_format,
+                template=use_template,
                 overlay_values=comps if comps is not None else None,
                 show_x_labels=True,
                 x_label_wrap=overrides.get("x_label_wrap") if isinstance(overrides, dict) else None,
@@ -119,6 +125,9 @@ def render_from_yaml(
                 title=title,
                 style=base_style,
                 overrides=ov,
+                out_dir=out_dir,
+                image_format=image_format,
+                template=use_template,
                 overlay_values=comps if comps is not None else None,
                 show_y_labels=True,
             )
@@ -132,6 +141,9 @@ def render_from_yaml(
                 title=title,
                 style=base_style,
                 overrides=overrides,
+                out_dir=out_dir,
+                image_format=image_format,
+                template=use_template,
                 r_range=tuple(ch.get("r_range")) if ch.get("r_range") else None,
             )
             results.append(p)
@@ -186,6 +198,8 @@ def render_from_yaml(
                     title=title,
                     style=base_style,
                     overrides=overrides,  # a table.py innen kapja a per-oszlop fmt/align/width_cm stb.
+                    out_dir=out_dir,
+                    image_format=image_format,
                 )
                 results.append(Path(p))
                 continue  # fontos: ne fusson le az alapeseti 2/3 oszlopos ág
@@ -213,6 +227,8 @@ def render_from_yaml(
                 title=title,
                 style=base_style,
                 overrides=overrides,  # a table.py innen tudja elérni a columns fmt/align beállításokat
+                out_dir=out_dir,
+                image_format=image_format,
             )
             results.append(Path(p))
         else:
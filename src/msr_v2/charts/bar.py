@@ -1,13 +1,18 @@
 import numpy as np
-import matplotlib.pyplot as plt
 import re
 from pathlib import Path
 from typing import Sequence, Optional
-from .base import fig_ax, place_legend, wrap_title, ensure_out_dirs, OUT_CHARTS
+from .base import fig_ax, place_legend, wrap_title, text_style, ensure_out_dirs, OUT_CHARTS
 from ..config import Style
 from ..theme import apply_theme
+from msr.charts.theme import chart_filename
+from msr.charts.sink import save_figure
+from msr.charts.template import ChartTemplate, get_template, put_template, template_key
 import textwrap as tw
 
+# sablon módban partnerenként cserélt paraméterek (msr.charts.template)
+TEMPLATE_DATA_PARAMS = ("values", "overlay_values")
+
 def save_bar(
     values: Sequence[float],
     labels: Sequence[str],
@@ -18,12 +23,25 @@ def save_bar(
     overrides: dict | None = None,
     overlay_values: Optional[Sequence[float]] = None,
     show_y_labels: bool = True,
+    out_dir: Path | None = None,  # None → a közös charts mappa
+    image_format: str | None = None,  # "png" | "svg" (None → a fájlnév kiterjesztése dönt)
+    template: bool = False,  # True → ugyanarra a specre a figure újrahasznosítása, csak adatcsere
 ):
+    params = dict(locals())
     s = style.merge_overrides(overrides)
     fmt_value = s.labels.value_fmt
     overlay_fmt = s.labels.overlay_value_fmt
-    apply_theme(s)
-    ensure_out_dirs()
+    # csak az alap (run-szintű) theme kerül az rcParams-ba – ugyanarra a stílusra ez már no-op; a chart override-jai
+    # explicit artist-paraméterek, így a függvény szálból is hívható
+    apply_theme(style)
+    ensure_out_dirs(out_dir)
+    out = Path(out_dir or OUT_CHARTS) / chart_filename(filename, image_format)
+    if template:
+        tpl_key = template_key("v2.save_bar", params, TEMPLATE_DATA_PARAMS)
+        tpl = get_template(tpl_key)
+        if tpl is not None:
+            tpl.update(values, overlay_values)
+            return tpl.finish(out)
 
     fig, ax = fig_ax(s)
 
@@ -106,21 +124,26 @@ def save_bar(
 
 
     # overlay FÜGGŐLEGES vonalak (átlag)
-    if overlay_values is not None:
-        txt = s.palette.text
+    overlay_artists: list = []
+    txt = s.palette.text
+
+    def _draw_overlay(overlay_values) -> None:
         for rect, xval in zip(bars, overlay_values):
             h = rect.get_height()
             y0 = rect.get_y() - h*0.05
             y1 = rect.get_y() + h*(1.05)
-            ax.vlines(xval, y0, y1, color=txt, linewidth=2.0, zorder=5)
+            overlay_artists.append(ax.vlines(xval, y0, y1, color=txt, linewidth=2.0, zorder=5))
             # label a vonal fölött
-            ax.text(
+            overlay_artists.append(ax.text(
                 xval, y1 + h*0.06,
                 overlay_fmt.format(val=float(xval)),
                 ha="center", va="bottom",
                 fontsize=s.labels.y_fontsize,
                 color=s.labels.value_color or txt, zorder=6
-            )
+            ))
+
+    if overlay_values is not None:
+        _draw_overlay(overlay_values)
         ax.plot([], [], color=txt, linewidth=2.0, label="Hasonló árbevételű cégek átlagos értékei")
 
     # Értékek a sáv közepén – támogatja a régi annotate/value_label_fmt/value_label_color override-okat
@@ -128,16 +151,17 @@ def save_bar(
     fmt_str = ov.get("value_label_fmt", fmt_value)
     val_color = ov.get("value_label_color", (s.labels.value_color or s.palette.text))
 
+    value_texts = []
     if use_annotate:
         for rect, v in zip(bars, values):
             ymid = rect.get_y() + rect.get_height() / 2.0
             xmid = rect.get_x() + rect.get_width() / 2.0
-            ax.text(
+            value_texts.append(ax.text(
                 xmid, ymid,
                 fmt_str.format(val=float(v)),
                 va="center", ha="center", fontsize=s.labels.y_fontsize,
                 color=val_color
-            )
+            ))
 
     if show_y_labels:
         ax.set_yticks(y)
@@ -160,6 +184,7 @@ def save_bar(
         ax.set_yticks([]); ax.set_xticks([])
 
     # Csoport elválasztók és csoportcímek kirajzolása – egyszerűsített (forgatás nélkül)
+    data_dependent_layout = False
     if group_labels and isinstance(group_labels, list) and len(group_labels) == len(labels):
         # group → y indexek (megjelenési sorrenddel)
         idx_by_group, order = {}, []
@@ -218,6 +243,7 @@ def save_bar(
             # 2) a label-zóna JOBB széle: az x=0 adatvonal (baseline) pozíciója axes-frakcióban
             #    így a vonal nem megy be a sávok közé
             x0_pix = ax.transData.transform((0.0, 0.0))[0]
+            data_dependent_layout = True  # az x=0 helye az adat-tartománytól függ → nem sablonosítható
             x0_axes = ax.transAxes.inverted().transform((x0_pix, 0.0))[0]
             right_label_axes = x0_axes - 0.005  # kis puffer, hogy ne érjen bele a baseline-ba
 
@@ -277,8 +303,7 @@ def save_bar(
 
         fig.suptitle(
             wrap_title(title, s) if is_title_wrapped else title,
-            fontsize=s.title.size,
-            fontweight=s.title.weight,
+            **text_style(s),
             x=x_center,
             y=title_y,
         )
@@ -295,8 +320,31 @@ def save_bar(
         s.chart_type = "bar"
         place_legend(ax, fig, s)
 
-    out = OUT_CHARTS / filename
-
-    fig.savefig(out, bbox_inches="tight", pad_inches=0.1);
-    plt.close(fig)  # ← pad_inches hozzáadása
-    return out
\ No newline at end of file
+    # az axes kiinduló (layout előtti) helye: a constrained layout innen indul, sablon módban ide állunk vissza
+    layout_start = ax.get_position(original=True).frozen()
+
+    def _finish(out: Path) -> Path:
+        save_figure(fig, out, bbox_inches="tight", pad_inches=0.1, dpi=s.size.dpi)  # ← pad_inches hozzáadása
+        return out
+
+    if template and not data_dependent_layout:
+        def _update(new_values, new_overlay) -> None:
+            # csak az adat-artistok: rúd-hossz, értékfelirat, overlay; a layoutot a CL mentéskor újraszámolja
+            for rect, v in zip(bars, np.asarray(new_values, dtype=float)):
+                rect.set_width(v)
+            for rect, v, t in zip(bars, np.asarray(new_values, dtype=float), value_texts):
+                t.set_x(rect.get_x() + rect.get_width() / 2.0)
+                t.set_text(fmt_str.format(val=float(v)))
+            for artist in overlay_artists:
+                artist.remove()
+            overlay_artists.clear()
+            ax.relim()
+            if new_overlay is not None:
+                _draw_overlay(new_overlay)
+            ax.autoscale_view()
+            # a CL eredménye a kiinduló helytől is függ → a friss figure-é legyen (set_position kivenné a layoutból)
+            ax.set_position(layout_start)
+            ax.set_in_layout(True)
+
+        put_template(tpl_key, ChartTemplate(fig, _update, _finish))
+    return _finish(out)
\ No newline at end of file
@@ -3,7 +3,8 @@
 from pathlib import Path
 import numpy as np
 import textwrap as tw
-import matplotlib.pyplot as plt
+from msr.charts.theme import new_figure
+from msr.charts.sink import active_sink
 from ..config import Style
 from ..theme import cm_to_in
 
@@ -18,15 +19,27 @@ LEGEND_OFFSET_BY_TYPE = {
 }
 DEFAULT_LEGEND_OFFSET = -0.05
 
-def fig_ax(style: Style):
-    fig, ax = plt.subplots(
-        figsize=(cm_to_in(style.size.cm_w), cm_to_in(style.size.cm_h)),
-        dpi=style.size.dpi,
-        constrained_layout=True,
+def fig_ax(style: Style, *, polar: bool = False, constrained: bool = True):
+    """
+    Figure + Agg canvas pyplot nélkül (szálból csak egyetlen rögzített alap theme mellett hívható, lásd new_figure).
+    A chart-szintű stílust (override-ok) nem az rcParams-ba írjuk, hanem az artistoknak adjuk át (text_style,
+    place_legend, savefig dpi); az rcParams csak az alap theme.
+    """
+    fig, ax = new_figure(
+        (cm_to_in(style.size.cm_w), cm_to_in(style.size.cm_h)),
+        style.size.dpi,
+        polar=polar,
+        constrained_layout=constrained,
     )
+    if not constrained:
+        return fig, ax
     fig.set_constrained_layout_pads(h_pad=0.06, w_pad=0.02, hspace=0.02, wspace=0.02)
     return fig, ax
 
+def text_style(style: Style) -> dict:
+    """A cím-szövegek chart-szintű stílusa explicit artist-paraméterként (nem globális rcParams)."""
+    return {"fontsize": style.title.size, "fontweight": style.title.weight, "color": style.palette.text}
+
 def place_legend(ax, fig, style: Style):
     handles, labels = ax.get_legend_handles_labels()
     order_map = {"Az Ön értékei": 0, "Hasonló árbevételű cégek átlagos értékei": 1}
@@ -45,10 +58,16 @@ def place_legend(ax, fig, style: Style):
             ncol=style.legend.ncol,
             frameon=getattr(style.legend, "frameon", False),
             prop={"size": getattr(style.legend, "fontsize", None)} if getattr(style.legend, "fontsize", None) else None,
+            labelcolor=style.palette.text,
         )
         leg.set_in_layout(True)  # fontos a constrained_layout-hoz
         return leg
-    return ax.legend(H, L, loc=style.legend.loc)
+    return ax.legend(
+        H, L, loc=style.legend.loc,
+        frameon=getattr(style.legend, "frameon", False),
+        prop={"size": getattr(style.legend, "fontsize", None)} if getattr(style.legend, "fontsize", None) else None,
+        labelcolor=style.palette.text,
+    )
 
 def wrap_title(title: str, style: Style) -> str:
     if not title:
@@ -64,6 +83,12 @@ def center_title_to_figure(ax):
     bb = ax.get_position()
     ax.title.set_position(((0.5 - bb.x0) / bb.width, ax.title.get_position()[1]))
 
-def ensure_out_dirs():
+def ensure_out_dirs(out_dir: Path | None = None):
+    # out_dir megadásakor (pl. partnerenkénti mappa) csak azt hozzuk létre, a közös charts/tables mappát nem
+    if active_sink() is not None:
+        return  # memória-sinkbe renderelünk, a lemezhez nem nyúlunk
+    if out_dir is not None:
+        Path(out_dir).mkdir(parents=True, exist_ok=True)
+        return
     OUT_CHARTS.mkdir(parents=True, exist_ok=True)
     OUT_TABLES.mkdir(parents=True, exist_ok=True)
\ No newline at end of file
@@ -1,11 +1,16 @@
 import textwrap
 import numpy as np
-import matplotlib.pyplot as plt
 from pathlib import Path
 from typing import Sequence, Optional
-from .base import fig_ax, place_legend, wrap_title, ensure_out_dirs, OUT_CHARTS
+from .base import fig_ax, place_legend, wrap_title, text_style, ensure_out_dirs, OUT_CHARTS
 from ..config import Style
 from ..theme import apply_theme
+from msr.charts.theme import chart_filename
+from msr.charts.sink import save_figure
+from msr.charts.template import ChartTemplate, get_template, put_template, template_key
+
+# sablon módban partnerenként cserélt paraméterek (msr.charts.template)
+TEMPLATE_DATA_PARAMS = ("values", "overlay_values")
 
 def save_column(
     values: Sequence[float],
@@ -18,10 +23,23 @@ def save_column(
     overlay_values: Optional[Sequence[float]] = None,
     show_x_labels: bool = True,
     x_label_wrap: int | None = None,
+    out_dir: Path | None = None,  # None → a közös charts mappa
+    image_format: str | None = None,  # "png" | "svg" (None → a fájlnév kiterjesztése dönt)
+    template: bool = False,  # True → ugyanarra a specre a figure újrahasznosítása, csak adatcsere
 ):
+    params = dict(locals())
     s = style.merge_overrides(overrides)
-    apply_theme(s)
-    ensure_out_dirs()
+    # csak az alap (run-szintű) theme kerül az rcParams-ba – ugyanarra a stílusra ez már no-op; a chart override-jai
+    # explicit artist-paraméterek, így a függvény szálból is hívható
+    apply_theme(style)
+    ensure_out_dirs(out_dir)
+    out = Path(out_dir or OUT_CHARTS) / chart_filename(filename, image_format)
+    if template:
+        tpl_key = template_key("v2.save_column", params, TEMPLATE_DATA_PARAMS)
+        tpl = get_template(tpl_key)
+        if tpl is not None:
+            tpl.update(values, overlay_values)
+            return tpl.finish(out)
 
     # formázás mindig a Style-ból (YAML overrides felülírhatják)
     fmt_value = s.labels.value_fmt
@@ -40,33 +58,39 @@ def save_column(
     bar_width = float((overrides or {}).get("bar_width", 0.8))
     bars = ax.bar(x, values, width=bar_width, color=s.palette.secondary, label="Az Ön értékei")
 
-    if overlay_values is not None:
-        txt = s.palette.text
+    overlay_artists: list = []
+    txt = s.palette.text
+
+    def _draw_overlay(overlay_values) -> None:
         for rect, y in zip(bars, overlay_values):
             w = rect.get_width()
             x0 = rect.get_x() - w * 0.05
             x1 = rect.get_x() + w * (1.05)
-            ax.hlines(y, x0, x1, color=txt, linewidth=2.0, zorder=5)
-            ax.annotate(
+            overlay_artists.append(ax.hlines(y, x0, x1, color=txt, linewidth=2.0, zorder=5))
+            overlay_artists.append(ax.annotate(
                 overlay_fmt.format(val=float(y)),  # ← itt is egységes
                 xy=(x0, y), xytext=(-4, 0),
                 textcoords="offset points",
                 ha="right", va="center",
                 fontsize=s.labels.y_fontsize,
                 color=s.labels.value_color or txt, zorder=6,
-            )
+            ))
+
+    if overlay_values is not None:
+        _draw_overlay(overlay_values)
         ax.plot([], [], color=txt, linewidth=2.0, label="Hasonló árbevételű cégek átlagos értékei")
 
     # értékek a rúd közepén – használd a fmt_value-t
+    value_texts = []
     for rect, v in zip(bars, values):
-        ax.text(
+        value_texts.append(ax.text(
             rect.get_x() + rect.get_width() / 2.,
             rect.get_height() / 2.,
             fmt_value.format(val=float(v)),  # ← EZ volt eddig s.labels.value_fmt
             ha="center", va="center",
             fontsize=s.labels.y_fontsize,
             color=s.labels.value_color or s.palette.text
-        )
+        ))
 
     # tengelyek minimal
     if show_x_labels:
@@ -90,8 +114,7 @@ def save_column(
     if title:
         t = ax.set_title(
             wrap_title(title, s),
-            fontsize=s.title.size,
-            fontweight=s.title.weight,
+            **text_style(s),
             pad=s.title.pad,
         )
 
@@ -109,7 +132,30 @@ def save_column(
             s.chart_type = "column"
             place_legend(ax, fig, s)
 
-    out = OUT_CHARTS / filename
-    fig.savefig(out, bbox_inches="tight", pad_inches=0.2);
-    plt.close(fig)  # ← pad_inches hozzáadása
-    return out
+    # az axes kiinduló (layout előtti) helye: a constrained layout innen indul, sablon módban ide állunk vissza
+    layout_start = ax.get_position(original=True).frozen()
+
+    def _finish(out: Path) -> Path:
+        save_figure(fig, out, bbox_inches="tight", pad_inches=0.2, dpi=s.size.dpi)  # ← pad_inches hozzáadása
+        return out
+
+    if template:
+        def _update(new_values, new_overlay) -> None:
+            # csak az adat-artistok: rúd-magasság, értékfelirat, overlay; a layoutot a CL mentéskor újraszámolja
+            for rect, v, t in zip(bars, np.asarray(new_values, dtype=float), value_texts):
+                rect.set_height(v)
+                t.set_y(rect.get_height() / 2.)
+                t.set_text(fmt_value.format(val=float(v)))
+            for artist in overlay_artists:
+                artist.remove()
+            overlay_artists.clear()
+            ax.relim()
+            if new_overlay is not None:
+                _draw_overlay(new_overlay)
+            ax.autoscale_view()
+            # a CL eredménye a kiinduló helytől is függ → a friss figure-é legyen (set_position kivenné a layoutból)
+            ax.set_position(layout_start)
+            ax.set_in_layout(True)
+
+        put_template(tpl_key, ChartTemplate(fig, _update, _finish))
+    return _finish(out)
@@ -1,12 +1,17 @@
 import numpy as np, math
 import textwrap as tw
-import matplotlib.pyplot as plt
 import matplotlib.ticker as mticker
 from pathlib import Path
 from typing import Sequence, Optional, Tuple
-from .base import fig_ax, place_legend, wrap_title, ensure_out_dirs, OUT_CHARTS
+from .base import fig_ax, place_legend, wrap_title, text_style, ensure_out_dirs, OUT_CHARTS
 from ..config import Style
 from ..theme import apply_theme
+from msr.charts.theme import chart_filename
+from msr.charts.sink import save_figure
+from msr.charts.template import ChartTemplate, get_template, put_template, template_key
+
+# sablon módban partnerenként cserélt paraméterek (msr.charts.template)
+TEMPLATE_DATA_PARAMS = ("series_main", "series_comp")
 
 def save_radar(
     labels: Sequence[str],
@@ -18,8 +23,20 @@ def save_radar(
     overrides: dict | None = None,
     series_comp: Optional[Sequence[float]] = None,
     r_range: Optional[Tuple[float, float]] = None,
+    out_dir: Path | None = None,  # None → a közös charts mappa
+    image_format: str | None = None,  # "png" | "svg" (None → a fájlnév kiterjesztése dönt)
+    template: bool = False,  # True → ugyanarra a specre a figure újrahasznosítása, csak adatcsere
 ):
-    s = style.merge_overrides(overrides); apply_theme(s); ensure_out_dirs()
+    params = dict(locals())
+    # rcParams: csak az alap theme (no-op ismétlésnél); a chart override-jai explicit artist-paraméterek
+    s = style.merge_overrides(overrides); apply_theme(style); ensure_out_dirs(out_dir)
+    out = Path(out_dir or OUT_CHARTS) / chart_filename(filename, image_format)
+    if template:
+        tpl_key = template_key("v2.save_radar", params, TEMPLATE_DATA_PARAMS)
+        tpl = get_template(tpl_key)
+        if tpl is not None:
+            tpl.update(series_main, series_comp)
+            return tpl.finish(out)
 
     n = len(labels)
     ang = np.linspace(0, 2*math.pi, n, endpoint=False)
@@ -27,16 +44,13 @@ def save_radar(
     s1 = list(series_main) + [series_main[0]]
     s2 = list(series_comp) + [series_comp[0]] if series_comp is not None else None
 
-    fig, ax = plt.subplots(
-        subplot_kw=dict(polar=True),
-        figsize=(s.size.cm_w/2.54, s.size.cm_h/2.54),
-        dpi=s.size.dpi,
-    )
-    ax.plot(ang, s1, lw=2.0, color=s.palette.secondary, label="Az Ön értékei")
-    ax.fill(ang, s1, alpha=0.10, color=s.palette.secondary)
+    fig, ax = fig_ax(s, polar=True, constrained=False)
+    series_artists = [(*ax.plot(ang, s1, lw=2.0, color=s.palette.secondary, label="Az Ön értékei"),
+                       *ax.fill(ang, s1, alpha=0.10, color=s.palette.secondary))]
     if s2 is not None:
-        ax.plot(ang, s2, lw=1.8, color=s.palette.text, label="Hasonló árbevételű cégek átlagos értékei")
-        ax.fill(ang, s2, alpha=0.08, color=s.palette.text)
+        series_artists.append((*ax.plot(ang, s2, lw=1.8, color=s.palette.text,
+                                        label="Hasonló árbevételű cégek átlagos értékei"),
+                               *ax.fill(ang, s2, alpha=0.08, color=s.palette.text)))
 
     ax.set_xticks(ang[:-1])
     wrap = None
@@ -76,31 +90,55 @@ def save_radar(
     ax.spines["polar"].set_color("#EEEEEE"); ax.spines["polar"].set_linewidth(0.4); ax.spines["polar"].set_alpha(0.25)
 
     if r_range: ax.set_rmin(r_range[0]); ax.set_rmax(r_range[1])
-    if title: ax.set_title(wrap_title(title, s), pad=s.title.pad)
 
+    def _first_title() -> None:
+        if title: ax.set_title(wrap_title(title, s), **text_style(s), pad=s.title.pad)
+
+    _first_title()
     if s.legend.show:
         s.chart_type = "radar"
         place_legend(ax, fig, s)
-    fig.tight_layout()
-
-    # cím kiírása normálisan
-    t = ax.set_title(
-        wrap_title(title, style),
-        fontsize=style.title.size,
-        fontweight=style.title.weight,
-        pad=style.title.pad,
-    )
-
-    # … legend elhelyezés, stb. …
-
-    # fontos: előbb layout!
-    fig.tight_layout()
-
-    # majd igazítsd a címet a FIGURÁHOZ középre
-    bbox = ax.get_position()  # axes helyzete a figurán belül
-    x_fig_center_in_axes = (0.5 - bbox.x0) / bbox.width
-    ax.title.set_position((x_fig_center_in_axes, ax.title.get_position()[1]))
-
-    out = OUT_CHARTS / filename
-    fig.savefig(out, bbox_inches="tight"); plt.close(fig)
-    return out
\ No newline at end of file
+    # a layout kiinduló állapota (sablon módban adatcsere után innen számolunk újra)
+    subplotpars = vars(fig.subplotpars).copy()
+    title_pos = ax.title.get_position()
+
+    def _finish(out: Path) -> Path:
+        fig.tight_layout()
+
+        # cím kiírása normálisan
+        t = ax.set_title(
+            wrap_title(title, style),
+            fontsize=style.title.size,
+            fontweight=style.title.weight,
+            color=s.palette.text,
+            pad=style.title.pad,
+        )
+
+        # … legend elhelyezés, stb. …
+
+        # fontos: előbb layout!
+        fig.tight_layout()
+
+        # majd igazítsd a címet a FIGURÁHOZ középre
+        bbox = ax.get_position()  # axes helyzete a figurán belül
+        x_fig_center_in_axes = (0.5 - bbox.x0) / bbox.width
+        ax.title.set_position((x_fig_center_in_axes, ax.title.get_position()[1]))
+
+        save_figure(fig, out, bbox_inches="tight", dpi=s.size.dpi)
+        return out
+
+    if template:
+        def _update(new_main, new_comp) -> None:
+            new_series = [new_main] + ([new_comp] if new_comp is not None else [])
+            for (line, poly), series in zip(series_artists, new_series):
+                closed = list(series) + [series[0]]
+                line.set_data(ang, closed)
+                poly.set_xy(np.column_stack([ang, closed]))
+            ax.relim()  # az r tartomány fix (set_rmin/set_rmax) → nincs újraskálázás
+            # a _finish két tight_layout-ja a friss figure állapotából induljon (margók, cím helye és stílusa)
+            fig.subplots_adjust(**subplotpars)
+            ax.title.set_position(title_pos)
+            _first_title()
+
+        put_template(tpl_key, ChartTemplate(fig, _update, _finish))
+    return _finish(out)
\ No newline at end of file
@@ -1,11 +1,12 @@
 from typing import Sequence, Any
 import numpy as np
-import matplotlib.pyplot as plt
 import textwrap as tw
 from pathlib import Path
-from .base import fig_ax, wrap_title, ensure_out_dirs, OUT_TABLES
+from .base import fig_ax, wrap_title, text_style, ensure_out_dirs, OUT_TABLES
 from ..config import Style
 from ..theme import apply_theme
+from msr.charts.theme import chart_filename
+from msr.charts.sink import save_figure
 
 def _fmt(x: Any) -> str:
     if isinstance(x, (float, np.floating)):
@@ -20,8 +21,11 @@ def save_table(
     title: str | None = None,
     style: Style,
     overrides: dict | None = None,
+    out_dir: Path | None = None,  # None → a közös tables mappa
+    image_format: str | None = None,  # "png" | "svg" (None → a fájlnév kiterjesztése dönt)
 ):
-    s = style.merge_overrides(overrides); apply_theme(s); ensure_out_dirs()
+    # rcParams: csak az alap theme (no-op ismétlésnél); a chart override-jai explicit artist-paraméterek
+    s = style.merge_overrides(overrides); apply_theme(style); ensure_out_dirs(out_dir)
     fig, ax = fig_ax(s)
     ax.set_axis_off()
 
@@ -228,9 +232,9 @@ def save_table(
                 cell.get_text().set_color(pal.text)
 
     if title:
-        ax.set_title(wrap_title(title, s), pad=s.title.pad)
+        ax.set_title(wrap_title(title, s), **text_style(s), pad=s.title.pad)
 
 
-    out = OUT_TABLES / filename
-    fig.savefig(out, bbox_inches="tight"); plt.close(fig)
+    out = Path(out_dir or OUT_TABLES) / chart_filename(filename, image_format)
+    save_figure(fig, out, bbox_inches="tight", dpi=s.size.dpi)
     return out
\ No newline at end of file
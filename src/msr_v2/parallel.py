@@ -0,0 +1,80 @@
+"""
+v2 engine: párhuzamos renderelés processz-poolban (ugyanaz a minta, mint msr.charts.parallel).
+
+Minden worker egyszer inicializál (Agg backend, Rubik font, a YAML 'settings' szerinti theme, WorkbookMeta
+a szülő kivetített db-jéből – ugyanabból, amiből a soros út renderel), utána partnerenként csak a render_from_yaml fut.
+"""
+from __future__ import annotations
+from pathlib import Path
+from typing import Callable, Iterator, Sequence
+import pandas as pd
+import yaml
+
+from msr.charts.parallel import default_workers
+from msr.charts.pool import WorkerPool, PoolStats
+
+_WORKER: dict = {}
+
+
+def _init_worker(db: pd.DataFrame, yaml_path: str, config: dict, out_root: str | None) -> None:
+    import matplotlib
+    matplotlib.use("Agg")
+    from msr.data.meta import WorkbookMeta
+    from .config import Style
+    from .theme import apply_theme
+
+    apply_theme(Style().merge_overrides(config.get("settings") or {}))
+    _WORKER.update(meta=WorkbookMeta(db), yaml_path=yaml_path, config=config, out_root=out_root)
+
+
+def _render_task(partner_id: str, position: int) -> tuple[str, list[Path]]:
+    from .assign import render_from_yaml
+
+    meta = _WORKER["meta"]
+    out_root = _WORKER["out_root"]
+    # a pozíció iloc; a render_from_yaml a db.loc címkét várja (mint a soros út)
+    paths = render_from_yaml(
+        _WORKER["yaml_path"], db=meta.db, row_index=meta.db.index[position], partner_id=partner_id, meta=meta,
+        config=_WORKER["config"], out_dir=(Path(out_root) / str(partner_id)) if out_root else None,
+    )
+    return partner_id, [Path(p) for p in paths]
+
+
+def iter_render_parallel(
+    yaml_path: Path | str,
+    *,
+    db: pd.DataFrame,
+    partners: Sequence[tuple[str, int]],
+    pid_col: str = "ResponseID",
+    workers: int | None = None,
+    max_tasks_per_worker: int = 0,
+    max_worker_rss_mb: int = 0,
+    on_leak: Callable[[str, int], None] | None = None,
+    stats: PoolStats | None = None,
+    config: dict | None = None,
+    out_root: Path | str | None = None,
+) -> Iterator[tuple[str, list[Path]]]:
+    """
+    render_from_yaml több partnerre, párhuzamosan.
+    - partners: [(partner_id, iloc_pozíció), ...]
+    - max_tasks_per_worker / max_worker_rss_mb / on_leak / stats: mint az msr.charts.parallel-ben
+    - config:   előre betöltött YAML (None → a yaml_path-ból)
+    - out_root: ha megadod, a kimenet partnerenként az <out_root>/<partner_id>/ mappába kerül
+    - a partnereket a befejezés sorrendjében adja vissza: (partner_id, [Path, ...])
+    """
+    workers = max(1, workers or default_workers())
+    if not partners:
+        return
+    if config is None:
+        config = yaml.safe_load(Path(yaml_path).read_text()) or {}
+    pool = WorkerPool(
+        min(workers, len(partners)),
+        initializer=_init_worker,
+        initargs=(db, str(Path(yaml_path).resolve()), config, (str(out_root) if out_root else None)),
+        max_tasks=max_tasks_per_worker,
+        max_rss_mb=max_worker_rss_mb,
+        on_leak=on_leak,
+        stats=stats,
+    )
+    tasks = [(pid, int(pos)) for pid, pos in partners]
+    yield from pool.imap_unordered(_render_task, tasks, labels=[pid for pid, _ in tasks])
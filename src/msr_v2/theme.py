@@ -1,6 +1,5 @@
-from pathlib import Path
 import matplotlib.pyplot as plt
-from matplotlib import font_manager as fm
+from msr.charts.theme import register_rubik_fonts, apply_rc_once, SVG_HASHSALT, _INIT_LOCK
 from .config import Style
 
 def cm_to_in(cm: float) -> float:
@@ -10,31 +9,20 @@ def ensure_rubik_font() -> None:
     fam = plt.rcParams.get("font.family")
     if fam == "Rubik" or fam == ["Rubik"]:
         return
-    here = Path(__file__).resolve()
-    project_root = here.parents[2]  # .../src/msr_v2 -> repo gyökér
-    candidates = [
-        project_root / "local" / "assets" / "fonts" / "Rubik" / "Rubik-Bold.ttf",
-        project_root / "local" / "assets" / "fonts" / "Rubik" / "Rubik-Regular.ttf",
-        project_root / "local" / "assets" / "fonts" / "Rubik" / "Rubik-VariableFont_wght.ttf",
-        project_root / "templates" / "assets" / "fonts" / "Rubik" / "Rubik-Bold.ttf",
-        project_root / "templates" / "assets" / "fonts" / "Rubik" / "Rubik-Regular.ttf",
-        project_root / "templates" / "assets" / "fonts" / "Rubik" / "Rubik-VariableFont_wght.ttf",
-    ]
-    found = False
-    for p in candidates:
-        try:
-            if p.exists():
-                fm.fontManager.addfont(str(p))
-                found = True
-        except Exception:
-            pass
-    if found:
-        plt.rcParams["font.family"] = "Rubik"
+    # a fontkeresés + addfont processzenként egyszer fut (közös a v1 engine-nel, ugyanazok a jelölt útvonalak)
+    if register_rubik_fonts():
+        with _INIT_LOCK:
+            plt.rcParams["font.family"] = "Rubik"
 
 def apply_theme(style: Style) -> None:
+    """
+    A Style szerinti rcParams; ugyanarra a stílusra ismételten hívva nem validál újra (lásd apply_rc_once).
+    Processz-globális: a v1 theme-mel vagy más alap-Style-lal egy processzen belül nem renderelhet párhuzamosan
+    (lásd msr.charts.theme.new_figure).
+    """
     ensure_rubik_font()
     pal = style.palette
-    plt.rcParams.update({
+    apply_rc_once({
         "text.color": pal.text,
         "axes.labelcolor": pal.text,
         "axes.titlesize": style.title.size,
@@ -47,4 +35,5 @@ def apply_theme(style: Style) -> None:
         "axes.grid": False,
         "xtick.bottom": False, "ytick.left": False,
         "font.family": "Rubik",
-    })
\ No newline at end of file
+        "svg.hashsalt": SVG_HASHSALT,
+    })
@@ -0,0 +1,73 @@
+"""
+Közös fixture-ök: egy ideiglenes local/ gyökér (MSR_LOCAL_ROOT) kis szintetikus munkafüzettel és assignment YAML-lel,
+valamint a CLI parancsok processzen belüli futtatása (typer CliRunner).
+"""
+from __future__ import annotations
+from pathlib import Path
+
+import pytest
+
+PARTNERS = [f"P{1000 + i}" for i in range(6)]
+METRICS = ["m1", "m2", "m3", "m4"]
+
+ASSIGNMENT_YAML = """\
+pages:
+  - id: p1
+    charts:
+      - {type: radar, source_type: pair, metrics: [m1, m2, m3, m4], filename: "radar_{partner}.png", title: Radar}
+      - {type: column, source_type: pair, metrics: [m1, m2, m3], filename: "col_{partner}.png", title: Oszlop}
+  - id: p2
+    charts:
+      - {type: column, source_type: single, metrics: [m1_átlag, m2_átlag], filename: "avg_{partner}.png", title: Átlagok}
+      - {type: table, source_type: pair, metrics: [m1, m2], filename: "tbl_{partner}.png", title: Tábla}
+"""
+
+
+def write_workbook(path: Path, overrides: dict[tuple[str, str], float] | None = None) -> None:
+    """'Változó info' + 'Adatbázis' sheet; a metrikák sok értékes jegyűek (a float32 nem adná vissza őket pontosan)."""
+    import numpy as np
+    import pandas as pd
+
+    rng = np.random.default_rng(0)
+    db = pd.DataFrame({"ResponseID": PARTNERS})
+    for m in METRICS:
+        db[m] = (rng.uniform(1, 5, len(PARTNERS)) * 10_000).round(4)
+        db[f"{m}_átlag"] = round(float(db[m].mean()), 4)
+    db["szöveg"] = ["a", "b", "", "c", "d", "e"]
+    for (pid, col), value in (overrides or {}).items():
+        db.loc[db["ResponseID"] == pid, col] = value
+    ddf = pd.DataFrame({"Változó": METRICS, "Változó neve": [f"Mutató {m}" for m in METRICS]})
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with pd.ExcelWriter(path) as w:
+        ddf.to_excel(w, sheet_name="Változó info", index=False)
+        db.to_excel(w, sheet_name="Adatbázis", index=False)
+
+
+@pytest.fixture
+def msr_local(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Ideiglenes local/ gyökér: data/input/wb.xlsx + config/assignment.yaml."""
+    root = tmp_path / "local"
+    write_workbook(root / "data" / "input" / "wb.xlsx")
+    (root / "config").mkdir(parents=True)
+    (root / "config" / "assignment.yaml").write_text(ASSIGNMENT_YAML, encoding="utf-8")
+    monkeypatch.setenv("MSR_LOCAL_ROOT", str(root))
+    # a chart cache környezet-kulcsa processzenként cache-elt – minden teszt tisztán indul
+    from msr.charts import chart_cache
+    monkeypatch.setattr(chart_cache, "_ENV_KEY", None)
+    return root
+
+
+@pytest.fixture
+def run_cli():
+    """msr <args...> futtatása; sikertelen kilépésnél a kimenettel együtt bukik. Visszaadja a kimenetet."""
+    from typer.testing import CliRunner
+    from msr.cli import app
+
+    runner = CliRunner()
+
+    def _run(*args: str) -> str:
+        res = runner.invoke(app, list(args), catch_exceptions=False)
+        assert res.exit_code == 0, res.output
+        return res.output
+
+    return _run
@@ -0,0 +1,90 @@
+"""
+charts-batch: a soros és a processz-poolos futás ugyanazt a kimenetet adja (kohorsz-fájlnevekkel együtt), a journal
+a változatlan partnereket kihagyja és a megváltozott bemenetűt újrarendereli, a shardok pedig lefedik a partnereket,
+és a manifesztjeik összefésülhetők.
+"""
+from __future__ import annotations
+import hashlib
+import json
+from pathlib import Path
+
+from conftest import PARTNERS, write_workbook
+
+BATCH = ("charts-batch", "--xlsx-path", "data/input/wb.xlsx", "--config-path", "config/assignment.yaml", "--no-chart-cache")
+
+
+def _assets(root: Path) -> dict[str, str]:
+    base = root / "output" / "assets"
+    return {
+        p.relative_to(base).as_posix(): hashlib.sha256(p.read_bytes()).hexdigest()
+        for p in sorted(base.rglob("*")) if p.is_file()
+    }
+
+
+def _clear_outputs(root: Path) -> None:
+    import shutil
+
+    shutil.rmtree(root / "output")
+
+
+def test_serial_and_parallel_outputs_are_identical(msr_local, run_cli):
+    run_cli(*BATCH, "--workers", "1", "--no-resume")
+    serial = _assets(msr_local)
+    _clear_outputs(msr_local)
+    run_cli(*BATCH, "--workers", "2", "--no-resume")
+    parallel = _assets(msr_local)
+
+    assert serial == parallel
+    # a csoportátlag-chart minden partnernél ugyanaz → egy közös kohorsz-fájl, mindkét módban ugyanazzal a kulccsal
+    assert [k for k in serial if k.startswith("charts/shared/")] == [
+        k for k in parallel if k.startswith("charts/shared/")
+    ]
+    assert len([k for k in serial if k.startswith("charts/shared/")]) == 1
+    assert all(f"charts/radar_{pid}.png" in serial for pid in PARTNERS)
+
+
+def test_journal_skips_fresh_partners_and_rerenders_changed_input(msr_local, run_cli):
+    run_cli(*BATCH, "--workers", "1")
+    charts = msr_local / "output" / "assets" / "charts"
+    before = {pid: (charts / f"col_{pid}.png").stat().st_mtime_ns for pid in PARTNERS}
+
+    out = run_cli(*BATCH, "--workers", "1")
+    assert f"journal: {len(PARTNERS)} partner kész és friss" in out
+    assert {pid: (charts / f"col_{pid}.png").stat().st_mtime_ns for pid in PARTNERS} == before
+
+    changed = PARTNERS[2]
+    old_bytes = (charts / f"col_{changed}.png").read_bytes()
+    write_workbook(msr_local / "data" / "input" / "wb.xlsx", overrides={(changed, "m1"): 12345.6789})
+    out = run_cli(*BATCH, "--workers", "1")
+    assert f"journal: {len(PARTNERS) - 1} partner kész és friss" in out
+    assert (charts / f"col_{changed}.png").read_bytes() != old_bytes
+    for pid in PARTNERS:
+        if pid != changed:
+            assert (charts / f"col_{pid}.png").stat().st_mtime_ns == before[pid]
+
+
+def test_shards_partition_partners_and_merge(msr_local, run_cli):
+    from msr.data.shards import select_shard
+
+    parts = [select_shard(PARTNERS, (i, 3)) for i in (1, 2, 3)]
+    assert sorted(p for part in parts for p in part) == sorted(PARTNERS)
+
+    for i in (1, 2):
+        run_cli(*BATCH, "--workers", "1", "--shard", f"{i}/3")
+    manifests = msr_local / "output" / "manifests"
+
+    from typer.testing import CliRunner
+    from msr.cli import app
+
+    partial = CliRunner().invoke(app, ["batch-manifest-merge"])
+    assert partial.exit_code == 1  # a 3. shard hiányzik
+    assert "Hiányzó shardok" in partial.output
+
+    run_cli(*BATCH, "--workers", "1", "--shard", "3/3")
+    run_cli("batch-manifest-merge")
+    merged = json.loads((manifests / "charts-batch.json").read_text(encoding="utf-8"))
+    assert merged["missing_shards"] == []
+    assert sorted(merged["partners"]) == sorted(PARTNERS)
+    for i, part in enumerate(parts, start=1):
+        shard = json.loads((manifests / f"charts-batch.shard-{i}-of-3.json").read_text(encoding="utf-8"))
+        assert sorted(shard["partners"]) == sorted(part)
@@ -0,0 +1,68 @@
+"""
+Chart cache: azonos bemenetre találat (nincs újrarenderelés, a kimenet a blob hardlinkje), más adatra vagy
+megváltozott környezet-modulra (chart-kód, theme) tévesztés – ilyenkor újra kell renderelni.
+"""
+from __future__ import annotations
+import os
+from pathlib import Path
+
+from msr.charts import chart_cache, theme
+from msr.charts.bar import save_column
+from msr.charts.chart_cache import ChartCache
+
+
+def _render(cc: ChartCache, root: Path, name: str, values=(1.0, 2.5, 3.25)) -> Path:
+    target = root / "output" / "assets" / "charts" / name
+    return Path(cc.render(save_column, target, values=list(values), labels=["a", "b", "c"], filename=name))
+
+
+def test_hit_on_same_input_and_miss_on_other_data(msr_local):
+    cc = ChartCache(msr_local / "cache")
+    first = _render(cc, msr_local, "x.png")
+    assert (cc.hits, cc.misses) == (0, 1)
+
+    again = _render(cc, msr_local, "y.png")
+    assert (cc.hits, cc.misses) == (1, 1)
+    assert again.read_bytes() == first.read_bytes()
+    assert os.path.samefile(first, again)  # hardlink, nem másolat
+
+    _render(cc, msr_local, "z.png", values=(1.0, 2.5, 3.5))
+    assert (cc.hits, cc.misses) == (1, 2)
+
+
+def test_rerender_does_not_touch_cached_blob(msr_local):
+    cc = ChartCache(msr_local / "cache")
+    first = _render(cc, msr_local, "x.png")
+    blob = next((msr_local / "cache").rglob("*.png"))
+    cached = blob.read_bytes()
+    # ugyanarra a fájlnévre más tartalom: a save_figure atomikusan cserél, a blob (régi inode) érintetlen
+    _render(cc, msr_local, "x.png", values=(4.0, 1.0, 2.0))
+    assert blob.read_bytes() == cached
+    assert first.read_bytes() != cached
+
+
+def test_environment_module_change_invalidates(msr_local, monkeypatch, tmp_path):
+    cc = ChartCache(msr_local / "cache")
+    _render(cc, msr_local, "x.png")
+    _render(cc, msr_local, "x.png")
+    assert (cc.hits, cc.misses) == (1, 1)
+
+    # a theme modul forrásának változása (pl. új alap-paletta) → új környezet-kulcs → tévesztés
+    changed = tmp_path / "theme.py"
+    changed.write_bytes(Path(theme.__file__).read_bytes() + b"\n# changed\n")
+    monkeypatch.setattr(theme, "__file__", str(changed))
+    monkeypatch.setattr(chart_cache, "_ENV_KEY", None)
+    _render(cc, msr_local, "x.png")
+    assert (cc.hits, cc.misses) == (1, 2)
+
+
+def test_prune_evicts_least_recently_used(msr_local):
+    cc = ChartCache(msr_local / "cache")
+    for i in range(3):
+        _render(cc, msr_local, f"c{i}.png", values=(1.0, 2.0, float(i + 3)))
+    blobs = sorted((msr_local / "cache").rglob("*.png"))
+    for n, blob in enumerate(blobs):
+        os.utime(blob, ns=(10**9 * (n + 1), 10**9 * (n + 1)))
+    keep = blobs[-1]
+    assert cc.prune(max_bytes=keep.stat().st_size) == 2
+    assert [p for p in (msr_local / "cache").rglob("*.png")] == [keep]
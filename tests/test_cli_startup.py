@@ -0,0 +1,39 @@
+"""
+A CLI indulási ideje: az `import msr.cli` nem húzhatja be a nehéz könyvtárakat (pandas, matplotlib, NumPy, openpyxl) –
+ezek csak a parancsok belsejében töltődnek be. Az orkesztráció ezerszám hívja az `msr`-t, a lassú indulás ott sokszorozódik.
+"""
+from __future__ import annotations
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+HEAVY = ("pandas", "matplotlib", "numpy", "openpyxl")
+
+# bőkezű keret (helyben ~0.1-0.2 s), hogy lassú CI-gépen se legyen instabil, de egy mohó pandas/matplotlib import
+# (~1 s+) kibukjon
+IMPORT_BUDGET_S = 2.0
+
+
+def _run(code: str) -> tuple[subprocess.CompletedProcess, float]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (str(SRC), env.get("PYTHONPATH")) if p)
+    t0 = time.perf_counter()
+    proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env, timeout=60)
+    return proc, time.perf_counter() - t0
+
+
+def test_cli_import_does_not_load_heavy_modules():
+    proc, _ = _run(f"import msr.cli, sys; print(sorted(m for m in {HEAVY!r} if m in sys.modules))")
+    assert proc.returncode == 0, proc.stderr
+    assert proc.stdout.strip() == "[]", f"az `import msr.cli` betöltötte: {proc.stdout.strip()}"
+
+
+def test_cli_import_time_budget():
+    _run("pass")  # a bytecode cache / fájlrendszer bemelegítése, hogy az első mérés ne torzítson
+    proc, elapsed = _run("import msr.cli")
+    assert proc.returncode == 0, proc.stderr
+    assert elapsed < IMPORT_BUDGET_S, f"`import msr.cli` {elapsed:.2f} s (keret: {IMPORT_BUDGET_S} s)"
@@ -0,0 +1,42 @@
+"""
+MetricMatrix: a kompakt (float32) modellből visszaalakított értékeknek pontosan az eredetit kell adniuk – a kevés
+tizedesű Likert-átlagoknál a kerekítés miatt, a sok értékes jegyű (árbevétel-jellegű) oszlopoknál a float64 tartalék miatt.
+"""
+from __future__ import annotations
+import pickle
+
+import numpy as np
+import pandas as pd
+
+from msr.data.matrix import MetricMatrix
+
+
+def _frame() -> pd.DataFrame:
+    return pd.DataFrame({
+        "ResponseID": ["P1", "P2", "P3"],
+        "likert": [3.35, 4.1, 2.0],
+        "arbevetel": [1234.567, 98765.4321, np.nan],
+        "arany": [1 / 3, 2.0, 3.0],
+        "szoveg": ["x", "y", "z"],
+    })
+
+
+def test_round_trip_is_exact():
+    db = _frame()
+    m = MetricMatrix.from_frame(db)
+    assert m.metrics == ("likert", "arbevetel", "arany")
+    back = m.to_frame()
+    for col in m.metrics:
+        np.testing.assert_array_equal(back[col].to_numpy(), db[col].to_numpy())
+
+
+def test_only_lossy_columns_keep_float64():
+    m = MetricMatrix.from_frame(_frame())
+    assert m.exact_metrics == ("arbevetel", "arany")
+    assert m.values.dtype == np.float32
+    assert m.as_float64(["arbevetel"])[1, 0] == 98765.4321
+
+
+def test_survives_pickle():
+    m = pickle.loads(pickle.dumps(MetricMatrix.from_frame(_frame())))
+    assert m.as_float64(["arbevetel", "likert"])[0].tolist() == [1234.567, 3.35]
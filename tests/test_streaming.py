@@ -0,0 +1,49 @@
+"""
+Streaming Excel-beolvasás: ugyanazt a DataFrame-et kell adnia, mint a pd.read_excel(usecols=...), bármekkora darabokban
+dolgozza is fel a sorokat (vegyes típusú oszlop, dátum, Excel hibakód, közbülső és sheet végi üres sorok).
+"""
+from __future__ import annotations
+import datetime as dt
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from msr.data import streaming
+
+WANTED = ["ResponseID", "i", "f", "mix", "d", "b", "err", "late"]
+
+
+@pytest.fixture(scope="module")
+def workbook(tmp_path_factory) -> Path:
+    from openpyxl import Workbook
+
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Adatbázis"
+    ws.append([*WANTED, "skip"])
+    for k in range(23):
+        ws.append([
+            f"P{k}", k, k + 0.5, (k if k < 10 else f"s{k}"), (dt.datetime(2024, 1, 1 + k) if k % 7 else None),
+            bool(k % 2), ("#DIV/0!" if k == 3 else k), (None if k < 15 else 2.5), "x",
+        ])
+    ws.append([None] * 9)
+    ws.append(["P99", 1, None, None, None, None, None, None, None])
+    ws.append([None] * 9)
+    ws.append([None] * 9)
+    path = tmp_path_factory.mktemp("stream") / "wb.xlsx"
+    wb.save(path)
+    return path
+
+
+@pytest.mark.parametrize("chunk_rows", [1, 2, 7, 1000])
+def test_matches_read_excel(workbook, monkeypatch, chunk_rows):
+    monkeypatch.setattr(streaming, "STREAM_CHUNK_ROWS", chunk_rows)
+    ref = pd.read_excel(workbook, sheet_name="Adatbázis", usecols=lambda c: c in WANTED)
+    got = streaming.read_sheet_streaming(workbook, "Adatbázis", WANTED)
+    pd.testing.assert_frame_equal(got, ref)
+
+
+def test_all_columns_without_usecols(workbook):
+    ref = pd.read_excel(workbook, sheet_name="Adatbázis")
+    pd.testing.assert_frame_equal(streaming.read_sheet_streaming(workbook, "Adatbázis"), ref)